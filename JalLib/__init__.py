@@ -6,7 +6,19 @@ JalTools 패키지
 3DS Max 작업을 위한 파이썬 도구 모음
 """
 
+import os
+
 __version__ = '1.0.0'
 
+# 프로파일링 함수를 패키지 레벨에서 사용 가능하게 함
+from .profiler import PROFILE_ENV, PROFILE_FILE_ENV, enable_profiling, disable_profiling, get_profiler
+
+# JALLIB_PROFILE=1이면 하위 모듈을 임포트하기 전에 프로파일링 시작
+if os.environ.get(PROFILE_ENV, "") not in ("", "0"):
+    enable_profiling()
+    if os.environ.get(PROFILE_FILE_ENV):
+        import atexit
+        atexit.register(get_profiler().to_json, os.environ[PROFILE_FILE_ENV])
+
 # reload_modules 함수를 패키지 레벨에서 사용 가능하게 함
-from .reloadModules import reload_jallib_modules
\ No newline at end of file
+from .reloadModules import reload_jallib_modules
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+assetScanner 모듈 - 에셋 폴더 병렬 검색 기능 제공
+스레드 풀로 폴더별 os.scandir를 실행하고, 파일 이름을 묶음 단위로 분석하여 레코드를 스트리밍하는 클래스 구현
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Tuple
+
+from JalLib.naming import Naming
+
+
+class AssetScanner:
+    """
+    루트 폴더 아래 파일을 병렬로 검색하는 클래스.
+
+    폴더 하나를 읽는 작업(os.scandir + stat)을 스레드 풀에 맡기고, 읽은 하위 폴더는 즉시 다음 작업으로 추가합니다.
+    파일 이름(확장자 제외)은 inBatchSize개씩 모아 parse_many와 같은 방식으로 한 번에 분석하며,
+    결과는 (파일 경로, 이름 파트 딕셔너리, os.stat_result) 레코드로 순서 없이 스트리밍합니다.
+    네트워크 드라이브처럼 I/O 지연이 큰 경우에 효과가 큽니다.
+    """
+
+    def __init__(self, inNaming: Naming, inWorkers: int = 8, inBatchSize: int = 1000):
+        """
+        AssetScanner 초기화
+
+        Args:
+            inNaming: 파일 이름 분석에 사용할 Naming 객체
+            inWorkers: 폴더를 읽을 스레드 개수 (기본값: 8)
+            inBatchSize: 한 번에 분석할 파일 이름 개수 (기본값: 1000)
+        """
+        self._naming = inNaming
+        self._workers = max(1, inWorkers)
+        self._batchSize = max(1, inBatchSize)
+
+    @staticmethod
+    def _scan_dir(inDirPath: str) -> Tuple[List[Tuple[str, str, os.stat_result]], List[str]]:
+        """
+        폴더 하나의 파일과 하위 폴더 목록 읽기 (작업 스레드에서 실행)
+
+        Args:
+            inDirPath: 읽을 폴더 경로
+
+        Returns:
+            ([(파일 경로, 파일 이름, stat)], [하위 폴더 경로]) 튜플, 읽을 수 없으면 빈 목록
+        """
+        files = []
+        dirs = []
+        try:
+            with os.scandir(inDirPath) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.path)
+                        elif entry.is_file():
+                            files.append((entry.path, entry.name, entry.stat()))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return files, dirs
+
+    def _parse_batch(self, inFiles: List[Tuple[str, str, os.stat_result]]) -> Iterator[Tuple[str, Dict[str, str], os.stat_result]]:
+        """
+        파일 묶음의 이름을 한 번에 분석하여 레코드 생성
+
+        Args:
+            inFiles: [(파일 경로, 파일 이름, stat)] 리스트
+
+        Yields:
+            (파일 경로, {파트 이름: 값}, stat) 튜플
+        """
+        partNames = self._naming._get_parser().get_part_names()
+        stems = [os.path.splitext(fileName)[0] for _, fileName, _ in inFiles]
+        for (filePath, _, stat), (partValues, _) in zip(inFiles, self._naming._iter_parsed_rows(stems)):
+            yield filePath, dict(zip(partNames, partValues)), stat
+
+    def scan(self, inRootPath: str) -> Iterator[Tuple[str, Dict[str, str], os.stat_result]]:
+        """
+        루트 폴더 아래 모든 파일을 병렬로 검색하여 레코드를 스트리밍
+
+        Args:
+            inRootPath: 검색할 루트 폴더 경로
+
+        Yields:
+            (파일 경로, {파트 이름: 값}, stat) 튜플 (폴더를 읽은 순서, 정렬되지 않음)
+        """
+        batch = []
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            pending = {executor.submit(self._scan_dir, os.path.normpath(inRootPath))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, dirs = future.result()
+                    for dirPath in dirs:
+                        pending.add(executor.submit(self._scan_dir, dirPath))
+                    batch.extend(files)
+
+                # 분석하는 동안에도 작업 스레드는 다음 폴더를 읽음
+                while len(batch) >= self._batchSize:
+                    yield from self._parse_batch(batch[:self._batchSize])
+                    del batch[:self._batchSize]
+
+        if batch:
+            yield from self._parse_batch(batch)
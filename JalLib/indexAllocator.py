@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+indexAllocator 모듈 - 이름 인덱스 할당 기능 제공
+인덱스를 제외한 이름별로 사용 중인 인덱스를 기록하고, 빈 인덱스를 충돌 없이 할당하는 클래스 구현
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+from JalLib.naming import Naming
+
+
+class IndexAllocator:
+    """
+    인덱스를 제외한 이름(Naming.get_string)을 키로 사용하는 인덱스 할당기.
+
+    장면의 이름들로 한 번 초기화한 뒤, 키마다 다음 빈 인덱스를 상수 시간(분할 상환)에 돌려줍니다.
+    할당한 인덱스는 즉시 사용 중으로 예약되므로 한 번의 일괄 작업 안에서도 충돌하지 않습니다.
+    3ds Max에 의존하지 않는 순수 Python 클래스입니다.
+    """
+
+    def __init__(self, inNaming: Naming, inNames: Optional[Iterable[str]] = None):
+        """
+        IndexAllocator 초기화
+
+        Args:
+            inNaming: 이름 분석에 사용할 Naming 객체
+            inNames: 사용 중으로 등록할 이름 목록 (기본값: None)
+        """
+        self._naming = inNaming
+        self._usedIndices: Dict[str, Set[int]] = {}
+        # 키 -> {검색 시작 인덱스: 포인터}, 시작 인덱스 이상 포인터 미만의 인덱스는 모두 사용 중임을 보장
+        self._nextFree: Dict[str, Dict[int, int]] = {}
+
+        if inNames:
+            self.seed(inNames)
+
+    def get_key(self, inName: str) -> str:
+        """
+        이름의 할당 키(인덱스를 제외한 이름) 가져오기
+
+        Args:
+            inName: 이름 문자열
+
+        Returns:
+            인덱스를 제외한 이름 문자열
+        """
+        return self._naming.get_string(inName)
+
+    def seed(self, inNames: Iterable[str]):
+        """
+        이름 목록의 인덱스를 사용 중으로 등록
+
+        Args:
+            inNames: 등록할 이름 목록 (인덱스가 없는 이름은 무시)
+        """
+        for name in inNames:
+            self.reserve(name)
+
+    def clear(self):
+        """
+        등록된 모든 인덱스 정보 초기화
+        """
+        self._usedIndices.clear()
+        self._nextFree.clear()
+
+    def reserve(self, inName: str) -> bool:
+        """
+        이름이 가진 인덱스를 사용 중으로 예약
+
+        Args:
+            inName: 예약할 이름 문자열
+
+        Returns:
+            새로 예약되었으면 True, 인덱스가 없거나 이미 사용 중이면 False
+        """
+        index = self._naming.get_index_as_digit(inName)
+        if index is False:
+            return False
+        usedIndices = self._usedIndices.setdefault(self.get_key(inName), set())
+        if index in usedIndices:
+            return False
+        usedIndices.add(index)
+        return True
+
+    def release(self, inName: str) -> bool:
+        """
+        이름이 가진 인덱스의 예약 해제 (객체 삭제 또는 이름 변경 시)
+
+        Args:
+            inName: 해제할 이름 문자열
+
+        Returns:
+            해제되었으면 True, 예약되어 있지 않았으면 False
+        """
+        index = self._naming.get_index_as_digit(inName)
+        if index is False:
+            return False
+        key = self.get_key(inName)
+        usedIndices = self._usedIndices.get(key)
+        if not usedIndices or index not in usedIndices:
+            return False
+        usedIndices.discard(index)
+        pointers = self._nextFree.get(key)
+        if pointers:
+            for startIndex, nextFree in pointers.items():
+                if startIndex <= index < nextFree:
+                    pointers[startIndex] = index
+        return True
+
+    def is_used(self, inName: str) -> bool:
+        """
+        이름의 인덱스가 사용 중인지 확인
+
+        Args:
+            inName: 확인할 이름 문자열
+
+        Returns:
+            사용 중이면 True
+        """
+        index = self._naming.get_index_as_digit(inName)
+        if index is False:
+            return False
+        return index in self._usedIndices.get(self.get_key(inName), ())
+
+    def allocate_index(self, inKey: str, inStartIndex: int = 0) -> int:
+        """
+        키에 대해 inStartIndex 이상인 가장 작은 빈 인덱스를 할당하고 예약
+
+        Args:
+            inKey: 할당 키 (인덱스를 제외한 이름, get_key 결과)
+            inStartIndex: 검색 시작 인덱스 (기본값: 0)
+
+        Returns:
+            할당된 인덱스
+        """
+        usedIndices = self._usedIndices.setdefault(inKey, set())
+        pointers = self._nextFree.setdefault(inKey, {})
+        index = max(inStartIndex, pointers.get(inStartIndex, inStartIndex))
+        while index in usedIndices:
+            index += 1
+        usedIndices.add(index)
+
+        # 시작 인덱스부터 할당한 인덱스까지는 모두 사용 중이므로 다음 검색은 그 다음부터
+        pointers[inStartIndex] = index + 1
+        return index
+
+    def allocate_name(self, inName: str, inStartIndex: Optional[int] = None) -> str:
+        """
+        이름에 빈 인덱스를 할당하여 고유한 이름 생성
+
+        Args:
+            inName: 기준 이름 문자열
+            inStartIndex: 검색 시작 인덱스 (기본값: None, 이름의 인덱스 또는 0)
+
+        Returns:
+            할당된 인덱스가 적용된 이름 문자열 (Naming 패딩 적용)
+        """
+        if inStartIndex is None:
+            ownIndex = self._naming.get_index_as_digit(inName)
+            inStartIndex = ownIndex if ownIndex is not False else 0
+        index = self.allocate_index(self.get_key(inName), inStartIndex)
+        return self._naming.replace_name_part("Index", inName, str(index))
+
+    def allocate_names(self, inName: str, inCount: int, inStartIndex: int = 0) -> List[str]:
+        """
+        같은 이름으로 여러 개의 고유한 이름을 한 번에 할당
+
+        Args:
+            inName: 기준 이름 문자열
+            inCount: 할당할 개수
+            inStartIndex: 검색 시작 인덱스 (기본값: 0)
+
+        Returns:
+            인덱스 오름차순의 이름 문자열 리스트
+        """
+        # 같은 시작 인덱스로 할당하면 포인터가 이어지므로 인덱스는 오름차순
+        key = self.get_key(inName)
+        names = []
+        for _ in range(inCount):
+            index = self.allocate_index(key, inStartIndex)
+            names.append(self._naming.replace_name_part("Index", inName, str(index)))
+        return names
@@ -4,28 +4,29 @@
 """
 JalTools 3DS 패키지
 3DS Max 작업을 위한 모듈 모음
-"""
-
-# 모듈 임포트
-from .header import Header
-
-from .name import Name
-from .anim import Anim
-
-from .helper import Helper
-from .constraint import Constraint
-from .bone import Bone
-
-from .mirror import Mirror
-from .layer import Layer
-from .align import Align
-from .select import Select
-from .link import Link
 
-from .bip import Bip
-from .skin import Skin
+하위 모듈은 클래스에 처음 접근할 때 임포트됩니다 (예: from JalLib.max import Bone).
+"""
 
-from .twistBone import TwistBone
+import importlib
+
+# 클래스 이름 -> 하위 모듈 이름
+_MODULES = {
+    'Header': 'header',
+    'Name': 'name',
+    'Anim': 'anim',
+    'Helper': 'helper',
+    'Constraint': 'constraint',
+    'Bone': 'bone',
+    'Mirror': 'mirror',
+    'Layer': 'layer',
+    'Align': 'align',
+    'Select': 'select',
+    'Link': 'link',
+    'Bip': 'bip',
+    'Skin': 'skin',
+    'TwistBone': 'twistBone',
+}
 
 # 모듈 내보내기
 __all__ = [
@@ -44,3 +45,19 @@ __all__ = [
     'Skin',
     'TwistBone'
 ]
+
+
+def __getattr__(name):
+    """
+    내보내는 클래스에 처음 접근할 때 하위 모듈을 임포트 (PEP 562)
+    """
+    moduleName = _MODULES.get(name)
+    if moduleName is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f".{moduleName}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -300,7 +300,7 @@ class Bone:
         
         return newBone
     
-    def create_bone(self, inPointArray, inName, end=True, delPoint=False, parent=False, size=2, normals=None):
+    def create_bone(self, inPointArray, inName, end=True, delPoint=False, parent=False, size=2, normals=None, indexAllocator=None):
         """
         포인트 배열을 따라 뼈대 체인 생성.
         
@@ -312,6 +312,7 @@ class Bone:
             parent: 부모 Nub 포인트 생성 여부 (기본값: False)
             size: 뼈대 크기 (기본값: 2)
             normals: 법선 벡터 배열 (기본값: None)
+            indexAllocator: 인덱스 할당기 (기본값: None, 현재 장면으로 한 번 생성하여 체인 전체의 인덱스 예약)
             
         Returns:
             생성된 뼈대 배열 또는 False (실패 시)
@@ -325,9 +326,12 @@ class Bone:
         returnBoneArray = []
         
         if len(inPointArray) != 1:
+            # 체인의 이름은 장면과 겹치지 않는 인덱스로 한 번에 예약 (0부터 오름차순)
+            if indexAllocator is None:
+                indexAllocator = self.name.create_index_allocator()
+            boneNames = indexAllocator.allocate_names(inName, len(inPointArray) - 1, 0)
+            
             for i in range(len(inPointArray) - 1):
-                boneNum = i
-                
                 if len(normals) == len(inPointArray):
                     xDir = rt.normalize(inPointArray[i+1].transform.position - inPointArray[i].transform.position)
                     zDir = rt.normalize(rt.cross(xDir, normals[i]))
@@ -336,7 +340,7 @@ class Bone:
                     newBone = rt.BoneSys.createBone(inPointArray[i].transform.position, inPointArray[i+1].transform.position, rt.Point3(0, -1, 0))
                 
                 newBone.boneFreezeLength = True
-                newBone.name = self.name.replace_name_part("Index", inName, str(boneNum))
+                newBone.name = boneNames[i]
                 newBone.height = size
                 newBone.width = size
                 newBone.frontfin = False
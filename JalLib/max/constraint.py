@@ -573,7 +573,7 @@ class Constraint:
             rt.setPropertyController(rot_list, "Available", targetRotConstraint)
             rot_list.setActive(rot_list.count)
     
-    def assign_rot_const_scripted(self, inObj, inTarget):
+    def assign_rot_const_scripted(self, inObj, inTarget, indexAllocator=None):
         """
         스크립트 기반 회전 제약을 구현하여 할당.
         ExposeTransform을 활용한 고급 회전 제약 구현.
@@ -581,6 +581,7 @@ class Constraint:
         Args:
             inObj: 제약을 적용할 객체
             inTarget: 회전 참조 타겟 객체
+            indexAllocator: 인덱스 할당기 (기본값: None, 제공되면 헬퍼 이름에 겹치지 않는 인덱스 사용)
             
         Returns:
             생성된 회전 스크립트 컨트롤러
@@ -600,9 +601,13 @@ class Constraint:
         # 헬퍼 객체 이름 생성
         if self.name:
             rotPointName = self.name.replace_Type(inObj.name, self.name.get_dummy_value())
-            rotMeasurePointName = self.name.increase_index(rotPointName, 1)
             rotExpName = self.name.replace_Type(inObj.name, self.name.get_exposeTm_value())
-            rotExpName = self.name.replace_Index(rotExpName, "0")
+            if indexAllocator:
+                rotPointName, rotMeasurePointName = indexAllocator.allocate_names(rotPointName, 2)
+                rotExpName = indexAllocator.allocate_name(rotExpName, 0)
+            else:
+                rotMeasurePointName = self.name.increase_index(rotPointName, 1)
+                rotExpName = self.name.replace_Index(rotExpName, "0")
             
             print(f"dumStr: {self.name.get_dummy_value()}")
             print(f"exposeTmStr: {self.name.get_exposeTm_value()}")
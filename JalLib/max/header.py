@@ -7,51 +7,77 @@
 """
 
 import os
+import importlib
 
-from .name import Name
-from .anim import Anim
-
-from .helper import Helper
-from .constraint import Constraint
-from .bone import Bone
-
-from .mirror import Mirror
-from .layer import Layer
-from .align import Align
-from .select import Select
-from .link import Link
-
-from .bip import Bip
-from .skin import Skin
-
-from .twistBone import TwistBone
 
 class Header:
     """
     JalLib.max 패키지의 헤더 모듈
     3DS Max에서 사용하는 다양한 기능을 제공하는 클래스들을 초기화하고 관리합니다.
+
+    각 서비스는 처음 접근할 때 모듈을 임포트하고 생성하며, 필요한 다른 서비스도 같은 방식으로 함께 생성됩니다.
+    매크로가 사용하는 서비스만 로드되므로 3DS Max 시작 시 전체 임포트와 이름 설정 로드 비용을 줄입니다.
     """
+
+    # 서비스 속성 이름 -> (모듈 이름, 클래스 이름, {생성자 인자 이름: 의존 서비스 속성 이름})
+    _SERVICES = {
+        "anim": ("anim", "Anim", {}),
+        "helper": ("helper", "Helper", {"nameService": "name"}),
+        "constraint": ("constraint", "Constraint", {"nameService": "name", "helperService": "helper"}),
+        "bone": ("bone", "Bone", {"nameService": "name", "animService": "anim", "helperService": "helper", "constraintService": "constraint"}),
+        "mirror": ("mirror", "Mirror", {"nameService": "name", "boneService": "bone"}),
+        "layer": ("layer", "Layer", {}),
+        "align": ("align", "Align", {}),
+        "sel": ("select", "Select", {"nameService": "name", "boneService": "bone"}),
+        "link": ("link", "Link", {}),
+        "bip": ("bip", "Bip", {"animService": "anim", "nameService": "name", "boneService": "bone"}),
+        "skin": ("skin", "Skin", {}),
+        "twistBone": ("twistBone", "TwistBone", {"nameService": "name", "animService": "anim", "constService": "constraint", "bipService": "bip"}),
+    }
+
     def __init__(self):
         """
-        Header 클래스 초기화
+        Header 클래스 초기화 (서비스는 처음 접근할 때 생성)
         """
         self.configDir = os.path.join(os.path.dirname(__file__), "ConfigFiles")
         self.nameConfigDir = os.path.join(self.configDir, "3DSMaxNamingConfig.json")
 
-        self.name = Name(configPath=self.nameConfigDir)
-        self.anim = Anim()
+    def __getattr__(self, inAttrName):
+        """
+        아직 생성되지 않은 서비스에 처음 접근할 때 모듈을 임포트하고 생성
 
-        self.helper = Helper(nameService=self.name)
-        self.constraint = Constraint(nameService=self.name, helperService=self.helper)
-        self.bone = Bone(nameService=self.name, animService=self.anim, helperService=self.helper, constraintService=self.constraint)
+        생성된 서비스는 인스턴스 속성으로 저장되므로 이후 접근에서는 호출되지 않습니다.
 
-        self.mirror = Mirror(nameService=self.name, boneService=self.bone)
-        self.layer = Layer()
-        self.align = Align()
-        self.sel = Select(nameService=self.name, boneService=self.bone)
-        self.link = Link()
+        Args:
+            inAttrName: 접근한 속성 이름
 
-        self.bip = Bip(animService=self.anim, nameService=self.name, boneService=self.bone)
-        self.skin = Skin()
+        Returns:
+            생성된 서비스 객체
 
-        self.twistBone = TwistBone(nameService=self.name, animService=self.anim, constService=self.constraint, bipService=self.bip)
+        Raises:
+            AttributeError: 서비스 이름이 아닌 경우
+        """
+        if inAttrName == "name":
+            from .name import Name
+            service = Name(configPath=self.nameConfigDir)
+        elif inAttrName in Header._SERVICES:
+            moduleName, className, dependencies = Header._SERVICES[inAttrName]
+            serviceClass = getattr(importlib.import_module(f".{moduleName}", __package__), className)
+            service = serviceClass(**{argName: getattr(self, attrName) for argName, attrName in dependencies.items()})
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{inAttrName}'")
+
+        setattr(self, inAttrName, service)
+        return service
+
+    def is_loaded(self, inServiceName):
+        """
+        서비스가 이미 생성되었는지 확인 (생성하지 않음)
+
+        Args:
+            inServiceName: 서비스 속성 이름 (예: "name", "bone")
+
+        Returns:
+            생성되었으면 True, 아니면 False
+        """
+        return inServiceName in self.__dict__
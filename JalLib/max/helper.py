@@ -119,7 +119,7 @@ class Helper:
         # 일치하는 값이 없으면 기본값 반환
         return firstTypeValue
     
-    def gen_helper_name_from_obj(self, inObj, make_two=False, is_exp=False):
+    def gen_helper_name_from_obj(self, inObj, make_two=False, is_exp=False, indexAllocator=None):
         """
         객체로부터 헬퍼 이름 생성
         
@@ -127,6 +127,7 @@ class Helper:
             inObj: 원본 객체
             make_two: 두 개의 이름 생성 여부
             is_exp: ExposeTM 타입 여부
+            indexAllocator: 인덱스 할당기 (기본값: None, 제공되면 장면과 겹치지 않는 인덱스 사용)
             
         Returns:
             생성된 헬퍼 이름 배열 [포인트 이름, 타겟 이름]
@@ -141,7 +142,13 @@ class Helper:
         
         # 이름 생성
         tempName = self.name.replace_name_part("Type", inObj.name, typeName)
-        if self.name.get_name("Type", inObj.name) == typeName:
+        if indexAllocator:
+            startIndex = self.name.get_index_as_digit(tempName)
+            startIndex = 0 if startIndex is False else startIndex
+            if self.name.get_name("Type", inObj.name) == typeName:
+                startIndex += 1
+            tempName = indexAllocator.allocate_name(tempName, startIndex)
+        elif self.name.get_name("Type", inObj.name) == typeName:
             tempName = self.name.increase_index(tempName, 1)
         
         pointName = tempName
@@ -183,12 +190,13 @@ class Helper:
         
         return [helperSize, crossToggle, boxToggle]
     
-    def create_helper(self, make_two=False):
+    def create_helper(self, make_two=False, indexAllocator=None):
         """
         헬퍼 생성
         
         Args:
             make_two: 두 개의 헬퍼 생성 여부
+            indexAllocator: 인덱스 할당기 (기본값: None, 현재 장면으로 한 번 생성하여 선택된 모든 객체에 사용)
             
         Returns:
             생성된 헬퍼 배열
@@ -198,6 +206,8 @@ class Helper:
         # 선택된 객체가 있는 경우
         if rt.selection.count > 0:
             selArray = rt.getCurrentSelection()
+            if indexAllocator is None:
+                indexAllocator = self.name.create_index_allocator()
             
             for item in selArray:
                 # 헬퍼 크기 및 형태 설정
@@ -207,7 +217,7 @@ class Helper:
                 boxToggle = helperShapeArray[2]
                 
                 # 헬퍼 이름 설정
-                helperNameArray = self.gen_helper_name_from_obj(item, make_two=make_two)
+                helperNameArray = self.gen_helper_name_from_obj(item, make_two=make_two, indexAllocator=indexAllocator)
                 pointName = helperNameArray[0]
                 targetName = helperNameArray[1]
                 
@@ -259,13 +269,18 @@ class Helper:
         rt.select(createdHelperArray)
         return createdHelperArray
     
-    def create_parent_helper(self):
+    def create_parent_helper(self, indexAllocator=None):
         """
         부모 헬퍼 생성
+        
+        Args:
+            indexAllocator: 인덱스 할당기 (기본값: None, 현재 장면으로 한 번 생성하여 선택된 모든 객체에 사용)
         """
         # 선택된 객체가 있는 경우에만 처리
         if rt.selection.count > 0:
             selArray = rt.getCurrentSelection()
+            if indexAllocator is None:
+                indexAllocator = self.name.create_index_allocator()
             
             for item in selArray:
                 # 헬퍼 크기 및 형태 설정
@@ -275,7 +290,7 @@ class Helper:
                 boxToggle = helperShapeArray[2]
                 
                 # 헬퍼 이름 설정
-                helperNameArray = self.gen_helper_name_from_obj(item)
+                helperNameArray = self.gen_helper_name_from_obj(item, indexAllocator=indexAllocator)
                 pointName = helperNameArray[0]
                 targetName = helperNameArray[1]
                 
@@ -298,10 +313,13 @@ class Helper:
                 finalName = self.name.replace_name_part("Type", genPoint.name, self.get_name_by_type("Parent"))
                 rt.setProperty(genPoint, "name", finalName)
     
-    def create_exp_tm(self):
+    def create_exp_tm(self, indexAllocator=None):
         """
         ExposeTM 헬퍼 생성
         
+        Args:
+            indexAllocator: 인덱스 할당기 (기본값: None, 현재 장면으로 한 번 생성하여 선택된 모든 객체에 사용)
+        
         Returns:
             생성된 ExposeTM 헬퍼 배열
         """
@@ -310,6 +328,8 @@ class Helper:
         # 선택된 객체가 있는 경우
         if rt.selection.count > 0:
             selArray = rt.getCurrentSelection()
+            if indexAllocator is None:
+                indexAllocator = self.name.create_index_allocator()
             
             for item in selArray:
                 # 헬퍼 크기 및 형태 설정
@@ -319,7 +339,7 @@ class Helper:
                 boxToggle = helperShapeArray[2]
                 
                 # 헬퍼 이름 설정 (ExposeTM 용)
-                helperNameArray = self.gen_helper_name_from_obj(item, make_two=False, is_exp=True)
+                helperNameArray = self.gen_helper_name_from_obj(item, make_two=False, is_exp=True, indexAllocator=indexAllocator)
                 pointName = helperNameArray[0]
                 
                 # ExposeTM 객체 생성
@@ -76,7 +76,7 @@ class Mirror:
         # 미러링된 변환 행렬 계산: fReflection * tm * aReflection * pivotTm
         return f_reflection * tm * a_reflection * pivotTM
     
-    def apply_mirror(self, inObj, axis=1, flip=2, pivotObj=None, cloneStatus=2, negative=False):
+    def apply_mirror(self, inObj, axis=1, flip=2, pivotObj=None, cloneStatus=2, negative=False, mirroredName=None, indexAllocator=None):
         """
         객체에 미러링 적용
         
@@ -87,6 +87,8 @@ class Mirror:
             pivotObj: 피벗 객체 (기본값: None)
             cloneStatus: 복제 상태 (1=원본 변경, 2=복제본 생성, 3=스냅샷, 기본값: 2)
             negative: 음수 좌표계 사용 여부 (기본값: False)
+            mirroredName: 미리 생성한 미러링 이름 (기본값: None, 없으면 새로 생성)
+            indexAllocator: 미러링 이름 생성에 사용할 인덱스 할당기 (기본값: None, 필요하면 현재 장면으로 생성)
             
         Returns:
             미러링된 객체 (복제본 또는 원본)
@@ -97,7 +99,7 @@ class Mirror:
         pivotTM = rt.matrix3(1)
         mirrorIndexAxis = axis
         flipAxisIndex = flip
-        copyObjName = self.name.gen_mirroring_name(inObj.name)
+        copyObjName = mirroredName if mirroredName is not None else self.name.gen_mirroring_name(inObj.name, indexAllocator)
         
         # 피벗 객체가 지정된 경우 피벗 변환 행렬 사용
         if pivotObj is not None:
@@ -143,7 +145,7 @@ class Mirror:
         
         return copyObj
     
-    def mirror_object(self, inObjArray, mAxis=1, pivotObj=None, cloneStatus=2):
+    def mirror_object(self, inObjArray, mAxis=1, pivotObj=None, cloneStatus=2, indexAllocator=None):
         """
         객체 배열을 음수 좌표계를 사용하여 미러링
         
@@ -152,25 +154,30 @@ class Mirror:
             mAxis: 미러링 축 (기본값: 1)
             pivotObj: 피벗 객체 (기본값: None)
             cloneStatus: 복제 상태 (기본값: 2)
+            indexAllocator: 인덱스 할당기 (기본값: None, 현재 장면으로 한 번 생성하여 모든 객체에 사용)
             
         Returns:
             미러링된 객체 배열
         """
+        if indexAllocator is None:
+            indexAllocator = self.name.create_index_allocator()
         returnArray = []
+        mirroredNames = self.name.gen_mirroring_names([item.name for item in inObjArray], indexAllocator)
         
-        for item in inObjArray:
+        for item, mirroredName in zip(inObjArray, mirroredNames):
             mirroredObj = self.apply_mirror(
                 item, 
                 axis=mAxis, 
                 pivotObj=pivotObj, 
                 cloneStatus=cloneStatus, 
-                negative=True
+                negative=True,
+                mirroredName=mirroredName
             )
             returnArray.append(mirroredObj)
         
         return returnArray
     
-    def mirror_without_negative(self, inMirrorObjArray, mAxis=1, pivotObj=None, cloneStatus=2):
+    def mirror_without_negative(self, inMirrorObjArray, mAxis=1, pivotObj=None, cloneStatus=2, indexAllocator=None):
         """
         객체 배열을 양수 좌표계를 사용하여 미러링
         
@@ -179,6 +186,7 @@ class Mirror:
             mAxis: 미러링 축 인덱스 (1-6, 기본값: 1)
             pivotObj: 피벗 객체 (기본값: None)
             cloneStatus: 복제 상태 (기본값: 2)
+            indexAllocator: 인덱스 할당기 (기본값: None, 현재 장면으로 한 번 생성하여 모든 객체에 사용)
             
         Returns:
             미러링된 객체 배열
@@ -212,21 +220,25 @@ class Mirror:
             flipIndex = 1  # x
         
         # 미러링 적용
+        if indexAllocator is None:
+            indexAllocator = self.name.create_index_allocator()
         returnArray = []
-        for item in inMirrorObjArray:
+        mirroredNames = self.name.gen_mirroring_names([item.name for item in inMirrorObjArray], indexAllocator)
+        for item, mirroredName in zip(inMirrorObjArray, mirroredNames):
             mirroredObj = self.apply_mirror(
                 item, 
                 axis=axisIndex, 
                 flip=flipIndex, 
                 pivotObj=pivotObj, 
                 cloneStatus=cloneStatus, 
-                negative=False
+                negative=False,
+                mirroredName=mirroredName
             )
             returnArray.append(mirroredObj)
         
         return returnArray
     
-    def mirror_bone(self, inBoneArray, mAxis=1, flipZ=False, offset=0.0):
+    def mirror_bone(self, inBoneArray, mAxis=1, flipZ=False, offset=0.0, indexAllocator=None):
         """
         뼈대 객체를 미러링
         
@@ -235,6 +247,7 @@ class Mirror:
             mAxis: 미러링 축 (1=x, 2=y, 3=z, 기본값: 1)
             flipZ: Z축 뒤집기 여부 (기본값: False)
             offset: 미러링 오프셋 (기본값: 0.0)
+            indexAllocator: 인덱스 할당기 (기본값: None, 현재 장면으로 한 번 생성하여 모든 뼈대에 사용)
             
         Returns:
             미러링된 뼈대 배열
@@ -258,6 +271,11 @@ class Mirror:
         # 시작점 위치 (미러링 중심) 설정
         root = bones[0].transform.translation
         
+        # 미러링 이름은 한 번에 생성 (이름마다 한 번만 파싱, 할당기는 작업마다 하나)
+        if indexAllocator is None:
+            indexAllocator = self.name.create_index_allocator()
+        mirroredNames = self.name.gen_mirroring_names([bone.name for bone in bones], indexAllocator)
+        
         # 정렬된 뼈대 순서대로 처리
         for i in range(len(bones)):
             original = bones[i]
@@ -297,7 +315,7 @@ class Mirror:
             
             # 이름 생성 (좌우/앞뒤 방향이 있는 경우 미러링된 이름 생성)
             if self.name.has_Side(original.name) or self.name.has_FrontBack(original.name):
-                reflection.name = self.name.gen_mirroring_name(original.name, axis=mAxis)
+                reflection.name = mirroredNames[i]
             else:
                 reflection.name = self.name.add_suffix_to_real_name(original.name, "Mirrored")
                 
@@ -332,7 +350,7 @@ class Mirror:
         
         return created
     
-    def mirror_geo(self, inMirrorObjArray, mAxis=1, pivotObj=None, cloneStatus=2):
+    def mirror_geo(self, inMirrorObjArray, mAxis=1, pivotObj=None, cloneStatus=2, indexAllocator=None):
         """
         지오메트리 객체 미러링 (폴리곤 노멀 방향 조정 포함)
         
@@ -350,7 +368,8 @@ class Mirror:
             inMirrorObjArray,
             mAxis=mAxis,
             pivotObj=pivotObj,
-            cloneStatus=cloneStatus
+            cloneStatus=cloneStatus,
+            indexAllocator=indexAllocator
         )
         
         # 리셋 대상, 비리셋 대상 분류
@@ -9,6 +9,9 @@
 from pymxs import runtime as rt
 from JalLib.naming import Naming
 from JalLib.namePart import NamePart, NamePartType
+from JalLib.nameParser import NameParseCache
+from JalLib.indexAllocator import IndexAllocator
+from JalLib.nameIndex import NameIndex
 
 class Name(Naming):
     """
@@ -31,6 +34,18 @@ class Name(Naming):
         # 기본 namePart 초기화 (각 부분에 사전 정의 값 직접 설정)
         self._nameParts = []
         
+        # 컴파일된 이름 분석기 (nameParts가 바뀌면 다시 생성)
+        self._parser = None
+        
+        # 공유 중인 불변 설정 스냅샷 (수정 시 복사 후 None)
+        self._compiledConfig = None
+        
+        # get_mutable_name_part로 내준 NamePart -> 이름 분석기 생성 시점의 내용 해시
+        self._mutableParts = {}
+        
+        # 파싱 결과 LRU 캐시 (설정 지문 + 이름으로 키 생성)
+        self._parseCache = NameParseCache()
+        
         if configPath:
             # 사용자가 지정한 설정 파일 사용
             self.load_from_config_file(configPath=configPath)
@@ -401,27 +416,73 @@ class Name(Naming):
     
     # pymxs 의존적인 메소드 구현
     
-    def gen_unique_name(self, inStr):
+    def create_index_allocator(self):
+        """
+        현재 장면 객체 이름으로 초기화된 인덱스 할당기 생성
+        
+        rt.objects를 한 번 순회하여 초기화합니다. 할당한 인덱스는 할당기 안에서만 예약되므로
+        한 번의 일괄 작업 동안만 사용하고, 작업마다 새로 생성하여 indexAllocator 인자로 전달합니다.
+        
+        Returns:
+            IndexAllocator 객체
+        """
+        return IndexAllocator(self, [obj.name for obj in rt.objects])
+    
+    def create_name_index(self):
+        """
+        현재 장면 객체 이름으로 채운 이름 역색인 생성
+        
+        rt.objects를 한 번 순회하여 생성합니다. 장면이 바뀌면 색인과 달라지므로 한 번의 검색 작업 동안만 사용하고,
+        작업 중에 객체를 만들거나 이름을 바꾸면 NameIndex의 add/remove/rename으로 함께 갱신합니다.
+        
+        Returns:
+            NameIndex 객체
+        """
+        return NameIndex(self, [obj.name for obj in rt.objects])
+    
+    def find_objects(self, inConditions=None, inMinIndex=None, inMaxIndex=None, inNameIndex=None):
+        """
+        이름 파트 값 조건과 인덱스 범위로 장면 객체 검색
+        
+        예: find_objects({"Side": "L", "Type": "Dum"}, inMinIndex=4)
+        
+        Args:
+            inConditions: {파트 이름: 값 또는 값 목록} 딕셔너리 (기본값: None)
+            inMinIndex: 최소 인덱스 (포함, 기본값: None)
+            inMaxIndex: 최대 인덱스 (포함, 기본값: None)
+            inNameIndex: 검색할 이름 역색인 (기본값: None, 호출할 때마다 현재 장면으로 새로 생성)
+                         여러 번 검색할 때는 create_name_index로 만든 색인을 전달하면 장면을 한 번만 순회
+            
+        Returns:
+            조건을 만족하는 객체 리스트
+        """
+        if inNameIndex is None:
+            inNameIndex = self.create_name_index()
+        returnArray = []
+        for name in inNameIndex.query(inConditions, inMinIndex, inMaxIndex):
+            returnArray.extend(rt.getNodeByName(name, all=True))
+        return returnArray
+    
+    def gen_unique_name(self, inStr, indexAllocator=None):
         """
         고유한 이름 생성
         
+        인덱스를 제외한 이름이 같은 객체들이 사용하지 않는 가장 작은 인덱스(1부터)를 할당합니다.
+        
+        할당기 없이 호출하면 호출할 때마다 장면의 모든 객체 이름을 분석하여 할당기를 만드는 느린 경로입니다.
+        여러 이름을 만드는 작업에서는 create_index_allocator로 작업마다 하나를 만들어 전달합니다.
+        
         Args:
             inStr: 기준 이름 문자열
+            indexAllocator: 인덱스 할당기 (기본값: None, 호출할 때마다 현재 장면으로 새로 생성)
+                            같은 할당기로 만든 이름끼리도 서로 겹치지 않음
             
         Returns:
             고유한 이름 문자열
         """
-        pattern_str = self.replace_Index(inStr, "*")
-        
-        # pymxs를 사용하여 객체 이름을 패턴과 매칭하여 검색
-        matched_objects = []
-        
-        # 모든 객체 중에서 패턴과 일치하는 이름 찾기
-        for obj in rt.objects:
-            if rt.matchPattern(obj.name, pattern=pattern_str):
-                matched_objects.append(obj)
-                
-        return self.replace_Index(inStr, str(len(matched_objects) + 1))
+        if indexAllocator is None:
+            indexAllocator = self.create_index_allocator()
+        return indexAllocator.allocate_name(inStr, 1)
     
     def compare_name(self, inObjA, inObjB):
         """
@@ -450,7 +511,7 @@ class Name(Naming):
         # Python의 sorted 함수와 key를 사용하여 이름 기준 정렬
         return sorted(inArray, key=lambda obj: obj.name.lower())
         
-    def gen_mirroring_name(self, inStr):
+    def gen_mirroring_name(self, inStr, indexAllocator=None):
         """
         미러링된 이름 생성 (측면 또는 앞/뒤 변경)
         
@@ -459,6 +520,7 @@ class Name(Naming):
         
         Args:
             inStr: 처리할 이름 문자열
+            indexAllocator: 고유한 이름 생성에 사용할 인덱스 할당기 (기본값: None, 현재 장면으로 새로 생성)
             
         Returns:
             미러링된 이름 문자열
@@ -468,12 +530,41 @@ class Name(Naming):
         # 이름이 변경되지 않았다면 고유한 이름 생성
         if return_name == inStr:
             if self.has_Side(inStr) or self.has_FrontBack(inStr):
-                return_name = self.gen_unique_name(inStr)
+                return_name = self.gen_unique_name(inStr, indexAllocator)
             else:
                 return_name = self.add_suffix_to_real_name(inStr, "Mirrored")
             
         return return_name
     
+    def gen_mirroring_names(self, inNames, indexAllocator=None):
+        """
+        여러 이름의 미러링된 이름을 한 번에 생성
+        
+        이름마다 한 번만 파싱하며, 이름이 바뀌지 않은 경우의 처리는 gen_mirroring_name과 같습니다.
+        고유한 이름은 하나의 인덱스 할당기로 생성하므로 결과끼리도 겹치지 않습니다.
+        
+        Args:
+            inNames: 처리할 이름 문자열 리스트
+            indexAllocator: 인덱스 할당기 (기본값: None, 필요할 때 현재 장면으로 한 번 생성)
+            
+        Returns:
+            미러링된 이름 문자열 리스트 (입력 순서 유지)
+        """
+        inNames = list(inNames)
+        returnNames = super().gen_mirroring_names(inNames)
+        
+        for i, (inStr, returnName) in enumerate(zip(inNames, returnNames)):
+            # 이름이 변경되지 않았다면 고유한 이름 생성
+            if returnName == inStr:
+                if self.has_Side(inStr) or self.has_FrontBack(inStr):
+                    if indexAllocator is None:
+                        indexAllocator = self.create_index_allocator()
+                    returnNames[i] = self.gen_unique_name(inStr, indexAllocator)
+                else:
+                    returnNames[i] = self.add_suffix_to_real_name(inStr, "Mirrored")
+        
+        return returnNames
+    
     # Type name Part에서 Description으로 지정된 predefined value를 가져오는 메소드들
     def get_parent_value(self):
         """
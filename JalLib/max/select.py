@@ -197,6 +197,7 @@ class Select:
     def sort_by_index(self, inArray):
         """
         객체를 이름에 포함된 인덱스 번호에 따라 정렬
+        인덱스를 제외한 이름으로 묶은 뒤 인덱스 순서로 정렬하며, 이름이 같은 객체는 원래 순서를 유지
         
         Args:
             inArray: 정렬할 객체 배열
@@ -207,16 +208,7 @@ class Select:
         if len(inArray) == 0:
             return []
         
-        nameArray = [item.name for item in inArray]
-        sortedNameArray = self.name.sort_by_index(nameArray)
-        
-        sortedArray = [item for item in inArray]
-        
-        for i, sortedName in enumerate(sortedNameArray):
-            foundIndex = nameArray.index(sortedName)
-            sortedArray[i] = inArray[foundIndex]
-        
-        return sortedArray
+        return self.name.sort_by_index_key(inArray, lambda item: item.name)
     
     def sort_objects(self, inArray):
         """
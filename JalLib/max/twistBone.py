@@ -121,7 +121,7 @@ class TwistBone:
             ")catch((quat 0 0 0 1))"
         )
     
-    def create_bones(self, inObj, inChild, inTwistNum, inExpression, inExtraExpression, inControllerLimb, inWeightVar):
+    def create_bones(self, inObj, inChild, inTwistNum, inExpression, inExtraExpression, inControllerLimb, inWeightVar, indexAllocator=None):
         """
         트위스트 뼈대 체인 생성
         
@@ -133,6 +133,7 @@ class TwistBone:
             inExtraExpression: 추가 회전 표현식
             inControllerLimb: 컨트롤러 대상 팔다리
             inWeightVar: 가중치
+            indexAllocator: 인덱스 할당기 (기본값: None, 제공되면 장면과 겹치지 않는 인덱스를 미리 예약)
             
         Returns:
             생성된 트위스트 뼈대 체인 배열
@@ -153,7 +154,11 @@ class TwistBone:
             rt.Point3(0, 0, 1)
         )
         boneName = self.name.get_string(inObj.name) + "Twist"
-        TwistBone.name = self.name.replace_Index(boneName, "0")
+        if indexAllocator:
+            boneNames = indexAllocator.allocate_names(boneName, max(inTwistNum, 1))
+        else:
+            boneNames = [self.name.replace_Index(boneName, str(i)) for i in range(max(inTwistNum, 1))]
+        TwistBone.name = boneNames[0]
         TwistBone.transform = Limb.transform
         TwistBone.parent = Limb
         TwistBone.length = distanceVar / inTwistNum
@@ -199,7 +204,7 @@ class TwistBone:
                 matAux = rt.matrix3(1)
                 matAux.position = rt.Point3(distanceVar/inTwistNum, 0, 0)
                 TwistBoneExtra.transform = matAux * PrevTBE.transform
-                TwistBoneExtra.name = self.name.replace_Index(boneName, str(j-1))
+                TwistBoneExtra.name = boneNames[j-1]
                 TwistBoneExtra.parent = PrevTBE
                 TwistBoneExtra.length = distanceVar / inTwistNum
                 TwistBoneExtra.width = PrevTBE.width
@@ -228,7 +233,7 @@ class TwistBone:
             matAux = rt.matrix3(1)
             matAux.position = rt.Point3(distanceVar/inTwistNum, 0, 0)
             TwistBoneEnd.transform = matAux * PrevTBE.transform
-            TwistBoneEnd.name = self.name.replace_Index(boneName, str(inTwistNum-1))
+            TwistBoneEnd.name = boneNames[inTwistNum-1]
             TwistBoneEnd.parent = inObj
             TwistBoneEnd.length = distanceVar / inTwistNum
             TwistBoneEnd.width = PrevTBE.width
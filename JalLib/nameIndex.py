@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+nameIndex 모듈 - 이름 역색인 기능 제공
+이름 목록을 한 번만 분석하여 (파트, 값) -> 이름 목록 역색인과 정렬된 인덱스 목록을 유지하는 클래스 구현
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from JalLib.naming import Naming
+
+
+class NameIndex:
+    """
+    이름 파트 값으로 이름을 검색하기 위한 역색인.
+
+    이름마다 한 번만 분석하여 (파트 이름, 값) -> 이름 집합과 (인덱스 숫자, 이름) 정렬 목록을 보관합니다.
+    여러 파트 조건의 교집합은 가장 작은 목록부터, 인덱스 범위는 이진 검색으로 찾으므로
+    전체 이름을 다시 분석하지 않습니다. 3ds Max에 의존하지 않는 순수 Python 클래스입니다.
+    """
+
+    def __init__(self, inNaming: Naming, inNames: Optional[Iterable[str]] = None):
+        """
+        NameIndex 초기화
+
+        Args:
+            inNaming: 이름 분석에 사용할 Naming 객체
+            inNames: 색인할 이름 목록 (기본값: None)
+        """
+        self._naming = inNaming
+        self._partNames = inNaming._get_parser().get_part_names()
+        self._indexOrder = inNaming.get_name_part_index("Index")
+
+        # 이름 -> 이름 부분 튜플, 이름 -> 등록 횟수 (장면에 같은 이름이 여러 개 있을 수 있음)
+        self._rows: Dict[str, Tuple[str, ...]] = {}
+        self._nameCounts: Dict[str, int] = {}
+        # (파트 이름, 값) -> 이름 집합
+        self._postings: Dict[Tuple[str, str], Set[str]] = {}
+        # (인덱스 숫자, 이름) 정렬 목록
+        self._sortedIndices: List[Tuple[int, str]] = []
+
+        if inNames:
+            self.add_many(inNames)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, inName: str) -> bool:
+        return inName in self._rows
+
+    def _get_index_number(self, inRow: Tuple[str, ...]) -> Optional[int]:
+        """
+        이름 부분 튜플에서 인덱스 숫자 가져오기
+
+        Args:
+            inRow: 이름 부분 튜플
+
+        Returns:
+            인덱스 숫자, 없으면 None
+        """
+        if self._indexOrder < 0 or not inRow[self._indexOrder]:
+            return None
+        try:
+            return int(inRow[self._indexOrder])
+        except ValueError:
+            return None
+
+    def _insert(self, inName: str, inRow: Tuple[str, ...]):
+        """
+        분석된 이름을 역색인에 추가 (새 이름인 경우에만 호출)
+        """
+        self._rows[inName] = inRow
+        for partName, value in zip(self._partNames, inRow):
+            if value:
+                self._postings.setdefault((partName, value), set()).add(inName)
+        index = self._get_index_number(inRow)
+        if index is not None:
+            insort(self._sortedIndices, (index, inName))
+
+    def add(self, inName: str):
+        """
+        이름 하나를 색인에 추가
+
+        Args:
+            inName: 추가할 이름 문자열
+        """
+        self.add_many([inName])
+
+    def add_many(self, inNames: Iterable[str]):
+        """
+        여러 이름을 색인에 추가 (이름마다 한 번만 분석)
+
+        Args:
+            inNames: 추가할 이름 문자열 iterable
+        """
+        newNames = []
+        for name in inNames:
+            count = self._nameCounts.get(name, 0)
+            self._nameCounts[name] = count + 1
+            if count == 0:
+                newNames.append(name)
+
+        for name, (partValues, _) in zip(newNames, self._naming._iter_parsed_rows(newNames)):
+            self._insert(name, partValues)
+
+    def remove(self, inName: str) -> bool:
+        """
+        이름 하나를 색인에서 제거 (같은 이름이 여러 번 등록된 경우 횟수만 감소)
+
+        Args:
+            inName: 제거할 이름 문자열
+
+        Returns:
+            제거되었으면 True, 색인에 없으면 False
+        """
+        count = self._nameCounts.get(inName, 0)
+        if count == 0:
+            return False
+        if count > 1:
+            self._nameCounts[inName] = count - 1
+            return True
+
+        del self._nameCounts[inName]
+        row = self._rows.pop(inName)
+        for partName, value in zip(self._partNames, row):
+            if value:
+                key = (partName, value)
+                postings = self._postings[key]
+                postings.discard(inName)
+                if not postings:
+                    del self._postings[key]
+        index = self._get_index_number(row)
+        if index is not None:
+            pos = bisect_left(self._sortedIndices, (index, inName))
+            del self._sortedIndices[pos]
+        return True
+
+    def rename(self, inOldName: str, inNewName: str) -> bool:
+        """
+        색인된 이름 변경
+
+        Args:
+            inOldName: 기존 이름 문자열
+            inNewName: 새 이름 문자열
+
+        Returns:
+            변경되었으면 True, 기존 이름이 색인에 없으면 False
+        """
+        if not self.remove(inOldName):
+            return False
+        self.add(inNewName)
+        return True
+
+    def clear(self):
+        """
+        색인 초기화
+        """
+        self._rows.clear()
+        self._nameCounts.clear()
+        self._postings.clear()
+        self._sortedIndices.clear()
+
+    def get_names(self) -> List[str]:
+        """
+        색인된 고유 이름 목록 반환
+
+        Returns:
+            이름 문자열 리스트
+        """
+        return list(self._rows)
+
+    def get_values(self, inPartName: str) -> List[str]:
+        """
+        색인된 이름들에서 나타난 파트 값 목록 반환
+
+        Args:
+            inPartName: NamePart 이름
+
+        Returns:
+            값 문자열 리스트 (정렬됨)
+        """
+        return sorted(value for partName, value in self._postings if partName == inPartName)
+
+    def query(self, inConditions: Optional[Dict[str, Union[str, Iterable[str]]]] = None,
+              inMinIndex: Optional[int] = None, inMaxIndex: Optional[int] = None) -> List[str]:
+        """
+        파트 값 조건과 인덱스 범위를 모두 만족하는 이름 검색
+
+        Args:
+            inConditions: {파트 이름: 값 또는 값 목록(하나라도 일치)} 딕셔너리 (기본값: None)
+            inMinIndex: 최소 인덱스 (포함, 기본값: None)
+            inMaxIndex: 최대 인덱스 (포함, 기본값: None)
+
+        Returns:
+            조건을 만족하는 이름 문자열 리스트 (정렬됨)
+        """
+        candidateSets = []
+        for partName, values in (inConditions or {}).items():
+            if isinstance(values, str):
+                candidateSets.append(self._postings.get((partName, values), set()))
+            else:
+                union = set()
+                for value in values:
+                    union |= self._postings.get((partName, value), set())
+                candidateSets.append(union)
+
+        hasRange = inMinIndex is not None or inMaxIndex is not None
+        if hasRange:
+            lo = 0 if inMinIndex is None else bisect_left(self._sortedIndices, (inMinIndex, ""))
+            hi = len(self._sortedIndices) if inMaxIndex is None else bisect_left(self._sortedIndices, (inMaxIndex + 1, ""))
+            # 범위가 조건 결과보다 크면 범위 목록을 만들지 않고 조건 결과를 인덱스로 거름
+            if candidateSets and min(len(candidates) for candidates in candidateSets) < hi - lo:
+                result = self._intersect(candidateSets)
+                return sorted(name for name in result if self._in_range(name, inMinIndex, inMaxIndex))
+            candidateSets.append({name for _, name in self._sortedIndices[lo:hi]})
+
+        if not candidateSets:
+            return sorted(self._rows)
+        return sorted(self._intersect(candidateSets))
+
+    @staticmethod
+    def _intersect(inSets: List[Set[str]]) -> Set[str]:
+        """
+        이름 집합들의 교집합 (가장 작은 집합부터 계산)
+
+        Args:
+            inSets: 이름 집합 리스트 (하나 이상)
+
+        Returns:
+            교집합 (새 집합)
+        """
+        inSets = sorted(inSets, key=len)
+        result = set(inSets[0])
+        for names in inSets[1:]:
+            if not result:
+                break
+            result &= names
+        return result
+
+    def _in_range(self, inName: str, inMinIndex: Optional[int], inMaxIndex: Optional[int]) -> bool:
+        """
+        이름의 인덱스가 범위 안에 있는지 확인
+
+        Args:
+            inName: 색인된 이름 문자열
+            inMinIndex: 최소 인덱스 (포함, None이면 제한 없음)
+            inMaxIndex: 최대 인덱스 (포함, None이면 제한 없음)
+
+        Returns:
+            범위 안이면 True (인덱스가 없으면 False)
+        """
+        index = self._get_index_number(self._rows[inName])
+        if index is None:
+            return False
+        if inMinIndex is not None and index < inMinIndex:
+            return False
+        if inMaxIndex is not None and index > inMaxIndex:
+            return False
+        return True
@@ -0,0 +1,355 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+nameParser 모듈 - 컴파일된 이름 분석기 제공
+NamePart 설정으로부터 한 번 생성되어, 토큰화된 이름을 한 번의 스윕으로 분류하는 클래스 구현
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from JalLib.namePart import NamePart, NamePartType
+
+
+class NameParser:
+    """
+    NamePart 설정으로부터 미리 컴파일된 이름 분석기.
+
+    Naming.get_name이 파트마다 토큰화와 pick_name을 반복하던 작업을
+    토큰 한 번, 좌/우 스윕 한 번으로 처리합니다.
+    결과는 기존 Naming.convert_name_to_array와 동일합니다.
+    """
+
+    def __init__(self, inNameParts: List[NamePart]):
+        """
+        NameParser 초기화 (설정 컴파일)
+
+        Args:
+            inNameParts: 이름 분석에 사용할 NamePart 객체 리스트 (순서 유지)
+        """
+        self._partCount = len(inNameParts)
+        self._partNames = [part.get_name() for part in inNameParts]
+        self._partTypes = [part.get_type() for part in inNameParts]
+
+        # PREFIX/SUFFIX 파트의 사전 정의 값 집합 (값이 없으면 None -> 항상 빈 문자열)
+        self._partValueSets = []
+        for part in inNameParts:
+            values = part.get_predefined_values()
+            if part.get_type() in (NamePartType.PREFIX, NamePartType.SUFFIX) and values:
+                self._partValueSets.append(frozenset(values))
+            else:
+                self._partValueSets.append(None)
+
+        # Index가 RealName 뒤에 있으면 오른쪽부터 숫자를 찾음 (Naming.pick_name 규칙)
+        indexOrder = self._partNames.index("Index") if "Index" in self._partNames else -1
+        realNameOrder = self._partNames.index("RealName") if "RealName" in self._partNames else -1
+        self._indexFromRight = indexOrder > realNameOrder
+
+        # convert_name_to_array에서 RealName 값이 들어갈 슬롯
+        self._realNameSlot = -1
+        for i, partName in enumerate(self._partNames):
+            if partName == "RealName":
+                self._realNameSlot = i
+
+        # 방향성 파트의 값 -> 반대 값 테이블 (가중치 차이가 가장 큰 값, 설정 로드 시 한 번 계산)
+        self._mirrorTables = []
+        for i, part in enumerate(inNameParts):
+            if not part.is_direction() or part.get_type() == NamePartType.REALNAME:
+                continue
+            mirrorTable = {}
+            for value in part.get_predefined_values():
+                opositeValue = part.get_most_different_weight_value(value)
+                if opositeValue and opositeValue != value:
+                    mirrorTable[value] = opositeValue
+            if mirrorTable:
+                self._mirrorTables.append((i, mirrorTable))
+
+        # 설정 지문 (파싱 캐시 키로 사용)
+        self._fingerprintKey = (
+            tuple(self._partNames),
+            tuple(partType.name for partType in self._partTypes),
+            tuple(tuple(part.get_predefined_values()) for part in inNameParts),
+            self._indexFromRight,
+        )
+        self._fingerprint = hash(self._fingerprintKey)
+
+    def __setstate__(self, inState):
+        """
+        pickle에서 복원 (문자열 해시는 프로세스마다 다르므로 지문을 다시 계산)
+        """
+        self.__dict__.update(inState)
+        self._fingerprint = hash(self._fingerprintKey)
+
+    def get_part_names(self) -> List[str]:
+        """
+        컴파일된 NamePart 이름 목록 반환
+
+        Returns:
+            NamePart 이름 목록 (순서 유지)
+        """
+        return self._partNames.copy()
+
+    def get_fingerprint(self) -> int:
+        """
+        컴파일된 설정의 지문 반환
+
+        Returns:
+            파트 이름, 타입, 사전 정의 값으로 계산한 해시 값
+        """
+        return self._fingerprint
+
+    def get_real_name_slot(self) -> int:
+        """
+        RealName 값이 들어가는 배열 위치 반환
+
+        Returns:
+            RealName 슬롯 인덱스, 없으면 -1
+        """
+        return self._realNameSlot
+
+    def _pick(self, inTokens: List[str]) -> List[str]:
+        """
+        각 파트에 대해 Naming.pick_name과 동일한 후보 값을 한 번에 선택
+
+        Args:
+            inTokens: 토큰화된 이름
+
+        Returns:
+            파트별 후보 값 리스트
+        """
+        picks = [""] * self._partCount
+
+        digitToken = ""
+        digitTokens = [token for token in inTokens if token.isdigit()]
+        if digitTokens:
+            digitToken = digitTokens[-1] if self._indexFromRight else digitTokens[0]
+
+        for i in range(self._partCount):
+            partType = self._partTypes[i]
+            valueSet = self._partValueSets[i]
+            if partType == NamePartType.INDEX:
+                picks[i] = digitToken
+            elif valueSet is None:
+                continue
+            elif partType == NamePartType.PREFIX:
+                for token in inTokens:
+                    if token in valueSet:
+                        picks[i] = token
+                        break
+            else:
+                for token in reversed(inTokens):
+                    if token in valueSet:
+                        picks[i] = token
+                        break
+
+        return picks
+
+    @staticmethod
+    def _is_covered(inTokens: List[str], inPickCount: Dict[str, int]) -> bool:
+        """
+        토큰들이 모두 다른 파트의 후보 값으로 설명되는지 확인 (중복 개수 포함)
+
+        Args:
+            inTokens: 확인할 토큰 리스트
+            inPickCount: 후보 값별 개수
+
+        Returns:
+            모든 토큰이 설명되면 True
+        """
+        if not inTokens:
+            return True
+        needCount = {}
+        for token in inTokens:
+            needCount[token] = needCount.get(token, 0) + 1
+        for token, count in needCount.items():
+            if inPickCount.get(token, 0) < count:
+                return False
+        return True
+
+    def classify(self, inTokens: List[str], inFilChar: str) -> Tuple[Tuple[str, ...], str]:
+        """
+        토큰화된 이름을 파트별 값으로 분류
+
+        Args:
+            inTokens: 토큰화된 이름 (Naming._split_to_array 결과)
+            inFilChar: 이름의 구분자 문자
+
+        Returns:
+            (파트별 Naming.get_name 결과 튜플, RealName 문자열) 튜플
+            REALNAME 타입 파트의 슬롯은 빈 문자열
+        """
+        picks = self._pick(inTokens)
+        values = [""] * self._partCount
+        partTypes = self._partTypes
+
+        firstPos = {}
+        for pos, token in enumerate(inTokens):
+            firstPos.setdefault(token, pos)
+
+        # 왼쪽 스윕: PREFIX는 앞쪽 토큰이 모두 이전 파트 후보로 설명되어야 함
+        prevCount = {}
+        for i in range(self._partCount):
+            partType = partTypes[i]
+            picked = picks[i]
+            if partType == NamePartType.INDEX:
+                values[i] = picked
+            elif partType == NamePartType.PREFIX and picked:
+                if self._is_covered(inTokens[:firstPos[picked]], prevCount):
+                    values[i] = picked
+            if picked:
+                prevCount[picked] = prevCount.get(picked, 0) + 1
+
+        # 오른쪽 스윕: SUFFIX는 뒤쪽 토큰이 모두 이후 파트 후보로 설명되어야 함
+        nextCount = {}
+        for i in range(self._partCount - 1, -1, -1):
+            picked = picks[i]
+            if partTypes[i] == NamePartType.SUFFIX and picked:
+                if self._is_covered(inTokens[firstPos[picked] + 1:], nextCount):
+                    values[i] = picked
+            if picked:
+                nextCount[picked] = nextCount.get(picked, 0) + 1
+
+        # RealName: REALNAME이 아닌 파트 값들을 제외한 나머지 토큰
+        remainTokens = list(inTokens)
+        for i in range(self._partCount):
+            value = values[i]
+            if value and partTypes[i] != NamePartType.REALNAME and value in remainTokens:
+                remainTokens.remove(value)
+        realName = inFilChar.join(remainTokens)
+
+        return tuple(values), realName
+
+    def get_mirror_table(self, inPartName: str) -> Dict[str, str]:
+        """
+        방향성 파트의 값 -> 반대 값 테이블 반환
+
+        Args:
+            inPartName: NamePart 이름
+
+        Returns:
+            값을 키로, 반대 값을 값으로 하는 딕셔너리 (방향성 파트가 아니면 빈 딕셔너리)
+        """
+        for i, mirrorTable in self._mirrorTables:
+            if self._partNames[i] == inPartName:
+                return dict(mirrorTable)
+        return {}
+
+    def mirror(self, inValues: List[str]) -> List[str]:
+        """
+        이름 부분 배열의 방향성 파트 값을 반대 값으로 교체
+
+        Args:
+            inValues: 이름 부분 배열 (parse 결과와 같은 순서)
+
+        Returns:
+            방향성 값이 반대로 바뀐 새 리스트
+        """
+        values = list(inValues)
+        for i, mirrorTable in self._mirrorTables:
+            opositeValue = mirrorTable.get(values[i])
+            if opositeValue is not None:
+                values[i] = opositeValue
+        return values
+
+    def parse(self, inTokens: List[str], inFilChar: str) -> List[str]:
+        """
+        토큰화된 이름을 이름 부분 배열로 변환
+
+        Args:
+            inTokens: 토큰화된 이름 (Naming._split_to_array 결과)
+            inFilChar: 이름의 구분자 문자
+
+        Returns:
+            이름 부분 배열 (Naming.convert_name_to_array와 동일)
+        """
+        partValues, realName = self.classify(inTokens, inFilChar)
+        values = list(partValues)
+        if self._realNameSlot >= 0:
+            values[self._realNameSlot] = realName
+        return values
+
+
+class NameParseCache:
+    """
+    파싱 결과를 보관하는 크기 제한 LRU 캐시.
+    키는 (설정 지문, 이름 문자열)이며 적중/실패 횟수를 기록합니다.
+    """
+
+    def __init__(self, inMaxSize: int = 4096):
+        """
+        NameParseCache 초기화
+
+        Args:
+            inMaxSize: 최대 항목 수 (0이면 캐시 사용 안 함)
+        """
+        self._maxSize = max(0, inMaxSize)
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, inKey) -> Optional[Any]:
+        """
+        캐시된 값 가져오기 (적중 시 가장 최근 사용으로 갱신)
+
+        Args:
+            inKey: 캐시 키
+
+        Returns:
+            캐시된 값, 없으면 None
+        """
+        entry = self._entries.get(inKey)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(inKey)
+        self._hits += 1
+        return entry
+
+    def put(self, inKey, inValue):
+        """
+        값을 캐시에 저장 (최대 크기를 넘으면 가장 오래된 항목 제거)
+
+        Args:
+            inKey: 캐시 키
+            inValue: 저장할 값 (불변 객체여야 함)
+        """
+        if self._maxSize <= 0:
+            return
+        self._entries[inKey] = inValue
+        self._entries.move_to_end(inKey)
+        if len(self._entries) > self._maxSize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        모든 항목과 적중/실패 횟수 초기화
+        """
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def set_max_size(self, inMaxSize: int):
+        """
+        최대 항목 수 설정 (초과 항목은 오래된 순으로 제거)
+
+        Args:
+            inMaxSize: 최대 항목 수 (0이면 캐시 사용 안 함)
+        """
+        self._maxSize = max(0, inMaxSize)
+        while len(self._entries) > self._maxSize:
+            self._entries.popitem(last=False)
+
+    def get_info(self) -> Dict[str, int]:
+        """
+        캐시 상태 반환
+
+        Returns:
+            {"hits", "misses", "size", "maxSize"} 딕셔너리
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._entries),
+            "maxSize": self._maxSize,
+        }
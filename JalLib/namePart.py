@@ -6,6 +6,8 @@ namePart 모듈 - 이름의 각 부분을 표현하는 기능 제공
 이름 부분의 사전 정의된 값과 가중치 매핑을 관리하는 클래스 구현
 """
 
+import hashlib
+import json
 from typing import List, Dict, Any, Optional, Union
 from enum import Enum, auto
 
@@ -44,60 +46,115 @@ class NamePart:
             inKoreanDescriptions: 사전 선언된 값들의 한국어 설명 목록 (기본값: None, 빈 리스트로 초기화)
         """
         self._name = inName
-        self._predefinedValues = inPredefinedValues if inPredefinedValues is not None else []
-        self._weights = []
         self._type = inType
-        self._descriptions = inDescriptions if inDescriptions is not None else [""] * len(self._predefinedValues)
-        self._koreanDescriptions = inKoreanDescriptions if inKoreanDescriptions is not None else [""] * len(self._predefinedValues) # Add korean descriptions
         self._isDirection = inIsDirection if inIsDirection is True else False  # 방향성 여부 (기본값: False)
         
-        # 길이 일치 확인 (Descriptions)
-        if len(self._descriptions) < len(self._predefinedValues):
-            self._descriptions.extend([""] * (len(self._predefinedValues) - len(self._descriptions)))
-        elif len(self._descriptions) > len(self._predefinedValues):
-            self._descriptions = self._descriptions[:len(self._predefinedValues)]
-
-        # 길이 일치 확인 (Korean Descriptions)
-        if len(self._koreanDescriptions) < len(self._predefinedValues):
-            self._koreanDescriptions.extend([""] * (len(self._predefinedValues) - len(self._koreanDescriptions)))
-        elif len(self._koreanDescriptions) > len(self._predefinedValues):
-            self._koreanDescriptions = self._koreanDescriptions[:len(self._predefinedValues)]
-        
-        # 타입에 따른 기본 값 설정
-        self._initialize_type_defaults()
-        self._update_weights()
-    
-    def _initialize_type_defaults(self):
-        """타입에 따른 기본 설정을 초기화합니다."""
-        if self._type == NamePartType.INDEX:
-            # Index 타입은 숫자만 처리하므로 predefined values는 사용하지 않음
-            self._predefinedValues = []
-            self._descriptions = []
-            self._koreanDescriptions = [] # Clear korean descriptions
-            self._weights = []
-        elif self._type == NamePartType.REALNAME:
-            # RealName 타입은 predefined values를 사용하지 않음
-            self._predefinedValues = []
-            self._descriptions = []
-            self._koreanDescriptions = [] # Clear korean descriptions
-            self._weights = []
-    
-    def _update_weights(self):
-        """
-        predefined values의 순서에 따라 자동으로 가중치를 설정합니다.
-        값들은 5부터 시작해서 5씩 증가하는 가중치를 갖습니다.
-        """
-        # REALNAME이나 INDEX 타입인 경우 weights를 사용하지 않음
-        if self._type == NamePartType.REALNAME or self._type == NamePartType.INDEX:
-            self._weights = []
-            return
+        # 값 레코드 테이블: 슬롯 번호로 접근하는 열(column) 리스트와 값 -> 슬롯 딕셔너리
+        # 제거된 슬롯은 값 열에 None으로 표시하고, 위치가 필요한 조회 시에 한 번에 압축합니다.
+        # 가중치는 저장하지 않고 압축된 위치에서 계산합니다 (5, 10, 15, ...).
+        self._values = []
+        self._descriptionColumn = []
+        self._koreanDescriptionColumn = []
+        self._removedCount = 0
+        
+        # 타입에 따른 기본 값 설정 (REALNAME/INDEX는 사전 정의 값을 사용하지 않음)
+        if not self._has_no_values():
+            self._set_columns(inPredefinedValues or [], inDescriptions, inKoreanDescriptions)
+        self._rebuild_indexes()
+    
+    def _has_no_values(self):
+        """REALNAME이나 INDEX 타입처럼 사전 정의 값을 사용하지 않는 타입인지 확인합니다."""
+        return self._type == NamePartType.REALNAME or self._type == NamePartType.INDEX
+    
+    @staticmethod
+    def _fit_column(inColumn, inLength):
+        """
+        설명 열을 값 개수에 맞게 복사합니다. (부족하면 빈 문자열로 채우고 넘치면 자름)
+        
+        Args:
+            inColumn: 설명 리스트 (None이면 빈 문자열로 채움)
+            inLength: 값 개수
             
-        self._weights = []
-        # 가중치는 5부터 시작해서 5씩 증가 (순서대로 내림차순 가중치)
-        num_values = len(self._predefinedValues)
-        for i in range(num_values):
-            weight_value = 5 * (i + 1)  # 내림차순 가중치
-            self._weights.append(weight_value)
+        Returns:
+            길이가 inLength인 새 리스트
+        """
+        column = list(inColumn[:inLength]) if inColumn else []
+        column.extend([""] * (inLength - len(column)))
+        return column
+    
+    def _set_columns(self, inValues, inDescriptions, inKoreanDescriptions):
+        """
+        값/설명/한국어 설명 열을 새로 설정합니다. (입력 리스트는 복사)
+        """
+        self._values = list(inValues)
+        self._descriptionColumn = self._fit_column(inDescriptions, len(self._values))
+        self._koreanDescriptionColumn = self._fit_column(inKoreanDescriptions, len(self._values))
+        self._removedCount = 0
+    
+    def _compact(self):
+        """
+        제거된 슬롯을 없애 슬롯 번호와 위치를 일치시킵니다. (제거 후 위치 조회 시 한 번만 수행)
+        """
+        if not self._removedCount:
+            return
+        liveSlots = [slot for slot, value in enumerate(self._values) if value is not None]
+        self._values = [self._values[slot] for slot in liveSlots]
+        self._descriptionColumn = [self._descriptionColumn[slot] for slot in liveSlots]
+        self._koreanDescriptionColumn = [self._koreanDescriptionColumn[slot] for slot in liveSlots]
+        self._removedCount = 0
+        self._rebuild_indexes()
+    
+    def _rebuild_indexes(self):
+        """
+        값/설명 조회용 해시 인덱스를 다시 생성합니다.
+        중복이 있으면 list.index와 같이 가장 앞의 항목을 가리킵니다.
+        """
+        self._valueIndex = {}
+        for slot, value in enumerate(self._values):
+            if value is not None:
+                self._valueIndex.setdefault(value, slot)
+        
+        # 설명 인덱스는 설명으로 조회할 때 생성 (set_description 반복 호출 시 재생성 방지)
+        self._descriptionIndex = None
+        self._koreanDescriptionIndex = None
+        self._contentHash = None
+    
+    @property
+    def _weights(self):
+        """
+        위치에 따른 가중치 리스트 (5부터 5씩 증가, REALNAME/INDEX 타입은 빈 리스트)
+        """
+        if self._has_no_values():
+            return []
+        return [5 * (i + 1) for i in range(self.get_value_count())]
+    
+    def _get_description_index(self):
+        """
+        설명 -> 위치 인덱스를 반환합니다. (필요할 때 생성)
+        
+        Returns:
+            설명을 키로, 가장 앞의 슬롯을 값으로 하는 딕셔너리
+        """
+        if self._descriptionIndex is None:
+            self._descriptionIndex = {}
+            for slot, description in enumerate(self._descriptionColumn):
+                if self._values[slot] is not None:
+                    self._descriptionIndex.setdefault(description, slot)
+        return self._descriptionIndex
+    
+    def _get_korean_description_index(self):
+        """
+        한국어 설명 -> 위치 인덱스를 반환합니다. (필요할 때 생성)
+        
+        Returns:
+            한국어 설명을 키로, 가장 앞의 슬롯을 값으로 하는 딕셔너리
+        """
+        if self._koreanDescriptionIndex is None:
+            self._koreanDescriptionIndex = {}
+            for slot, koreanDescription in enumerate(self._koreanDescriptionColumn):
+                if self._values[slot] is not None:
+                    self._koreanDescriptionIndex.setdefault(koreanDescription, slot)
+        return self._koreanDescriptionIndex
     
     def set_name(self, inName):
         """
@@ -107,6 +164,7 @@ class NamePart:
             inName: 설정할 이름
         """
         self._name = inName
+        self._contentHash = None
     
     def get_name(self):
         """
@@ -125,8 +183,9 @@ class NamePart:
             inType: 설정할 타입 (NamePartType 열거형 값)
         """
         self._type = inType
-        self._initialize_type_defaults()
-        self._update_weights()
+        if self._has_no_values():
+            self._set_columns([], None, None)
+        self._rebuild_indexes()
     
     def get_type(self):
         """
@@ -186,14 +245,23 @@ class NamePart:
             추가 성공 여부 (이미 존재하는 경우 False)
         """
         # REALNAME이나 INDEX 타입인 경우 predefined values를 사용하지 않음
-        if self._type == NamePartType.REALNAME or self._type == NamePartType.INDEX:
+        if self._has_no_values():
             return False
             
-        if inValue not in self._predefinedValues:
-            self._predefinedValues.append(inValue)
-            self._descriptions.append(inDescription)
-            self._koreanDescriptions.append(inKoreanDescription) # Add korean description
-            self._update_weights()  # 가중치 자동 업데이트
+        if inValue not in self._valueIndex:
+            # 새 슬롯을 맨 뒤에 추가 (가중치는 위치에서 계산하므로 다시 계산하지 않음)
+            newSlot = len(self._values)
+            self._values.append(inValue)
+            self._descriptionColumn.append(inDescription)
+            self._koreanDescriptionColumn.append(inKoreanDescription)
+            
+            # 조회 인덱스 갱신 (맨 뒤에 추가되므로 기존 항목 슬롯은 그대로)
+            self._valueIndex[inValue] = newSlot
+            if self._descriptionIndex is not None:
+                self._descriptionIndex.setdefault(inDescription, newSlot)
+            if self._koreanDescriptionIndex is not None:
+                self._koreanDescriptionIndex.setdefault(inKoreanDescription, newSlot)
+            self._contentHash = None
             return True
         return False
     
@@ -207,17 +275,55 @@ class NamePart:
         Returns:
             제거 성공 여부 (존재하지 않는 경우 False)
         """
-        if inValue in self._predefinedValues:
-            index = self._predefinedValues.index(inValue)
-            self._predefinedValues.remove(inValue)
-            self._descriptions.pop(index)
-            self._koreanDescriptions.pop(index) # Remove korean description
-            if index < len(self._weights):
-                self._weights.pop(index)
-            self._update_weights()  # 가중치 자동 업데이트
-            return True
-        return False
-    
+        slot = self._valueIndex.pop(inValue, None)
+        if slot is None:
+            return False
+        
+        # 슬롯만 비워 두고 압축은 위치가 필요할 때 수행 (다른 항목의 슬롯은 그대로)
+        self._values[slot] = None
+        self._removedCount += 1
+        
+        # 같은 값이 중복으로 있었으면 다음 항목을 가리키도록 갱신
+        if len(self._valueIndex) < len(self._values) - self._removedCount:
+            for nextSlot in range(slot + 1, len(self._values)):
+                if self._values[nextSlot] == inValue:
+                    self._valueIndex[inValue] = nextSlot
+                    break
+        self._descriptionIndex = None
+        self._koreanDescriptionIndex = None
+        self._contentHash = None
+        return True
+
+    def rename_predefined_value(self, inValue, inNewValue):
+        """
+        사전 선언된 값의 이름을 바꿉니다. (위치, 설명, 한국어 설명은 유지)
+
+        Args:
+            inValue: 바꿀 값
+            inNewValue: 새 값
+
+        Returns:
+            변경 성공 여부 (값이 없거나 새 값이 이미 존재하는 경우 False)
+        """
+        if inValue == inNewValue:
+            return inValue in self._valueIndex
+        if inValue not in self._valueIndex or inNewValue in self._valueIndex:
+            return False
+
+        # 같은 슬롯에 새 값을 넣으므로 다른 항목의 슬롯과 설명 인덱스는 그대로
+        slot = self._valueIndex.pop(inValue)
+        self._values[slot] = inNewValue
+        self._valueIndex[inNewValue] = slot
+
+        # 같은 값이 중복으로 있었으면 다음 항목을 가리키도록 갱신
+        if len(self._valueIndex) < len(self._values) - self._removedCount:
+            for nextSlot in range(slot + 1, len(self._values)):
+                if self._values[nextSlot] == inValue:
+                    self._valueIndex[inValue] = nextSlot
+                    break
+        self._contentHash = None
+        return True
+
     def set_predefined_values(self, inValues, inDescriptions=None, inKoreanDescriptions=None):
         """
         사전 선언된 값 목록을 설정합니다.
@@ -228,35 +334,12 @@ class NamePart:
             inKoreanDescriptions: 설정할 값들의 한국어 설명 목록 (기본값: None, 빈 문자열로 초기화)
         """
         # REALNAME이나 INDEX 타입인 경우 predefined values를 사용하지 않음
-        if self._type == NamePartType.REALNAME or self._type == NamePartType.INDEX:
+        if self._has_no_values():
             return
             
-        self._predefinedValues = inValues.copy() if inValues else []
-        
-        # 설명 세팅
-        if inDescriptions:
-            self._descriptions = inDescriptions.copy()
-            # 길이 일치 확인
-            if len(self._descriptions) < len(self._predefinedValues):
-                self._descriptions.extend([""] * (len(self._predefinedValues) - len(self._descriptions)))
-            elif len(self._descriptions) > len(self._predefinedValues):
-                self._descriptions = self._descriptions[:len(self._predefinedValues)]
-        else:
-            self._descriptions = [""] * len(self._predefinedValues)
-
-        # 한국어 설명 세팅
-        if inKoreanDescriptions:
-            self._koreanDescriptions = inKoreanDescriptions.copy()
-            # 길이 일치 확인
-            if len(self._koreanDescriptions) < len(self._predefinedValues):
-                self._koreanDescriptions.extend([""] * (len(self._predefinedValues) - len(self._koreanDescriptions)))
-            elif len(self._koreanDescriptions) > len(self._predefinedValues):
-                self._koreanDescriptions = self._koreanDescriptions[:len(self._predefinedValues)]
-        else:
-            self._koreanDescriptions = [""] * len(self._predefinedValues)
-        
-        # 가중치 자동 업데이트
-        self._update_weights()
+        # 설명 길이는 값 개수에 맞춤 (가중치는 위치에서 계산)
+        self._set_columns(inValues or [], inDescriptions, inKoreanDescriptions)
+        self._rebuild_indexes()
     
     def get_predefined_values(self):
         """
@@ -265,7 +348,8 @@ class NamePart:
         Returns:
             사전 선언된 값 목록
         """
-        return self._predefinedValues.copy()
+        self._compact()
+        return self._values.copy()
     
     def contains_value(self, inValue):
         """
@@ -281,7 +365,7 @@ class NamePart:
         if self._type == NamePartType.INDEX:
             return isinstance(inValue, str) and inValue.isdigit()
             
-        return inValue in self._predefinedValues
+        return inValue in self._valueIndex
     
     def get_value_at_index(self, inIndex):
         """
@@ -293,8 +377,9 @@ class NamePart:
         Returns:
             값 (인덱스가 범위를 벗어나면 None)
         """
-        if 0 <= inIndex < len(self._predefinedValues):
-            return self._predefinedValues[inIndex]
+        self._compact()
+        if 0 <= inIndex < len(self._values):
+            return self._values[inIndex]
         return None
     
     def get_value_count(self):
@@ -304,29 +389,28 @@ class NamePart:
         Returns:
             값 개수
         """
-        return len(self._predefinedValues)
+        return len(self._values) - self._removedCount
     
     def clear_predefined_values(self):
         """
         모든 사전 선언된 값을 제거합니다.
         """
         # REALNAME이나 INDEX 타입인 경우 아무것도 하지 않음
-        if self._type == NamePartType.REALNAME or self._type == NamePartType.INDEX:
+        if self._has_no_values():
             return
             
-        self._predefinedValues.clear()
-        self._descriptions.clear()
-        self._koreanDescriptions.clear() # Clear korean descriptions
-        self._weights.clear()  # 가중치도 초기화
+        self._set_columns([], None, None)
+        self._rebuild_indexes()
     
     # 가중치 매핑 관련 메서드들
     
     def get_value_by_weight(self, inRank=0):
         returnStr = ""
-        if len(self._predefinedValues) != len(self._weights) or len(self._predefinedValues) <= 0:
+        if self._has_no_values() or self.get_value_count() <= 0:
             return returnStr
+        self._compact()
         foundIndex = self._weights.index(inRank)
-        returnStr = self._predefinedValues[foundIndex] if foundIndex >= 0 else self._predefinedValues[0]
+        returnStr = self._values[foundIndex] if foundIndex >= 0 else self._values[0]
         
         return returnStr
     
@@ -340,26 +424,30 @@ class NamePart:
         Returns:
             가중치 차이가 가장 큰 값, 없으면 빈 문자열
         """
-        if len(self._predefinedValues) != len(self._weights) or len(self._predefinedValues) <= 0:
-            return ""
-            
-        if inValue not in self._predefinedValues:
+        if self._has_no_values() or inValue not in self._valueIndex:
             return ""
             
-        # 값의 가중치 가져오기
-        index = self._predefinedValues.index(inValue)
-        currentWeight = self._weights[index]
-            
+        # 가중치는 위치에 비례하므로 위치 차이로 비교
+        self._compact()
+        currentIndex = self._valueIndex[inValue]
+        lastIndex = len(self._values) - 1
+        
+        # 중복 값이 없으면 가장 먼 값은 처음 또는 마지막 값 (같으면 앞쪽 우선)
+        if len(self._valueIndex) == len(self._values):
+            if lastIndex <= 0:
+                return ""
+            farIndex = 0 if currentIndex >= lastIndex - currentIndex else lastIndex
+            return self._values[farIndex]
+        
         maxDiff = -1
         maxDiffValue = ""
         
         # 가중치 차이가 가장 큰 값 찾기
-        for i, predValue in enumerate(self._predefinedValues):
+        for i, predValue in enumerate(self._values):
             if predValue == inValue:
                 continue
                 
-            predWeight = self._weights[i] if i < len(self._weights) else 0
-            diff = abs(currentWeight - predWeight)
+            diff = abs(currentIndex - i)
             if diff > maxDiff:
                 maxDiff = diff
                 maxDiffValue = predValue
@@ -373,9 +461,10 @@ class NamePart:
         Returns:
             가중치가 가장 낮은 값, 없으면 빈 문자열
         """
-        if len(self._predefinedValues) != len(self._weights) or len(self._predefinedValues) <= 0:
+        if self._has_no_values() or self.get_value_count() <= 0:
             return ""
-        return self._predefinedValues[0]
+        self._compact()
+        return self._values[0]
     
     def get_value_by_max_weight(self):
         """
@@ -384,9 +473,10 @@ class NamePart:
         Returns:
             가중치가 가장 높은 값, 없으면 빈 문자열
         """
-        if len(self._predefinedValues) != len(self._weights) or len(self._predefinedValues) <= 0:
+        if self._has_no_values() or self.get_value_count() <= 0:
             return ""
-        return self._predefinedValues[-1]
+        self._compact()
+        return self._values[-1]
     
     def validate_value(self, inValue):
         """
@@ -403,8 +493,8 @@ class NamePart:
             return isinstance(inValue, str) and inValue.isdigit()
             
         # PREFIX와 SUFFIX 타입은 predefined values 중 하나여야 함
-        if (self._type == NamePartType.PREFIX or self._type == NamePartType.SUFFIX) and self._predefinedValues:
-            return inValue in self._predefinedValues
+        if (self._type == NamePartType.PREFIX or self._type == NamePartType.SUFFIX) and self._valueIndex:
+            return inValue in self._valueIndex
             
         # REALNAME 타입은 모든 문자열 유효
         if self._type == NamePartType.REALNAME:
@@ -426,9 +516,11 @@ class NamePart:
         Returns:
             설정 성공 여부 (값이 존재하지 않는 경우 False)
         """
-        if inValue in self._predefinedValues:
-            index = self._predefinedValues.index(inValue)
-            self._descriptions[index] = inDescription
+        if inValue in self._valueIndex:
+            slot = self._valueIndex[inValue]
+            self._descriptionColumn[slot] = inDescription
+            self._descriptionIndex = None
+            self._contentHash = None
             return True
         return False
     
@@ -442,9 +534,9 @@ class NamePart:
         Returns:
             해당 값의 설명, 값이 존재하지 않으면 빈 문자열
         """
-        if inValue in self._predefinedValues:
-            index = self._predefinedValues.index(inValue)
-            return self._descriptions[index]
+        slot = self._valueIndex.get(inValue)
+        if slot is not None:
+            return self._descriptionColumn[slot]
         return ""
     
     def get_descriptions(self):
@@ -454,7 +546,8 @@ class NamePart:
         Returns:
             설명 목록
         """
-        return self._descriptions.copy()
+        self._compact()
+        return self._descriptionColumn.copy()
     
     def get_value_by_description(self, inDescription):
         """
@@ -466,9 +559,9 @@ class NamePart:
         Returns:
             해당 설명의 값, 없으면 빈 문자열
         """
-        if inDescription in self._descriptions:
-            index = self._descriptions.index(inDescription)
-            return self._predefinedValues[index]
+        slot = self._get_description_index().get(inDescription)
+        if slot is not None:
+            return self._values[slot]
         return ""
     
     def get_value_with_description(self, inIndex):
@@ -481,8 +574,9 @@ class NamePart:
         Returns:
             (값, 설명) 튜플, 인덱스가 범위를 벗어나면 (None, None)
         """
-        if 0 <= inIndex < len(self._predefinedValues):
-            return (self._predefinedValues[inIndex], self._descriptions[inIndex])
+        self._compact()
+        if 0 <= inIndex < len(self._values):
+            return (self._values[inIndex], self._descriptionColumn[inIndex])
         return (None, None)
     
     def get_values_with_descriptions(self):
@@ -492,7 +586,8 @@ class NamePart:
         Returns:
             (값, 설명) 튜플의 리스트
         """
-        return list(zip(self._predefinedValues, self._descriptions))
+        self._compact()
+        return list(zip(self._values, self._descriptionColumn))
 
     # 추가: 한국어 설명 관련 메서드들
     
@@ -507,9 +602,11 @@ class NamePart:
         Returns:
             설정 성공 여부 (값이 존재하지 않는 경우 False)
         """
-        if inValue in self._predefinedValues:
-            index = self._predefinedValues.index(inValue)
-            self._koreanDescriptions[index] = inKoreanDescription
+        if inValue in self._valueIndex:
+            slot = self._valueIndex[inValue]
+            self._koreanDescriptionColumn[slot] = inKoreanDescription
+            self._koreanDescriptionIndex = None
+            self._contentHash = None
             return True
         return False
     
@@ -523,9 +620,9 @@ class NamePart:
         Returns:
             해당 값의 한국어 설명, 값이 존재하지 않으면 빈 문자열
         """
-        if inValue in self._predefinedValues:
-            index = self._predefinedValues.index(inValue)
-            return self._koreanDescriptions[index]
+        slot = self._valueIndex.get(inValue)
+        if slot is not None:
+            return self._koreanDescriptionColumn[slot]
         return ""
     
     def get_korean_descriptions(self):
@@ -535,7 +632,8 @@ class NamePart:
         Returns:
             한국어 설명 목록
         """
-        return self._koreanDescriptions.copy()
+        self._compact()
+        return self._koreanDescriptionColumn.copy()
     
     def get_value_by_korean_description(self, inKoreanDescription):
         """
@@ -547,9 +645,9 @@ class NamePart:
         Returns:
             해당 설명의 값, 없으면 빈 문자열
         """
-        if inKoreanDescription in self._koreanDescriptions:
-            index = self._koreanDescriptions.index(inKoreanDescription)
-            return self._predefinedValues[index]
+        slot = self._get_korean_description_index().get(inKoreanDescription)
+        if slot is not None:
+            return self._values[slot]
         return ""
     
     def get_value_with_korean_description(self, inIndex):
@@ -562,8 +660,9 @@ class NamePart:
         Returns:
             (값, 한국어 설명) 튜플, 인덱스가 범위를 벗어나면 (None, None)
         """
-        if 0 <= inIndex < len(self._predefinedValues):
-            return (self._predefinedValues[inIndex], self._koreanDescriptions[inIndex])
+        self._compact()
+        if 0 <= inIndex < len(self._values):
+            return (self._values[inIndex], self._koreanDescriptionColumn[inIndex])
         return (None, None)
     
     def get_values_with_korean_descriptions(self):
@@ -573,7 +672,8 @@ class NamePart:
         Returns:
             (값, 한국어 설명) 튜플의 리스트
         """
-        return list(zip(self._predefinedValues, self._koreanDescriptions))
+        self._compact()
+        return list(zip(self._values, self._koreanDescriptionColumn))
     
     def is_direction(self):
         """
@@ -584,6 +684,31 @@ class NamePart:
         """
         return self._isDirection
     
+    def set_direction(self, inIsDirection):
+        """
+        방향성 여부를 설정합니다.
+        
+        Args:
+            inIsDirection: 방향성 여부 (True/False)
+        """
+        self._isDirection = inIsDirection is True
+        self._contentHash = None
+    
+    def get_content_hash(self):
+        """
+        내용(이름, 타입, 값, 설명, 방향성)으로 계산한 해시를 반환합니다.
+        값을 바꾸는 메서드에서 캐시를 비우므로 내용이 바뀔 때만 다시 계산합니다.
+        
+        Returns:
+            SHA-1 16진수 문자열
+        """
+        if self._contentHash is None:
+            partData = self.to_dict()
+            del partData["weights"]  # 가중치는 값 순서에서 계산되므로 제외
+            encoded = json.dumps(partData, sort_keys=True, ensure_ascii=False).encode('utf-8')
+            self._contentHash = hashlib.sha1(encoded).hexdigest()
+        return self._contentHash
+    
     def to_dict(self):
         """
         NamePart 객체를 사전 형태로 변환합니다.
@@ -591,13 +716,14 @@ class NamePart:
         Returns:
             사전 형태의 NamePart 정보
         """
+        self._compact()
         return {
             "name": self._name,
-            "predefinedValues": self._predefinedValues.copy(),
-            "weights": self._weights.copy(),  # 가중치를 리스트 형태로 직접 전달
+            "predefinedValues": self._values.copy(),
+            "weights": self._weights,  # 위치에서 계산한 가중치 리스트
             "type": self._type.name if hasattr(self._type, 'name') else str(self._type),
-            "descriptions": self._descriptions.copy(),
-            "koreanDescriptions": self._koreanDescriptions.copy(), # Add korean descriptions
+            "descriptions": self._descriptionColumn.copy(),
+            "koreanDescriptions": self._koreanDescriptionColumn.copy(), # Add korean descriptions
             "isDirection": self._isDirection
         }
     
@@ -11,6 +11,8 @@ import os
 # Naming 클래스 임포트
 from JalLib.naming import Naming
 from JalLib.namePart import NamePartType
+from JalLib.pathIndex import PathIndex
+from JalLib.assetScanner import AssetScanner
 
 class NameToPath(Naming):
     """
@@ -30,6 +32,14 @@ class NameToPath(Naming):
             self.set_root_path(rootPath)
         # 소스 네이밍 객체 설정
         self.sourceNaming = sourceNaming
+        
+        # (소스 파트 위치, 경로 파트 위치, 값 -> 폴더 이름 테이블) 목록, 설정 쌍이 바뀌면 다시 생성
+        self._segmentTable = None
+        self._segmentTableKey = None
+        # 결합된 경로 -> 루트를 붙여 정규화한 최종 경로
+        self._finalPathCache = {}
+        # 루트 폴더의 파일 역색인 (get_path_index에서 생성)
+        self._pathIndex = None
     
     def set_root_path(self, inRootPath: str):
         """
@@ -49,9 +59,11 @@ class NameToPath(Naming):
                 raise ValueError(f"경로가 존재하지 않습니다: {normalized_path}")
             
             self.rootPath = normalized_path
+            self._finalPathCache = {}
             return self.rootPath
         else:
             self.rootPath = None
+            self._finalPathCache = {}
             return None
     
     def combine(self, inPartsDict={}, inFilChar=os.sep) -> str:
@@ -77,6 +89,35 @@ class NameToPath(Naming):
         return newName
                 
     
+    def _get_segment_table(self):
+        """
+        (파트, 값) -> 폴더 이름 테이블 가져오기 (소스/경로 설정 쌍마다 한 번 생성)
+        
+        :return: (소스 파트 위치, 경로 파트 위치, 값 -> 설명 딕셔너리 (RealName이면 None)) 튜플 리스트
+        """
+        key = (self.sourceNaming._get_parser(), self._get_parser())
+        if self._segmentTableKey is not None and self._segmentTableKey[0] is key[0] and self._segmentTableKey[1] is key[1]:
+            return self._segmentTable
+        
+        segmentTable = []
+        for sourceIndex, namePart in enumerate(self.sourceNaming._nameParts):
+            pathIndex = self.get_name_part_index(namePart.get_name())
+            if pathIndex < 0:
+                continue
+            if namePart.get_type() == NamePartType.REALNAME:
+                # 실제 이름인 경우, 해당 이름을 사용
+                segmentTable.append((sourceIndex, pathIndex, None))
+            else:
+                descriptions = {}
+                for value in namePart.get_predefined_values():
+                    descriptions.setdefault(value, namePart.get_description_by_value(value))
+                segmentTable.append((sourceIndex, pathIndex, descriptions))
+        
+        self._segmentTable = segmentTable
+        self._segmentTableKey = key
+        self._finalPathCache = {}
+        return segmentTable
+    
     def gen_path(self, inStr):
         """
         입력된 문자열을 기반으로 경로를 생성합니다.
@@ -87,26 +128,79 @@ class NameToPath(Naming):
         """
         if not self.rootPath:
             raise ValueError("루트 경로가 설정되지 않았습니다.")
-        
-        # 이름을 딕셔너리로 변환
-        nameDict = self.sourceNaming.convert_to_dictionary(inStr)
-        if not nameDict:
+        if not self.sourceNaming._nameParts:
             raise ValueError(f"이름을 변환할 수 없습니다: {inStr}")
-        print(f"Name Dictionary: {nameDict}")
         
-        pathDict = {}
+        return self.gen_paths([inStr])[0]
+    
+    def gen_paths(self, inNames, ensure_dirs=False):
+        """
+        여러 이름의 경로를 한 번에 생성합니다.
+        이름마다 한 번만 분석하며, 결과는 각 이름에 gen_path를 적용한 것과 같습니다.
+        
+        :param inNames: 경로를 생성할 이름 문자열 iterable
+        :param ensure_dirs: True이면 생성된 경로의 폴더를 만듭니다 (같은 폴더는 한 번만 생성, 기본값: False)
+        :return: 생성된 경로 문자열 리스트 (입력 순서 유지)
+        :raises ValueError: 루트 경로가 설정되지 않은 경우
+        """
+        if not self.rootPath:
+            raise ValueError("루트 경로가 설정되지 않았습니다.")
+        
+        segmentTable = self._get_segment_table()
+        finalPathCache = self._finalPathCache
+        partCount = len(self._nameParts)
+        createdDirs = set()
+        paths = []
         
-        # 선택된 NamePart 값들을 설명으로 변환하여 폴더 이름으로 사용
-        for key, value in nameDict.items():
-            namePart = self.sourceNaming.get_name_part(key)
-            if self.get_name_part(namePart.get_name()):
-                if namePart.get_type() == NamePartType.REALNAME:
-                    # 실제 이름인 경우, 해당 이름을 사용
-                    pathDict[key] = value
-                else:
-                    pathDict[key] = namePart.get_description_by_value(value)
+        for partValues, _ in self.sourceNaming._iter_parsed_rows(inNames):
+            pathArray = [""] * partCount
+            for sourceIndex, pathIndex, descriptions in segmentTable:
+                value = partValues[sourceIndex]
+                pathArray[pathIndex] = value if descriptions is None else descriptions.get(value, "")
+            
+            combinedPath = self._combine(pathArray, os.sep)
+            finalPath = finalPathCache.get(combinedPath)
+            if finalPath is None:
+                finalPath = os.path.normpath(os.path.join(self.rootPath, combinedPath))
+                finalPathCache[combinedPath] = finalPath
+            
+            if ensure_dirs and finalPath not in createdDirs:
+                os.makedirs(finalPath, exist_ok=True)
+                createdDirs.add(finalPath)
+            paths.append(finalPath)
+        
+        return paths
+    
+    def get_path_index(self, inCachePath: str = None, inRefresh: bool = True) -> PathIndex:
+        """
+        루트 폴더의 파일을 이름 파트로 검색하는 역색인을 가져옵니다 (gen_path의 역방향).
+        파일 이름은 sourceNaming(없으면 이 객체)으로 분석하며, 갱신 시 수정 시간이 바뀐 폴더만 다시 읽습니다.
         
-        combinedPath = self.combine(pathDict)
-        finalPath = os.path.join(self.rootPath, combinedPath)
+        :param inCachePath: 디스크 캐시 파일 경로 (기본값: None, 임시 폴더 아래 루트 경로별 파일)
+        :param inRefresh: 폴더 변경 사항을 확인하여 갱신할지 여부 (기본값: True)
+        :return: PathIndex 객체
+        :raises ValueError: 루트 경로가 설정되지 않은 경우
+        """
+        if not self.rootPath:
+            raise ValueError("루트 경로가 설정되지 않았습니다.")
+        
+        if self._pathIndex is None or self._pathIndex.rootPath != self.rootPath or (inCachePath and self._pathIndex.get_cache_path() != inCachePath):
+            self._pathIndex = PathIndex(self.rootPath, self.sourceNaming or self, inCachePath)
+        if inRefresh:
+            self._pathIndex.refresh()
+        return self._pathIndex
+    
+    def scan_assets(self, inWorkers: int = 8, inBatchSize: int = 1000):
+        """
+        루트 폴더 아래 파일을 스레드 풀로 검색하여 (경로, 이름 파트 딕셔너리, stat) 레코드를 스트리밍합니다.
+        파일 이름은 sourceNaming(없으면 이 객체)으로 inBatchSize개씩 묶어 분석합니다.
+        
+        :param inWorkers: 폴더를 읽을 스레드 개수 (기본값: 8)
+        :param inBatchSize: 한 번에 분석할 파일 이름 개수 (기본값: 1000)
+        :return: (파일 경로, {파트 이름: 값}, os.stat_result) 튜플 제너레이터
+        :raises ValueError: 루트 경로가 설정되지 않은 경우
+        """
+        if not self.rootPath:
+            raise ValueError("루트 경로가 설정되지 않았습니다.")
         
-        return os.path.normpath(finalPath)
+        return AssetScanner(self.sourceNaming or self, inWorkers, inBatchSize).scan(self.rootPath)
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+nameValidator 모듈 - 이름 검증 기능 제공
+이름 목록을 스트리밍으로 검사하여 문제 유형별 개수와 예시를 모은 보고서를 생성하는 클래스 구현
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from JalLib.naming import Naming
+from JalLib.namePart import NamePartType
+
+
+class NameValidator:
+    """
+    Naming 설정을 기준으로 이름을 검증하는 클래스.
+
+    이름을 하나씩 받아 검사하므로 장면 텍스트 덤프나 FBX 노드 목록처럼 큰 입력도
+    입력 전체가 아닌 고유한 이름 개수만큼의 메모리로 처리합니다.
+    문제 유형별 개수와 최대 inSampleLimit개의 예시만 보관합니다.
+    """
+
+    # 검사 항목
+    ISSUE_PART_ORDER = "partOrder"              # 파트 값이 설정 순서와 다르게 배치됨
+    ISSUE_UNKNOWN_PREFIX = "unknownPrefix"      # 접두 영역에 사전 정의되지 않은 토큰이 있음
+    ISSUE_UNKNOWN_SUFFIX = "unknownSuffix"      # 접미 영역에 사전 정의되지 않은 토큰이 있음
+    ISSUE_PADDING = "paddingMismatch"           # 인덱스 자릿수가 get_padding_num과 다름
+    ISSUE_DUPLICATE = "duplicateName"           # 같은 이름, 또는 인덱스가 없는 같은 이름 키가 이미 있음
+
+    ISSUES = (ISSUE_PART_ORDER, ISSUE_UNKNOWN_PREFIX, ISSUE_UNKNOWN_SUFFIX, ISSUE_PADDING, ISSUE_DUPLICATE)
+
+    def __init__(self, inNaming: Naming, inSampleLimit: int = 20):
+        """
+        NameValidator 초기화
+
+        Args:
+            inNaming: 검증 기준이 되는 Naming 객체
+            inSampleLimit: 문제 유형별로 보관할 최대 예시 개수 (기본값: 20)
+        """
+        self._naming = inNaming
+        self._sampleLimit = max(0, inSampleLimit)
+
+        # 검사용 토큰 -> 파트 순서 테이블 (Naming의 이름 분석기가 바뀌면 다시 생성)
+        self._parser = None
+        self._prefixParts = {}
+        self._suffixParts = {}
+
+        self._totalCount = 0
+        self._validCount = 0
+        self._issueCounts = {}
+        self._issueSamples = {}
+        self._nameCounts = {}
+        self._unindexedCounts = {}
+
+        self.reset()
+
+    def reset(self):
+        """
+        누적된 검사 결과 초기화
+        """
+        self._totalCount = 0
+        self._validCount = 0
+        self._issueCounts = {issue: 0 for issue in self.ISSUES}
+        self._issueSamples = {issue: [] for issue in self.ISSUES}
+        self._nameCounts = {}
+        self._unindexedCounts = {}
+
+    def _update_tables(self):
+        """
+        PREFIX/SUFFIX 값별로 해당 값을 가진 파트 순서 테이블 생성 (설정이 바뀐 경우에만)
+        """
+        parser = self._naming._get_parser()
+        if parser is self._parser:
+            return
+
+        self._prefixParts = {}
+        self._suffixParts = {}
+        for i, part in enumerate(self._naming._nameParts):
+            if part.get_type() == NamePartType.PREFIX:
+                table = self._prefixParts
+            elif part.get_type() == NamePartType.SUFFIX:
+                table = self._suffixParts
+            else:
+                continue
+            for value in part.get_predefined_values():
+                table.setdefault(value, []).append(i)
+        self._parser = parser
+
+    @staticmethod
+    def _is_ordered(inTokens: List[str], inPartTable: Dict[str, List[int]]) -> bool:
+        """
+        토큰들을 파트 순서가 증가하도록 배정할 수 있는지 확인 (가장 앞 파트부터 탐욕적으로 배정)
+
+        Args:
+            inTokens: 확인할 토큰 리스트 (모두 inPartTable에 있는 값)
+            inPartTable: 값 -> 파트 순서 리스트
+
+        Returns:
+            순서대로 배정할 수 있으면 True
+        """
+        prevOrder = -1
+        for token in inTokens:
+            nextOrder = None
+            for order in inPartTable[token]:
+                if order > prevOrder:
+                    nextOrder = order
+                    break
+            if nextOrder is None:
+                return False
+            prevOrder = nextOrder
+        return True
+
+    def check_name(self, inName: str) -> Dict[str, str]:
+        """
+        이름 하나를 검사 (중복 검사 제외, 누적 결과에 반영하지 않음)
+
+        접두 영역은 마지막 PREFIX 값 토큰까지, 접미 영역은 그 뒤의 첫 SUFFIX 값 토큰부터입니다.
+
+        Args:
+            inName: 검사할 이름 문자열
+
+        Returns:
+            {문제 유형: 상세 내용} 딕셔너리 (문제가 없으면 빈 딕셔너리)
+        """
+        self._update_tables()
+        issues = {}
+        tokens = self._naming._split_to_array(inName)
+
+        lastPrefix = -1
+        for i, token in enumerate(tokens):
+            if token in self._prefixParts:
+                lastPrefix = i
+        firstSuffix = len(tokens)
+        for i in range(lastPrefix + 1, len(tokens)):
+            if tokens[i] in self._suffixParts:
+                firstSuffix = i
+                break
+
+        prefixTokens = []
+        suffixTokens = []
+        misplacedTokens = []
+        unknownPrefixTokens = []
+        unknownSuffixTokens = []
+        for token in tokens[:lastPrefix + 1]:
+            if token in self._prefixParts:
+                prefixTokens.append(token)
+            elif token in self._suffixParts:
+                misplacedTokens.append(token)
+            elif not token.isdigit():
+                unknownPrefixTokens.append(token)
+        for token in tokens[firstSuffix:]:
+            if token in self._suffixParts:
+                suffixTokens.append(token)
+            elif not token.isdigit():
+                unknownSuffixTokens.append(token)
+
+        if misplacedTokens or not self._is_ordered(prefixTokens, self._prefixParts) or not self._is_ordered(suffixTokens, self._suffixParts):
+            issues[self.ISSUE_PART_ORDER] = " ".join(misplacedTokens or prefixTokens + suffixTokens)
+        if unknownPrefixTokens:
+            issues[self.ISSUE_UNKNOWN_PREFIX] = " ".join(unknownPrefixTokens)
+        if unknownSuffixTokens:
+            issues[self.ISSUE_UNKNOWN_SUFFIX] = " ".join(unknownSuffixTokens)
+
+        # 인덱스 자릿수 검사 (패딩 규칙으로 다시 만든 문자열과 비교)
+        indexOrder = self._naming.get_name_part_index("Index")
+        if indexOrder >= 0:
+            indexStr = self._naming._classify(inName)[0][indexOrder]
+            if indexStr.isdigit() and indexStr != self._naming.convert_digit_into_padding_string(indexStr):
+                issues[self.ISSUE_PADDING] = f"{indexStr} (padding {self._naming.get_padding_num()})"
+
+        return issues
+
+    def feed(self, inName: str) -> Dict[str, str]:
+        """
+        이름 하나를 검사하고 누적 결과에 반영
+
+        Args:
+            inName: 검사할 이름 문자열
+
+        Returns:
+            {문제 유형: 상세 내용} 딕셔너리 (문제가 없으면 빈 딕셔너리)
+        """
+        issues = self.check_name(inName)
+
+        # 인덱스와 관계없이 이미 검사한 이름과 완전히 같으면 중복
+        nameCount = self._nameCounts.get(inName, 0) + 1
+        self._nameCounts[inName] = nameCount
+        if nameCount > 1:
+            issues[self.ISSUE_DUPLICATE] = f"{inName} x{nameCount}"
+
+        # 인덱스가 없는 이름은 인덱스를 제외한 이름 키가 같아도 중복
+        if self._naming.get_index_as_digit(inName) is False:
+            key = self._naming.get_string(inName)
+            count = self._unindexedCounts.get(key, 0) + 1
+            self._unindexedCounts[key] = count
+            if count > 1:
+                issues[self.ISSUE_DUPLICATE] = f"{key} x{count}"
+
+        self._totalCount += 1
+        if not issues:
+            self._validCount += 1
+        for issue, detail in issues.items():
+            self._issueCounts[issue] += 1
+            samples = self._issueSamples[issue]
+            if len(samples) < self._sampleLimit:
+                samples.append({"name": inName, "detail": detail})
+
+        return issues
+
+    def validate(self, inNames: Iterable[str]) -> Dict[str, object]:
+        """
+        이름 목록을 순서대로 검사하고 보고서 반환 (이전 결과에 누적)
+
+        Args:
+            inNames: 검사할 이름 문자열 iterable (제너레이터 가능)
+
+        Returns:
+            get_report 결과 딕셔너리
+        """
+        for name in inNames:
+            self.feed(name)
+        return self.get_report()
+
+    def get_report(self) -> Dict[str, object]:
+        """
+        누적된 검사 결과 보고서 반환
+
+        Returns:
+            {"total", "valid", "issues": {문제 유형: {"count", "samples"}}} 딕셔너리
+        """
+        return {
+            "total": self._totalCount,
+            "valid": self._validCount,
+            "issues": {
+                issue: {"count": self._issueCounts[issue], "samples": list(self._issueSamples[issue])}
+                for issue in self.ISSUES
+            },
+        }
+
+    def format_report(self, inReport: Optional[Dict[str, object]] = None) -> str:
+        """
+        보고서를 텍스트로 변환
+
+        Args:
+            inReport: 변환할 보고서 (기본값: None, 현재 누적 결과)
+
+        Returns:
+            문제 유형별 개수와 예시를 담은 문자열
+        """
+        report = inReport if inReport is not None else self.get_report()
+        lines = [f"total: {report['total']}  valid: {report['valid']}"]
+        for issue, result in report["issues"].items():
+            if not result["count"]:
+                continue
+            lines.append(f"{issue}: {result['count']}")
+            for sample in result["samples"]:
+                lines.append(f"    {sample['name']}  ({sample['detail']})")
+        return "\n".join(lines)
+
+    @staticmethod
+    def iter_names_from_file(inFilePath: str, inEncoding: str = "utf-8") -> Iterator[str]:
+        """
+        텍스트 덤프 파일에서 한 줄에 하나씩 이름 읽기 (빈 줄 제외)
+
+        Args:
+            inFilePath: 텍스트 파일 경로
+            inEncoding: 파일 인코딩 (기본값: "utf-8")
+
+        Yields:
+            이름 문자열
+        """
+        with open(inFilePath, "r", encoding=inEncoding) as f:
+            for line in f:
+                name = line.strip()
+                if name:
+                    yield name
@@ -8,12 +8,19 @@ NamePart 객체를 기반으로 조직화된 이름 생성 및 분석 기능 구
 
 import os
 import re
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional, Union, Tuple
 
 # NamePart와 NamingConfig 임포트
 from JalLib.namePart import NamePart, NamePartType
-from JalLib.namingConfig import NamingConfig
+from JalLib.namingConfig import NamingConfig, CompiledNamingConfig
+from JalLib.nameParser import NameParser, NameParseCache
+
+# 구분자별 토큰화 정규식 (모듈 로드 시 한 번만 컴파일)
+_SPACE_TOKEN_PATTERN = re.compile(r"[^ ]+")
+_UNDERSCORE_TOKEN_PATTERN = re.compile(r"[^_]+")
+# 구분자가 없는 ASCII 이름: 대문자로 시작하는 조각마다 (문자부분, 끝의 숫자부분)
+_CAMEL_TOKEN_PATTERN = re.compile(r"([A-Z]?[^A-Z]*?)([0-9]*)(?=[A-Z]|\Z)")
 
 class Naming:
     """
@@ -37,6 +44,18 @@ class Naming:
         # 기본 namePart 초기화 (각 부분에 사전 정의 값 직접 설정)
         self._nameParts = []
         
+        # 컴파일된 이름 분석기 (nameParts가 바뀌면 다시 생성)
+        self._parser = None
+        
+        # 공유 중인 불변 설정 스냅샷 (수정 시 복사 후 None)
+        self._compiledConfig = None
+        
+        # get_mutable_name_part로 내준 NamePart -> 이름 분석기 생성 시점의 내용 해시
+        self._mutableParts = {}
+        
+        # 파싱 결과 LRU 캐시 (설정 지문 + 이름으로 키 생성)
+        self._parseCache = NameParseCache()
+        
         # Prefix 부분 (PREFIX 타입)
         prefixPart = NamePart("Prefix", NamePartType.PREFIX, ["Pr"], ["Prefix"])
         
@@ -181,10 +200,39 @@ class Naming:
         """
         return any(char.isdigit() for char in inStr)
 
+    def _split_by_upper_case_and_digit(self, inStr):
+        """
+        대문자로 시작하는 부분으로 분할한 뒤 각 부분의 끝 숫자를 분리
+        (유니코드 대문자/숫자 규칙을 그대로 따르는 문자 단위 처리)
+        
+        Args:
+            inStr: 분할할 문자열
+            
+        Returns:
+            분할된 문자열 리스트
+        """
+        resultArray = self._filter_by_upper_case(inStr)
+        tempArray = []
+        
+        for item in resultArray:
+            if self._has_digit(item):
+                stringPart, digitPart = self._split_into_string_and_digit(item)
+                if stringPart:
+                    tempArray.append(stringPart)
+                if digitPart:
+                    tempArray.append(digitPart)
+            else:
+                tempArray.append(item)
+                
+        return tempArray
+
     def _split_to_array(self, inStr):
         """
         문자열을 구분자 또는 대문자로 분할하고 숫자 부분도 분리
         
+        구분자별로 미리 컴파일된 정규식 하나로 토큰화합니다.
+        ASCII가 아닌 이름은 유니코드 대소문자 규칙을 지키기 위해 문자 단위로 처리합니다.
+        
         Args:
             inStr: 분할할 문자열
             
@@ -193,25 +241,15 @@ class Naming:
         """
         filChar = self._get_filtering_char(inStr)
         
-        if not filChar:
-            # 구분자가 없을 경우 대문자로 분할
-            resultArray = self._filter_by_upper_case(inStr)
-            tempArray = []
-            
-            for item in resultArray:
-                if self._has_digit(item):
-                    stringPart, digitPart = self._split_into_string_and_digit(item)
-                    if stringPart:
-                        tempArray.append(stringPart)
-                    if digitPart:
-                        tempArray.append(digitPart)
-                else:
-                    tempArray.append(item)
-                    
-            return tempArray
-        else:
-            # 구분자가 있을 경우 구분자로 분할
-            return self._filter_by_filtering_char(inStr)
+        if filChar == " ":
+            return _SPACE_TOKEN_PATTERN.findall(inStr)
+        if filChar == "_":
+            return _UNDERSCORE_TOKEN_PATTERN.findall(inStr)
+        
+        # 구분자가 없을 경우 대문자로 분할 (줄바꿈이 있으면 기존 숫자 분리 규칙과 달라지므로 제외)
+        if inStr.isascii() and "\n" not in inStr:
+            return [token for match in _CAMEL_TOKEN_PATTERN.findall(inStr) for token in match if token]
+        return self._split_by_upper_case_and_digit(inStr)
 
     def _remove_empty_string_in_array(self, inArray):
         """
@@ -246,6 +284,68 @@ class Naming:
             
         return inFilChar.join(refinedArray)
 
+    def _get_parser(self):
+        """
+        현재 nameParts로 컴파일된 이름 분석기 가져오기 (없으면 생성)
+        
+        Returns:
+            NameParser 객체
+        """
+        # 내준 NamePart가 실제로 바뀐 경우에만 다시 컴파일 (내용 해시는 NamePart에 캐시됨)
+        if self._parser is not None:
+            for part, partHash in self._mutableParts.items():
+                if part.get_content_hash() != partHash:
+                    self._parser = None
+                    break
+        if self._parser is None:
+            self._parser = NameParser(self._nameParts)
+            self._parseCache.clear()
+            self._mutableParts = {part: part.get_content_hash() for part in self._mutableParts}
+        return self._parser
+
+    def _classify(self, inStr):
+        """
+        문자열을 한 번만 토큰화하여 파트별 값과 RealName으로 분류
+        같은 설정에서 같은 이름은 파싱 캐시에서 가져옴
+        
+        Args:
+            inStr: 처리할 문자열
+            
+        Returns:
+            (파트별 get_name 결과 튜플, RealName 문자열) 튜플
+        """
+        parser = self._get_parser()
+        cacheKey = (parser.get_fingerprint(), inStr)
+        result = self._parseCache.get(cacheKey)
+        if result is None:
+            result = parser.classify(self._split_to_array(inStr), self._get_filtering_char(inStr))
+            self._parseCache.put(cacheKey, result)
+        return result
+
+    def get_parse_cache_info(self):
+        """
+        파싱 캐시 상태 가져오기
+        
+        Returns:
+            {"hits", "misses", "size", "maxSize"} 딕셔너리
+        """
+        return self._parseCache.get_info()
+
+    def set_parse_cache_size(self, inMaxSize):
+        """
+        파싱 캐시의 최대 항목 수 설정
+        
+        Args:
+            inMaxSize: 최대 항목 수 (0이면 캐시 사용 안 함)
+        """
+        self._parseCache.set_max_size(inMaxSize)
+
+    def clear_parse_cache(self):
+        """
+        파싱 캐시의 모든 항목과 적중/실패 횟수 초기화
+        """
+        self._parseCache.clear()
+
     # ---- Name 관련 메서드들 ----
     
     # 사전 정의 값 편집 메서드 제거 (namingConfig를 통해서만 변경 가능)
@@ -259,12 +359,12 @@ class Naming:
         """
         return self._paddingNum
 
-    def get_name_part(self, inNamePartName):
+    def _find_name_part(self, inNamePartName):
         """
-        namePart 이름으로 NamePart 객체 가져오기
+        namePart 이름으로 NamePart 객체 찾기 (내부 읽기 전용, 공유 스냅샷의 객체를 그대로 반환)
         
         Args:
-            namePart: 가져올 NamePart의 이름 ("Prefix", "RealName", "Suffix", "Index" 등)
+            inNamePartName: 찾을 NamePart의 이름
             
         Returns:
             해당 NamePart 객체, 존재하지 않으면 None
@@ -273,6 +373,52 @@ class Naming:
             if part.get_name() == inNamePartName:
                 return part
         return None
+
+    def get_name_part(self, inNamePartName):
+        """
+        namePart 이름으로 NamePart 객체 가져오기 (읽기 전용)
+        
+        공유 설정 스냅샷의 객체를 그대로 반환하므로 수정하지 말고, 수정할 때는 get_mutable_name_part를 사용합니다.
+        
+        Args:
+            namePart: 가져올 NamePart의 이름 ("Prefix", "RealName", "Suffix", "Index" 등)
+            
+        Returns:
+            해당 NamePart 객체, 존재하지 않으면 None
+        """
+        return self._find_name_part(inNamePartName)
+
+    def get_mutable_name_part(self, inNamePartName):
+        """
+        수정할 NamePart 객체 가져오기 (copy-on-write)
+        
+        공유 설정 스냅샷을 사용 중이면 처음 한 번만 이 Naming 전용 복사본으로 분리한 뒤 반환합니다.
+        반환한 NamePart의 내용이 실제로 바뀐 경우에만 다음 분석 시 이름 분석기를 다시 컴파일하고 파싱 캐시를 비웁니다.
+        
+        Args:
+            inNamePartName: 가져올 NamePart의 이름
+            
+        Returns:
+            해당 NamePart 객체, 존재하지 않으면 None
+        """
+        if self._compiledConfig is not None:
+            # 복사본은 스냅샷과 내용이 같으므로 스냅샷의 이름 분석기를 그대로 사용
+            self._nameParts = self._compiledConfig.thaw_name_parts()
+            self._compiledConfig = None
+            self._mutableParts = {}
+        part = self._find_name_part(inNamePartName)
+        if part is not None and part not in self._mutableParts:
+            self._mutableParts[part] = part.get_content_hash()
+        return part
+
+    def get_compiled_config(self):
+        """
+        공유 중인 불변 설정 스냅샷 가져오기
+        
+        Returns:
+            CompiledNamingConfig 객체, 설정 파일을 사용하지 않거나 수정된 경우 None
+        """
+        return self._compiledConfig
      
     def get_name_part_index(self, inNamePartName):
         """
@@ -299,7 +445,7 @@ class Naming:
         Returns:
             해당 NamePart의 사전 정의 값 리스트, 존재하지 않으면 빈 리스트
         """
-        partObj = self.get_name_part(inNamePartName)
+        partObj = self._find_name_part(inNamePartName)
         if partObj:
             return partObj.get_predefined_values()
         return []
@@ -315,7 +461,7 @@ class Naming:
         Returns:
             포함되어 있으면 True, 아니면 False
         """
-        partObj = self.get_name_part(inNamePartName)
+        partObj = self._find_name_part(inNamePartName)
         if not partObj:
             return False
         
@@ -341,7 +487,7 @@ class Naming:
         Returns:
             지정된 namePart에 해당하는 문자열
         """
-        partObj = self.get_name_part(inNamePartName)
+        partObj = self._find_name_part(inNamePartName)
         if not partObj:
             return ""
         
@@ -352,7 +498,7 @@ class Naming:
         partValues = partObj.get_predefined_values()
         
         if partType == NamePartType.PREFIX or partType == NamePartType.SUFFIX:
-            foundIndex = partObj._descriptions.index(inDescription)
+            foundIndex = partObj.get_descriptions().index(inDescription)
             if foundIndex >= 0:
                 return partValues[foundIndex]
         
@@ -363,7 +509,7 @@ class Naming:
         returnStr = ""
         
         # namePart 문자열 목록 가져오기
-        partObj = self.get_name_part(inNamePartName)
+        partObj = self._find_name_part(inNamePartName)
         if not partObj:
             return returnStr
         
@@ -371,19 +517,18 @@ class Naming:
         if not partType:
             return returnStr
             
-        partValues = partObj.get_predefined_values()
-        if partType != NamePartType.INDEX and partType != NamePartType.REALNAME and not partValues:
+        if partType != NamePartType.INDEX and partType != NamePartType.REALNAME and partObj.get_value_count() == 0:
             return returnStr
         
         if partType == NamePartType.PREFIX:
             for item in nameArray:
-                if item in partValues:
+                if partObj.contains_value(item):
                     returnStr = item
                     break
         
         if partType == NamePartType.SUFFIX:
             for i in range(len(nameArray) - 1, -1, -1):
-                if nameArray[i] in partValues:
+                if partObj.contains_value(nameArray[i]):
                     returnStr = nameArray[i]
                     break
                 
@@ -412,43 +557,12 @@ class Naming:
         Returns:
             지정된 namePart에 해당하는 문자열
         """
-        nameArray = self._split_to_array(inStr)
-        returnStr = ""
-        
-        partType = self.get_name_part(inNamePartName).get_type()
-        
-        foundName = self.pick_name(inNamePartName, inStr)
-        if foundName == "":
-            return returnStr
-        partIndex = self.get_name_part_index(inNamePartName)
-        foundIndex = nameArray.index(foundName)
-        
-        if partType == NamePartType.PREFIX:
-            if foundIndex >= 0:
-                prevNameParts = self._nameParts[:partIndex]
-                prevNames = [self.pick_name(part.get_name(), inStr) for part in prevNameParts]
-                prevNamesInNameArray = nameArray[:foundIndex]
-                for prevName in prevNames:
-                    if prevName in prevNamesInNameArray:
-                        prevNamesInNameArray.remove(prevName)
-                if len(prevNamesInNameArray) == 0 :
-                    returnStr = foundName
-        
-        if partType == NamePartType.SUFFIX:
-            if foundIndex >= 0:
-                nextNameParts = self._nameParts[partIndex + 1:]
-                nextNames = [self.pick_name(part.get_name(), inStr) for part in nextNameParts]
-                nextNamesInNameArray = nameArray[foundIndex + 1:]
-                for nextName in nextNames:
-                    if nextName in nextNamesInNameArray:
-                        nextNamesInNameArray.remove(nextName)
-                if len(nextNamesInNameArray) == 0 :
-                    returnStr = foundName
+        partType = self._find_name_part(inNamePartName).get_type()
+        if partType == NamePartType.REALNAME:
+            return ""
         
-        if partType == NamePartType.INDEX:
-            returnStr = self.pick_name(inNamePartName, inStr)
-                
-        return returnStr
+        partValues, _ = self._classify(inStr)
+        return partValues[self.get_name_part_index(inNamePartName)]
     
     def combine(self, inPartsDict={}, inFilChar=" "):
         """
@@ -486,24 +600,8 @@ class Naming:
         Returns:
             실제 이름 부분 문자열
         """
-        filChar = self._get_filtering_char(inStr)
-        nameArray = self._split_to_array(inStr)
-        
-        # 모든 nameParts 중 RealName이 아닌 것들의 값을 수집
-        nonRealNameArray = []
-        for part in self._nameParts:
-            partName = part.get_name()
-            partType = part.get_type()
-            if partType != NamePartType.REALNAME:
-                foundName = self.get_name(partName, inStr)
-                nonRealNameArray.append(foundName)
-        
-        for item in nonRealNameArray:
-            if item in nameArray:
-                nameArray.remove(item)
-                
-        # 구분자로 결합
-        return self._combine(nameArray, filChar)
+        _, realName = self._classify(inStr)
+        return realName
 
     def get_non_RealName(self, inStr):
         """
@@ -516,15 +614,13 @@ class Naming:
             실제 이름이 제외된 이름 문자열
         """
         filChar = self._get_filtering_char(inStr)
+        partValues, _ = self._classify(inStr)
         
         # 모든 nameParts 중 RealName이 아닌 것들의 값을 수집
         nonRealNameArray = []
-        for part in self._nameParts:
-            partName = part.get_name()
-            partType = part.get_type()
-            if partType != NamePartType.REALNAME:
-                foundName = self.get_name(partName, inStr)
-                nonRealNameArray.append(foundName)
+        for i, part in enumerate(self._nameParts):
+            if part.get_type() != NamePartType.REALNAME:
+                nonRealNameArray.append(partValues[i])
         
         return self._combine(nonRealNameArray, filChar)
                 
@@ -532,33 +628,21 @@ class Naming:
         """
         문자열 이름을 이름 부분 배열로 변환
         
+        토큰화는 한 번만 수행하고, 컴파일된 NameParser가
+        모든 PREFIX/SUFFIX/INDEX/REALNAME 슬롯을 한 번에 분류합니다.
+        
         Args:
             inStr: 변환할 이름 문자열
             
         Returns:
             이름 부분 배열 (Base, Type, Side, FrontBack, RealName, Index, Nub 등)
         """
-        returnArray = [""] * len(self._nameParts)
-        
-        # 각 namePart에 대해 처리
-        for i, part in enumerate(self._nameParts):
-            partName = part.get_name()
-            
-            # 특수 케이스인 RealName은 마지막에 처리하기 위해 저장
-            if partName == "RealName":
-                realNameIndex = i
-                continue
-                
-            # get_name 메소드를 사용하여 해당 부분 추출
-            partValue = self.get_name(partName, inStr)
-            returnArray[i] = partValue
-        
-        # 마지막으로 RealName 처리 (다른 모든 부분을 찾은 후에 수행해야 함)
-        if 'realNameIndex' in locals():
-            realNameStr = self.get_RealName(inStr)
-            returnArray[realNameIndex] = realNameStr
-        
-        return returnArray
+        partValues, realName = self._classify(inStr)
+        nameArray = list(partValues)
+        realNameSlot = self._get_parser().get_real_name_slot()
+        if realNameSlot >= 0:
+            nameArray[realNameSlot] = realName
+        return nameArray
     
     def convert_to_dictionary(self, inStr):
         """
@@ -571,26 +655,151 @@ class Naming:
             이름 부분 딕셔너리 (키: namePart 이름, 값: 추출된 값)
             예: {"Base": "b", "Type": "P", "Side": "L", "RealName": "Arm", ...}
         """
+        partValues, realName = self._classify(inStr)
         returnDict = {}
         
-        # 각 namePart에 대해 처리
-        for part in self._nameParts:
+        # 각 namePart에 대해 처리 (RealName은 마지막에 추가)
+        for i, part in enumerate(self._nameParts):
             partName = part.get_name()
-            
-            # 특수 케이스인 RealName은 마지막에 처리하기 위해 저장
             if partName == "RealName":
                 continue
-                
-            # get_name 메소드를 사용하여 해당 부분 추출
-            partValue = self.get_name(partName, inStr)
-            returnDict[partName] = partValue
+            returnDict[partName] = partValues[i]
         
-        # 마지막으로 RealName 처리 (다른 모든 부분을 찾은 후에 수행해야 함)
-        realNameStr = self.get_RealName(inStr)
-        returnDict["RealName"] = realNameStr
+        returnDict["RealName"] = realName
         
         return returnDict
     
+    def _iter_parsed_rows(self, inNames):
+        """
+        이름들을 순서대로 분석하여 (이름 부분 튜플, 구분자) 행을 생성
+        한 번의 호출 안에서 같은 이름은 다시 분석하지 않음
+        
+        Args:
+            inNames: 분석할 이름 문자열 iterable
+            
+        Yields:
+            (convert_name_to_array와 같은 순서의 이름 부분 튜플, 구분자 문자) 튜플
+        """
+        parser = self._get_parser()
+        realNameSlot = parser.get_real_name_slot()
+        memo = {}
+        memoLimit = 65536  # 스트리밍 입력에서 메모리 사용량 제한
+        
+        for name in inNames:
+            row = memo.get(name)
+            if row is None:
+                if len(memo) >= memoLimit:
+                    memo.clear()
+                filChar = self._get_filtering_char(name)
+                partValues, realName = parser.classify(self._split_to_array(name), filChar)
+                if realNameSlot >= 0:
+                    partValues = partValues[:realNameSlot] + (realName,) + partValues[realNameSlot + 1:]
+                row = (partValues, filChar)
+                memo[name] = row
+            yield row
+    
+    def _rows_to_columns(self, inRows):
+        """
+        분석된 행 리스트를 열 단위 딕셔너리로 변환
+        
+        Args:
+            inRows: _iter_parsed_rows가 생성한 행 리스트
+            
+        Returns:
+            {namePart 이름: 값 리스트, ..., "FilteringChar": 구분자 리스트} 딕셔너리
+        """
+        partNames = self._get_parser().get_part_names()
+        if inRows:
+            partColumns = [list(column) for column in zip(*[row[0] for row in inRows])]
+        else:
+            partColumns = [[] for _ in partNames]
+        
+        columns = dict(zip(partNames, partColumns))
+        columns["FilteringChar"] = [row[1] for row in inRows]
+        return columns
+    
+    def parse_many(self, inNames, inWorkers=1, inChunkSize=None):
+        """
+        여러 이름을 한 번에 분석하여 열 단위(columnar) 결과로 반환
+        
+        이름마다 딕셔너리를 만드는 convert_to_dictionary 대신,
+        namePart마다 하나의 리스트를 만들어 대량 분석 시 할당을 줄입니다.
+        
+        inWorkers가 2 이상이면 이름 목록을 청크로 나누어 프로세스 풀에서 분석합니다.
+        컴파일된 설정은 작업 프로세스마다 초기화할 때 한 번만 전달하고, 결과는 입력 순서대로 합칩니다.
+        FBX 덤프 재검증 같은 오프라인 작업용이며, 3ds Max 안에서는 새 프로세스가 3ds Max로 실행되므로
+        사용하지 않습니다 (inWorkers=1).
+        
+        Args:
+            inNames: 분석할 이름 문자열 iterable
+            inWorkers: 작업 프로세스 개수 (기본값: 1, 현재 프로세스에서 분석)
+            inChunkSize: 작업 하나에 보낼 이름 개수 (기본값: None, 작업 프로세스당 4개 청크)
+            
+        Returns:
+            {namePart 이름: 값 리스트, ..., "FilteringChar": 구분자 리스트} 딕셔너리
+            각 리스트의 i번째 값은 inNames의 i번째 이름에 해당 (inWorkers와 관계없이 같은 결과)
+            예: {"Base": ["b", ""], "Side": ["L", "R"], ..., "FilteringChar": ["_", " "]}
+        """
+        if inWorkers <= 1:
+            return self._rows_to_columns(list(self._iter_parsed_rows(inNames)))
+        
+        names = inNames if isinstance(inNames, list) else list(inNames)
+        chunkSize = inChunkSize or max(1000, -(-len(names) // (inWorkers * 4)))
+        if len(names) <= chunkSize:
+            return self._rows_to_columns(list(self._iter_parsed_rows(names)))
+        
+        compiled = self._compiledConfig
+        if compiled is None:
+            compiled = CompiledNamingConfig.get_shared(self._nameParts, self._paddingNum)
+        
+        chunks = [names[i:i + chunkSize] for i in range(0, len(names), chunkSize)]
+        columns = None
+        with ProcessPoolExecutor(max_workers=min(inWorkers, len(chunks)), initializer=_init_parse_worker, initargs=(compiled,)) as executor:
+            # map은 제출 순서대로 결과를 돌려주므로 병합 순서가 입력 순서와 같음
+            for chunkColumns in executor.map(_parse_chunk, chunks):
+                if columns is None:
+                    columns = chunkColumns
+                else:
+                    for key, values in chunkColumns.items():
+                        columns[key].extend(values)
+        return columns
+    
+    def iter_parse_many(self, inNames, inChunkSize=10000):
+        """
+        스트리밍 입력을 청크 단위로 분석하여 열 단위 결과를 차례로 반환
+        
+        Args:
+            inNames: 분석할 이름 문자열 iterable (제너레이터 가능)
+            inChunkSize: 한 번에 반환할 이름 개수 (기본값: 10000)
+            
+        Yields:
+            parse_many와 같은 형식의 열 단위 딕셔너리 (청크 하나당 하나)
+        """
+        chunkSize = max(1, inChunkSize)
+        rows = []
+        for row in self._iter_parsed_rows(inNames):
+            rows.append(row)
+            if len(rows) >= chunkSize:
+                yield self._rows_to_columns(rows)
+                rows = []
+        if rows:
+            yield self._rows_to_columns(rows)
+    
+    def parse_name(self, inStr):
+        """
+        문자열 이름을 ParsedName 객체로 변환
+        
+        반환된 객체의 편집 메서드(with_part, bump_index, mirrored 등)는
+        다시 파싱하지 않으므로, 여러 단계의 이름 변경을 한 번의 파싱으로 처리할 수 있습니다.
+        
+        Args:
+            inStr: 변환할 이름 문자열
+            
+        Returns:
+            ParsedName 객체
+        """
+        return ParsedName(self, tuple(self.convert_name_to_array(inStr)), self._get_filtering_char(inStr), self._paddingNum)
+    
     def convert_to_description(self, inStr):
         """
         문자열 이름을 설명으로 변환
@@ -607,7 +816,7 @@ class Naming:
         descName = inStr
         if nameDic:
             for namePartName, value in nameDic.items():
-                namePart = self.get_name_part(namePartName)
+                namePart = self._find_name_part(namePartName)
                 desc = namePart.get_description_by_value(value)
 
                 if desc == "" and value != "":
@@ -635,7 +844,7 @@ class Naming:
         korDescName = inStr
         if nameDic:
             for namePartName, value in nameDic.items():
-                namePart = self.get_name_part(namePartName)
+                namePart = self._find_name_part(namePartName)
                 desc = namePart.get_description_by_value(value)
                 korDesc = namePart.get_korean_description_by_value(value)
 
@@ -867,9 +1076,36 @@ class Naming:
                 
         return False
 
+    def _iter_index_sort_keys(self, inNames):
+        """
+        이름마다 한 번만 분석하여 (인덱스를 제외한 이름, 인덱스 숫자) 정렬 키 생성
+        
+        Args:
+            inNames: 이름 문자열 iterable
+            
+        Yields:
+            (get_string 결과, get_index_as_digit 결과 (인덱스가 없으면 0)) 튜플
+        """
+        indexOrder = self.get_name_part_index("Index")
+        
+        for partValues, filChar in self._iter_parsed_rows(inNames):
+            index = 0
+            indexStr = partValues[indexOrder] if indexOrder >= 0 else ""
+            if indexStr:
+                try:
+                    index = int(indexStr)
+                except ValueError:
+                    pass
+            
+            # get_string과 같이 인덱스 부분만 비운 이름
+            stringArray = list(partValues)
+            if indexOrder >= 0:
+                stringArray[indexOrder] = ""
+            yield (self._combine(stringArray, filChar), index)
+
     def sort_by_index(self, inNameArray):
         """
-        이름 배열을 인덱스 기준으로 정렬
+        이름 배열을 인덱스 기준으로 정렬 (인덱스가 같으면 원래 순서 유지)
         
         Args:
             inNameArray: 정렬할 이름 배열
@@ -879,34 +1115,36 @@ class Naming:
         """
         if not inNameArray:
             return []
-            
-        # 정렬을 위한 보조 클래스 정의
-        @dataclass
-        class IndexSorting:
-            oriIndex: int
-            newIndex: int
-                
-        # 각 이름의 인덱스를 추출하여 정렬 정보 생성
-        structArray = []
         
-        for i, name in enumerate(inNameArray):
-            tempIndex = self.get_index_as_digit(name)
-            
-            if tempIndex is False:
-                structArray.append(IndexSorting(i, 0))
-            else:
-                structArray.append(IndexSorting(i, tempIndex))
-                
-        # 인덱스 기준으로 정렬
-        structArray.sort(key=lambda x: x.newIndex)
+        indices = [index for _, index in self._iter_index_sort_keys(inNameArray)]
+        order = sorted(range(len(inNameArray)), key=indices.__getitem__)
+        
+        return [inNameArray[i] for i in order]
+
+    def sort_by_index_key(self, inItems, inKey=None):
+        """
+        임의의 객체를 이름의 (인덱스를 제외한 이름, 인덱스 숫자) 기준으로 정렬
         
-        # 정렬된 순서로 결과 배열 생성
-        sortedNameArray = []
-        for struct in structArray:
-            sortedNameArray.append(inNameArray[struct.oriIndex])
+        이름마다 한 번만 분석하는 decorate-sort-undecorate 방식이며,
+        키가 같은 항목은 원래 순서를 유지합니다 (안정 정렬). 이름이 중복되어도 객체를 그대로 돌려줍니다.
+        
+        Args:
+            inItems: 정렬할 객체 iterable
+            inKey: 객체에서 이름 문자열을 가져오는 함수 (기본값: None, 객체 자체를 이름으로 사용)
             
-        return sortedNameArray
-    
+        Returns:
+            정렬된 객체 리스트
+        """
+        items = list(inItems)
+        if not items:
+            return []
+        
+        names = items if inKey is None else [inKey(item) for item in items]
+        decorated = [(sortKey, i) for i, sortKey in enumerate(self._iter_index_sort_keys(names))]
+        decorated.sort()
+        
+        return [items[i] for _, i in decorated]
+
     def get_string(self, inStr):
         """
         인덱스 부분을 제외한 이름 문자열 가져오기
@@ -921,9 +1159,10 @@ class Naming:
         nameArray = self.convert_name_to_array(inStr)
         indexOrder = self.get_name_part_index("Index")
         
-        # 인덱스 부분 제거
+        # 인덱스 부분 제거 (Index 파트가 없는 설정이면 그대로)
         returnNameArray = nameArray.copy()
-        returnNameArray[indexOrder] = ""
+        if indexOrder >= 0:
+            returnNameArray[indexOrder] = ""
         
         return self._combine(returnNameArray, filChar)
 
@@ -933,6 +1172,7 @@ class Naming:
         
         이름에서 Side와 FrontBack namePart를 자동으로 검색하고,
         발견된 값의 semanticmapping weight와 가장 차이가 큰 값으로 교체합니다.
+        반대 값은 설정 로드 시 NameParser가 미리 계산한 테이블에서 가져옵니다.
         
         Args:
             inStr: 처리할 이름 문자열
@@ -940,21 +1180,23 @@ class Naming:
         Returns:
             미러링된 이름 문자열
         """
-        nameArray = self.convert_name_to_array(inStr)
-            
-        for part in self._nameParts:
-            partName = part.get_name()
-            partType = part.get_type()
-            if (partType != NamePartType.REALNAME or partType != NamePartType.INDEX) and part.is_direction():
-                partIndex = self.get_name_part_index(partName)
-                foundName = self.get_name(partName, inStr)
-                opositeName = part.get_most_different_weight_value(foundName)
-                if opositeName and foundName != opositeName:
-                    nameArray[partIndex] = opositeName
+        nameArray = self._get_parser().mirror(self.convert_name_to_array(inStr))
+        return self._combine(nameArray, self._get_filtering_char(inStr))
+
+    def gen_mirroring_names(self, inNames):
+        """
+        여러 이름의 미러링된 이름을 한 번에 생성
         
-        returnName = self._combine(nameArray, self._get_filtering_char(inStr))
+        이름마다 한 번만 파싱하며, 결과는 각 이름에 gen_mirroring_name을 적용한 것과 같습니다.
         
-        return returnName
+        Args:
+            inNames: 처리할 이름 문자열 iterable
+            
+        Returns:
+            미러링된 이름 문자열 리스트 (입력 순서 유지)
+        """
+        parser = self._get_parser()
+        return [self._combine(parser.mirror(partValues), filChar) for partValues, filChar in self._iter_parsed_rows(inNames)]
 
     def replace_filtering_char(self, inStr, inNewFilChar):
         """
@@ -1033,14 +1275,12 @@ class Naming:
             print("설정 파일 경로가 제공되지 않았습니다.")
             return False
             
-        # NamingConfig 인스턴스 생성 및 설정 로드
-        config = NamingConfig()
-        if config.load(configPath):
-            # 설정을 Naming 인스턴스에 적용
-            result = config.apply_to_naming(self)
-            if result:
-                self._configPath = configPath  # 성공적으로 로드한 경로 저장
-            return result
+        # 설정 로드 캐시를 통해 공유 스냅샷을 가져와 적용 (같은 파일은 한 번만 분석)
+        compiled = NamingConfig.load_compiled(configPath)
+        if compiled is not None:
+            compiled.apply_to_naming(self)
+            self._configPath = configPath  # 성공적으로 로드한 경로 저장
+            return True
         else:
             print(f"설정 파일 로드 실패: {configPath}")
             return False
@@ -1064,3 +1304,237 @@ class Naming:
             설정 파일 경로 (없으면 빈 문자열)
         """
         return self._configPath or ""
+
+
+# parse_many 작업 프로세스에서 사용하는 Naming (초기화 함수에서 한 번만 생성)
+_workerNaming = None
+
+
+def _init_parse_worker(inCompiled):
+    """
+    parse_many 작업 프로세스 초기화 (컴파일된 설정을 한 번만 받아 Naming 생성)
+    
+    Args:
+        inCompiled: CompiledNamingConfig 객체
+    """
+    global _workerNaming
+    _workerNaming = Naming()
+    CompiledNamingConfig.register(inCompiled).apply_to_naming(_workerNaming)
+
+
+def _parse_chunk(inNames):
+    """
+    작업 프로세스에서 이름 청크 하나를 분석
+    
+    Args:
+        inNames: 이름 문자열 리스트
+        
+    Returns:
+        parse_many와 같은 형식의 열 단위 딕셔너리
+    """
+    return _workerNaming._rows_to_columns(list(_workerNaming._iter_parsed_rows(inNames)))
+
+
+class ParsedName:
+    """
+    파싱된 이름을 표현하는 불변 값 객체.
+    
+    namePart별 값, 구분자 문자, 인덱스 패딩을 보관하며
+    편집 메서드는 다시 파싱하지 않고 새 ParsedName을 반환합니다.
+    str()은 Naming._combine 규칙으로 이름 문자열을 만듭니다.
+    """
+    
+    __slots__ = ("_naming", "_values", "_filChar", "_paddingNum")
+    
+    def __init__(self, inNaming, inValues, inFilChar="_", inPaddingNum=None):
+        """
+        ParsedName 초기화
+        
+        Args:
+            inNaming: 이름 규칙을 제공하는 Naming 객체
+            inValues: convert_name_to_array와 같은 순서의 이름 부분 값 튜플
+            inFilChar: 구분자 문자 (기본값: "_")
+            inPaddingNum: 인덱스 패딩 자릿수 (기본값: None, Naming의 패딩 사용)
+        """
+        self._naming = inNaming
+        self._values = tuple(inValues)
+        self._filChar = inFilChar
+        self._paddingNum = inPaddingNum if inPaddingNum is not None else inNaming.get_padding_num()
+    
+    def _replace(self, inValues=None, inFilChar=None, inPaddingNum=None):
+        """
+        일부 속성만 바꾼 새 ParsedName 생성
+        
+        Returns:
+            새 ParsedName 객체
+        """
+        return ParsedName(
+            self._naming,
+            self._values if inValues is None else inValues,
+            self._filChar if inFilChar is None else inFilChar,
+            self._paddingNum if inPaddingNum is None else inPaddingNum
+        )
+    
+    def _part_index(self, inPartName):
+        """
+        namePart 이름의 위치 가져오기
+        
+        Raises:
+            KeyError: 존재하지 않는 namePart인 경우
+        """
+        partIndex = self._naming.get_name_part_index(inPartName)
+        if partIndex < 0:
+            raise KeyError(inPartName)
+        return partIndex
+    
+    def get(self, inPartName):
+        """
+        namePart 값 가져오기
+        
+        Args:
+            inPartName: namePart 이름
+            
+        Returns:
+            해당 namePart 값, 존재하지 않는 namePart면 빈 문자열
+        """
+        partIndex = self._naming.get_name_part_index(inPartName)
+        return self._values[partIndex] if partIndex >= 0 else ""
+    
+    def get_filtering_char(self):
+        """
+        구분자 문자 가져오기
+        
+        Returns:
+            구분자 문자
+        """
+        return self._filChar
+    
+    def get_index_padding(self):
+        """
+        인덱스 패딩 자릿수 가져오기
+        
+        Returns:
+            인덱스 패딩 자릿수
+        """
+        return self._paddingNum
+    
+    def to_array(self):
+        """
+        이름 부분 배열로 변환 (convert_name_to_array와 같은 형식)
+        
+        Returns:
+            이름 부분 값 리스트
+        """
+        return list(self._values)
+    
+    def to_dictionary(self):
+        """
+        이름 부분 딕셔너리로 변환
+        
+        Returns:
+            {namePart 이름: 값} 딕셔너리
+        """
+        return {part.get_name(): self._values[i] for i, part in enumerate(self._naming._nameParts)}
+    
+    def with_part(self, inPartName, inValue):
+        """
+        namePart 값을 바꾼 새 ParsedName 반환
+        
+        Args:
+            inPartName: 바꿀 namePart 이름
+            inValue: 새 값
+            
+        Returns:
+            새 ParsedName 객체
+            
+        Raises:
+            KeyError: 존재하지 않는 namePart인 경우
+        """
+        partIndex = self._part_index(inPartName)
+        values = list(self._values)
+        values[partIndex] = inValue
+        return self._replace(inValues=tuple(values))
+    
+    def without_part(self, inPartName):
+        """
+        namePart 값을 비운 새 ParsedName 반환
+        
+        Args:
+            inPartName: 제거할 namePart 이름
+            
+        Returns:
+            새 ParsedName 객체
+        """
+        return self.with_part(inPartName, "")
+    
+    def bump_index(self, inAmount=1):
+        """
+        인덱스 값을 증가시킨 새 ParsedName 반환 (Naming.increase_index와 같은 규칙)
+        인덱스가 없으면 -1에서 시작하며, 결과가 음수면 0으로 설정
+        
+        Args:
+            inAmount: 증가시킬 값 (기본값: 1)
+            
+        Returns:
+            새 ParsedName 객체
+        """
+        partIndex = self._part_index("Index")
+        indexStr = self._values[partIndex]
+        indexNum = int(indexStr) if indexStr.isdigit() else -1
+        indexNum = max(indexNum + inAmount, 0)
+        return self.with_part("Index", str(indexNum))
+    
+    def with_filtering_char(self, inFilChar):
+        """
+        구분자 문자를 바꾼 새 ParsedName 반환
+        
+        Args:
+            inFilChar: 새 구분자 문자
+            
+        Returns:
+            새 ParsedName 객체
+        """
+        return self._replace(inFilChar=inFilChar)
+    
+    def with_index_padding(self, inPaddingNum):
+        """
+        인덱스 패딩 자릿수를 바꾼 새 ParsedName 반환
+        
+        Args:
+            inPaddingNum: 새 패딩 자릿수
+            
+        Returns:
+            새 ParsedName 객체
+        """
+        return self._replace(inPaddingNum=inPaddingNum)
+    
+    def mirrored(self):
+        """
+        방향성 namePart(Side, FrontBack 등)를 반대 값으로 바꾼 새 ParsedName 반환
+        (Naming.gen_mirroring_name과 같은 규칙)
+        
+        Returns:
+            새 ParsedName 객체
+        """
+        return self._replace(inValues=tuple(self._naming._get_parser().mirror(self._values)))
+    
+    def __str__(self):
+        """
+        Naming._combine 규칙으로 이름 문자열 생성 (인덱스는 패딩 적용)
+        """
+        values = list(self._values)
+        partIndex = self._naming.get_name_part_index("Index")
+        if partIndex >= 0 and values[partIndex].isdigit():
+            values[partIndex] = self._naming.convert_digit_into_padding_string(values[partIndex], self._paddingNum)
+        return self._naming._combine(values, self._filChar)
+    
+    def __repr__(self):
+        return f"ParsedName({str(self)!r})"
+    
+    def __eq__(self, inOther):
+        if not isinstance(inOther, ParsedName):
+            return NotImplemented
+        return self._values == inOther._values and self._filChar == inOther._filChar and self._paddingNum == inOther._paddingNum
+    
+    def __hash__(self):
+        return hash((self._values, self._filChar, self._paddingNum))
@@ -9,12 +9,336 @@ NamePart 객체를 기반으로 네이밍 설정을 저장하고 불러오는 
 import json
 import os
 import copy
+import hashlib
+import pickle
+import weakref
 from typing import List, Dict, Any, Optional, Union
 import csv # Import the csv module
 
 
 # NamePart 클래스 임포트
 from JalLib.namePart import NamePart, NamePartType
+from JalLib.nameParser import NameParser
+
+
+# 컴파일된 설정 파일 형식 (NamePart/NameParser 구조가 바뀌면 버전을 올려 이전 파일을 무시)
+ARTIFACT_FORMAT = "JalLib.NamingConfig"
+ARTIFACT_VERSION = 3
+ARTIFACT_EXTENSION = ".compiled"
+
+
+class CompiledNamingConfig:
+    """
+    NamingConfig의 불변 컴파일 스냅샷.
+    
+    같은 내용의 설정은 하나의 스냅샷을 공유하며, 여러 Naming 인스턴스가 NamePart 객체와
+    NameParser를 복사 없이 참조합니다. 수정이 필요한 경우에만 thaw_name_parts로 복사합니다 (copy-on-write).
+    내용으로 계산한 키를 기준으로 비교/해시가 가능하므로 캐시 키로 사용할 수 있습니다.
+    """
+    
+    __slots__ = ("_nameParts", "_paddingNum", "_parser", "_key", "_hash", "__weakref__")
+    
+    # 내용 키 -> 스냅샷 (사용하는 곳이 없어지면 자동으로 제거)
+    _registry = weakref.WeakValueDictionary()
+    
+    def __init__(self, inNameParts: List[NamePart], inPaddingNum: int, inKey: Optional[tuple] = None):
+        """
+        CompiledNamingConfig 초기화 (NamePart는 한 번만 복사)
+        
+        Args:
+            inNameParts: 스냅샷으로 만들 NamePart 객체 리스트
+            inPaddingNum: 인덱스 패딩 자릿수
+            inKey: 미리 계산한 내용 키 (기본값: None, 새로 계산)
+        """
+        self._nameParts = tuple(copy.deepcopy(inNameParts))
+        self._paddingNum = inPaddingNum
+        self._parser = NameParser(list(self._nameParts))
+        self._key = inKey if inKey is not None else self.make_key(inNameParts, inPaddingNum)
+        self._hash = hash(self._key)
+    
+    @staticmethod
+    def make_key(inNameParts: List[NamePart], inPaddingNum: int) -> tuple:
+        """
+        설정 내용으로 비교/해시 가능한 키 생성
+        
+        Args:
+            inNameParts: NamePart 객체 리스트
+            inPaddingNum: 인덱스 패딩 자릿수
+            
+        Returns:
+            설정 내용을 담은 튜플
+        """
+        partKeys = []
+        for part in inNameParts:
+            partData = part.to_dict()
+            partKeys.append((
+                partData["name"],
+                partData["type"],
+                partData["isDirection"],
+                tuple(partData["predefinedValues"]),
+                tuple(partData["descriptions"]),
+                tuple(partData["koreanDescriptions"]),
+                tuple(partData["weights"]),
+            ))
+        return (inPaddingNum, tuple(partKeys))
+    
+    @classmethod
+    def get_shared(cls, inNameParts: List[NamePart], inPaddingNum: int) -> "CompiledNamingConfig":
+        """
+        같은 내용의 공유 스냅샷 가져오기 (없으면 생성)
+        
+        Args:
+            inNameParts: NamePart 객체 리스트
+            inPaddingNum: 인덱스 패딩 자릿수
+            
+        Returns:
+            CompiledNamingConfig 객체
+        """
+        key = cls.make_key(inNameParts, inPaddingNum)
+        compiled = cls._registry.get(key)
+        if compiled is None:
+            compiled = cls(inNameParts, inPaddingNum, key)
+            cls._registry[key] = compiled
+        return compiled
+    
+    @classmethod
+    def register(cls, inCompiled: "CompiledNamingConfig") -> "CompiledNamingConfig":
+        """
+        외부에서 만든 스냅샷(컴파일된 설정 파일에서 복원 등)을 공유 목록에 등록
+        
+        Args:
+            inCompiled: 등록할 CompiledNamingConfig 객체
+            
+        Returns:
+            같은 내용으로 이미 등록된 스냅샷이 있으면 그 스냅샷, 없으면 inCompiled
+        """
+        compiled = cls._registry.get(inCompiled._key)
+        if compiled is None:
+            compiled = inCompiled
+            cls._registry[compiled._key] = compiled
+        return compiled
+    
+    def __getstate__(self):
+        return (self._nameParts, self._paddingNum, self._parser, self._key)
+    
+    def __setstate__(self, inState):
+        # 문자열 해시는 프로세스마다 다르므로 다시 계산
+        self._nameParts, self._paddingNum, self._parser, self._key = inState
+        self._hash = hash(self._key)
+    
+    def get_name_parts(self) -> List[NamePart]:
+        """
+        공유 NamePart 리스트 반환 (리스트만 새로 만들고 NamePart 객체는 공유)
+        
+        Returns:
+            NamePart 객체 리스트 (읽기 전용으로 사용)
+        """
+        return list(self._nameParts)
+    
+    def thaw_name_parts(self) -> List[NamePart]:
+        """
+        수정 가능한 NamePart 복사본 반환
+        
+        Returns:
+            깊은 복사된 NamePart 객체 리스트
+        """
+        return copy.deepcopy(list(self._nameParts))
+    
+    def get_padding_num(self) -> int:
+        """
+        인덱스 패딩 자릿수 반환
+        
+        Returns:
+            패딩 자릿수
+        """
+        return self._paddingNum
+    
+    def get_parser(self) -> NameParser:
+        """
+        스냅샷으로 컴파일된 이름 분석기 반환
+        
+        Returns:
+            NameParser 객체
+        """
+        return self._parser
+    
+    def get_key(self) -> tuple:
+        """
+        설정 내용 키 반환
+        
+        Returns:
+            설정 내용을 담은 튜플
+        """
+        return self._key
+    
+    def apply_to_naming(self, naming_instance):
+        """
+        스냅샷을 Naming 인스턴스에 참조로 적용 (수정 시에만 Naming에서 복사)
+        
+        Args:
+            naming_instance: 설정을 적용할 Naming 클래스 인스턴스
+        """
+        naming_instance._compiledConfig = self
+        naming_instance._nameParts = self.get_name_parts()
+        naming_instance._mutableParts = {}
+        naming_instance._paddingNum = self._paddingNum
+        
+        # 스냅샷에서 컴파일된 이름 분석기 공유, 이전 설정의 파싱 캐시 무효화
+        naming_instance._parser = self._parser
+        naming_instance._parseCache.clear()
+    
+    def __eq__(self, other):
+        if not isinstance(other, CompiledNamingConfig):
+            return NotImplemented
+        return self is other or self._key == other._key
+    
+    def __hash__(self):
+        return self._hash
+    
+    def __repr__(self):
+        partNames = [part.get_name() for part in self._nameParts]
+        return f"CompiledNamingConfig(parts={partNames}, paddingNum={self._paddingNum})"
+
+
+class ConfigLoadCache:
+    """
+    프로세스 전체에서 공유하는 설정 파일 로드 캐시.
+    
+    (절대 경로, 수정 시간, 파일 크기)를 키로 JSON 분석과 검증이 끝난 설정을 보관합니다.
+    파일이 바뀌면 키가 달라지므로 다음 로드에서 다시 읽습니다.
+    보관한 NamePart는 외부에 직접 노출하지 않으며, 로드할 때 복사본을 돌려줍니다.
+    """
+    
+    def __init__(self):
+        """
+        ConfigLoadCache 초기화
+        """
+        # 절대 경로 -> {"key", "paddingNum", "nameParts", "compiled"}
+        self._entries = {}
+        self._hits = 0
+        self._misses = 0
+    
+    @staticmethod
+    def make_key(inFilePath: str) -> tuple:
+        """
+        파일의 캐시 키 생성
+        
+        Args:
+            inFilePath: 설정 파일 경로
+            
+        Returns:
+            (절대 경로, 수정 시간(ns), 파일 크기) 튜플
+        """
+        absPath = os.path.normcase(os.path.abspath(inFilePath))
+        stat = os.stat(absPath)
+        return (absPath, stat.st_mtime_ns, stat.st_size)
+    
+    def get(self, inFilePath: str) -> Optional[Dict[str, Any]]:
+        """
+        파일의 캐시 항목 가져오기
+        
+        Args:
+            inFilePath: 설정 파일 경로
+            
+        Returns:
+            캐시 항목 딕셔너리, 없거나 파일이 바뀌었으면 None
+        """
+        try:
+            key = self.make_key(inFilePath)
+        except OSError:
+            self._misses += 1
+            return None
+        entry = self._entries.get(key[0])
+        if entry is None or entry["key"] != key:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry
+    
+    def put(self, inFilePath: str, inKey: tuple, inPaddingNum: int, inNameParts: Optional[List[NamePart]] = None,
+            inCompiled: Optional[CompiledNamingConfig] = None) -> Dict[str, Any]:
+        """
+        분석과 검증이 끝난 설정을 캐시에 저장
+        
+        Args:
+            inFilePath: 설정 파일 경로
+            inKey: 파일을 읽기 전에 make_key로 계산한 키
+            inPaddingNum: 인덱스 패딩 자릿수 (설정 파일에 없으면 None)
+            inNameParts: 타입 업데이트까지 끝난 NamePart 객체 리스트 (복사하여 보관)
+            inCompiled: 이미 만들어진 컴파일 스냅샷 (기본값: None, 있으면 inNameParts 대신 스냅샷의 NamePart 사용)
+            
+        Returns:
+            저장된 캐시 항목 딕셔너리
+        """
+        entry = {
+            "key": inKey,
+            "paddingNum": inPaddingNum,
+            "nameParts": inCompiled.get_name_parts() if inCompiled is not None else copy.deepcopy(inNameParts),
+            "compiled": inCompiled,
+        }
+        self._entries[inKey[0]] = entry
+        return entry
+    
+    def get_compiled(self, inEntry: Dict[str, Any]) -> CompiledNamingConfig:
+        """
+        캐시 항목의 공유 컴파일 스냅샷 가져오기 (처음 요청 시 생성)
+        
+        Args:
+            inEntry: get 또는 put으로 얻은 캐시 항목
+            
+        Returns:
+            CompiledNamingConfig 객체
+        """
+        if inEntry["compiled"] is None:
+            paddingNum = inEntry["paddingNum"] if inEntry["paddingNum"] is not None else 2
+            inEntry["compiled"] = CompiledNamingConfig.get_shared(inEntry["nameParts"], paddingNum)
+        return inEntry["compiled"]
+    
+    def invalidate(self, inFilePath: Optional[str] = None):
+        """
+        캐시 항목 제거
+        
+        Args:
+            inFilePath: 제거할 설정 파일 경로 (기본값: None, 모든 항목 제거)
+        """
+        if inFilePath is None:
+            self._entries.clear()
+            return
+        self._entries.pop(os.path.normcase(os.path.abspath(inFilePath)), None)
+    
+    def reset_stats(self):
+        """
+        적중/실패 횟수 초기화
+        """
+        self._hits = 0
+        self._misses = 0
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        캐시 상태 반환
+        
+        Returns:
+            {"hits", "misses", "size"} 딕셔너리
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._entries),
+        }
+
+
+# 프로세스 전체에서 공유하는 설정 로드 캐시
+_configLoadCache = ConfigLoadCache()
+
+
+def get_config_load_cache() -> ConfigLoadCache:
+    """
+    프로세스 전체에서 공유하는 설정 로드 캐시 가져오기
+    
+    Returns:
+        ConfigLoadCache 객체
+    """
+    return _configLoadCache
 
 
 class NamingConfig:
@@ -393,6 +717,8 @@ class NamingConfig:
         특정 NamePart의 사전 정의 값을 CSV 파일로 설정
         CSV 파일 형식: value,description,koreanDescription (각 줄당)
         
+        같은 값이 여러 줄에 있으면 처음 줄을 사용합니다 (설명이 다르면 충돌로 출력).
+        
         Args:
             part_name: NamePart 이름
             csv_file_path: CSV 파일 경로
@@ -400,58 +726,123 @@ class NamingConfig:
         Returns:
             설정 성공 여부 (True/False)
         """
-        part = self.get_part(part_name)
-        if not part:
-            print(f"오류: '{part_name}' NamePart가 존재하지 않습니다.")
-            return False
+        report = self.import_part_values_from_csv({part_name: csv_file_path}, keep_first=True)
+        return report["success"]
+    
+    def import_part_values_from_csv(self, sources: Dict[str, Union[str, List[str]]],
+                                    replace: bool = True, keep_first: bool = False,
+                                    encoding: str = "utf-8-sig") -> Dict[str, Any]:
+        """
+        여러 CSV 파일을 여러 NamePart의 사전 정의 값으로 한 번에 가져오기
+        CSV 파일 형식: value,description,koreanDescription (각 줄당)
         
-        # REALNAME이나 INDEX 타입은 사전 정의 값 설정 불가
-        if part.is_realname() or part.is_index():
-            print(f"오류: {part_name} 부분은 {part.get_type().name} 타입이므로 사전 정의 값을 설정할 수 없습니다.")
-            return False
+        각 파일은 한 줄씩 읽으며, 값 -> (설명, 한국어 설명) 딕셔너리로 중복을 제거합니다.
+        같은 값의 설명이 다르면 충돌로 모아서 보고하고, 모든 파트의 검사가 끝난 뒤에만
+        파트별로 한 번에 적용합니다. 하나라도 실패하면 어떤 파트도 바뀌지 않습니다.
         
-        # CSV 파일에서 값, 설명, 한국어 설명 읽기
-        values = []
-        descriptions = []
-        korean_descriptions = []
-        try:
-            with open(csv_file_path, 'r', encoding='utf-8', newline='') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) >= 3: # Ensure row has at least 3 columns
-                        value = row[0].strip()
-                        description = row[1].strip()
-                        korean_description = row[2].strip()
-                        if value: # Skip empty values
-                            values.append(value)
-                            descriptions.append(description if description else value) # Use value if description is empty
-                            korean_descriptions.append(korean_description if korean_description else value) # Use value if korean_description is empty
-                    elif len(row) == 2: # Handle case with value and description only
-                        value = row[0].strip()
-                        description = row[1].strip()
-                        if value:
-                            values.append(value)
-                            descriptions.append(description if description else value)
-                            korean_descriptions.append(value) # Use value as korean description
-                    elif len(row) == 1: # Handle case with value only
-                        value = row[0].strip()
-                        if value:
-                            values.append(value)
-                            descriptions.append(value)
-                            korean_descriptions.append(value)
-
-            if not values:
-                print(f"오류: CSV 파일 '{csv_file_path}'에서 유효한 값을 찾을 수 없습니다.")
-                return False
-
-            # 값, 설명, 한국어 설명 설정
-            return self.set_part_values(part_name, values, descriptions, korean_descriptions)
-        except FileNotFoundError:
-            print(f"오류: CSV 파일을 찾을 수 없습니다: {csv_file_path}")
-            return False
-        except Exception as e:
-            print(f"오류: CSV 파일을 읽는 중 오류 발생: {e}")
-            return False
+        Args:
+            sources: {NamePart 이름: CSV 파일 경로 또는 경로 리스트} 딕셔너리
+            replace: True면 기존 값을 가져온 값으로 교체, False면 기존 값 뒤에 새 값만 추가 (기본값: True)
+            keep_first: True면 충돌이 있어도 처음 나온 설명으로 적용 (기본값: False, 충돌 시 적용하지 않음)
+            encoding: CSV 파일 인코딩 (기본값: "utf-8-sig")
+            
+        Returns:
+            {"success": 적용 여부,
+             "parts": {파트 이름: {"rows", "values", "added", "duplicates"}},
+             "conflicts": [{"part", "value", "variants": [{"description", "koreanDescription", "source"}]}],
+             "errors": [오류 메시지]} 딕셔너리
+        """
+        report = {"success": False, "parts": {}, "conflicts": [], "errors": []}
+        staged = {}
+        
+        for part_name, csv_file_paths in sources.items():
+            part = self.get_part(part_name)
+            if not part:
+                report["errors"].append(f"오류: '{part_name}' NamePart가 존재하지 않습니다.")
+                continue
+            if part.is_realname() or part.is_index():
+                report["errors"].append(f"오류: {part_name} 부분은 {part.get_type().name} 타입이므로 사전 정의 값을 설정할 수 없습니다.")
+                continue
+            if isinstance(csv_file_paths, str):
+                csv_file_paths = [csv_file_paths]
+            
+            # 값 -> (설명, 한국어 설명, 출처 파일, 줄 번호) (딕셔너리 삽입 순서 = 처음 나온 순서)
+            entries = {}
+            if not replace:
+                for value, description, korean_description in zip(part.get_predefined_values(), part.get_descriptions(), part.get_korean_descriptions()):
+                    entries.setdefault(value, (description, korean_description, "config", 0))
+            existing_count = len(entries)
+            
+            # 값 -> 서로 다른 항목 리스트 (충돌한 값만)
+            conflicts = {}
+            row_count = 0
+            duplicate_count = 0
+            error_count = len(report["errors"])
+            for csv_file_path in csv_file_paths:
+                try:
+                    with open(csv_file_path, 'r', encoding=encoding, newline='') as f:
+                        reader = csv.reader(f)
+                        for row in reader:
+                            # 설명이나 한국어 설명이 비어 있으면 값을 설명으로 사용 (빈 값은 건너뜀)
+                            value = row[0].strip() if row else ""
+                            if not value:
+                                continue
+                            row_count += 1
+                            description = (row[1].strip() if len(row) >= 2 else "") or value
+                            korean_description = (row[2].strip() if len(row) >= 3 else "") or value
+                            entry = entries.get(value)
+                            if entry is None:
+                                entries[value] = (description, korean_description, csv_file_path, reader.line_num)
+                                continue
+                            duplicate_count += 1
+                            if entry[0] == description and entry[1] == korean_description:
+                                continue
+                            variants = conflicts.setdefault(value, [entry])
+                            if all(variant[:2] != (description, korean_description) for variant in variants):
+                                variants.append((description, korean_description, csv_file_path, reader.line_num))
+                except (OSError, UnicodeDecodeError, csv.Error) as e:
+                    report["errors"].append(f"오류: CSV 파일을 읽는 중 오류 발생: {csv_file_path} ({e})")
+            
+            if row_count == 0 and len(report["errors"]) == error_count:
+                report["errors"].append(f"오류: CSV 파일 '{', '.join(csv_file_paths)}'에서 유효한 값을 찾을 수 없습니다.")
+            
+            for value, variants in conflicts.items():
+                report["conflicts"].append({
+                    "part": part_name,
+                    "value": value,
+                    "variants": [
+                        {"description": d, "koreanDescription": k, "source": f"{src}:{line}" if line else src}
+                        for d, k, src, line in variants
+                    ],
+                })
+            report["parts"][part_name] = {
+                "rows": row_count,
+                "values": len(entries),
+                "added": len(entries) - existing_count,
+                "duplicates": duplicate_count,
+            }
+            staged[part] = entries
+        
+        if report["conflicts"]:
+            print(f"경고: 같은 값에 서로 다른 설명이 있는 항목 {len(report['conflicts'])}개")
+            for conflict in report["conflicts"][:10]:
+                variants = ", ".join(f"{v['description']}/{v['koreanDescription']} ({v['source']})" for v in conflict["variants"])
+                print(f"    {conflict['part']}.{conflict['value']}: {variants}")
+            if not keep_first:
+                report["errors"].append(f"오류: 설명이 충돌하는 값이 {len(report['conflicts'])}개 있어 적용하지 않았습니다.")
+        
+        if report["errors"]:
+            for error in report["errors"]:
+                print(error)
+            return report
+        
+        # 모든 검사를 통과한 경우에만 파트별로 한 번에 적용
+        for part, entries in staged.items():
+            descriptions = [entry[0] for entry in entries.values()]
+            korean_descriptions = [entry[1] for entry in entries.values()]
+            part.set_predefined_values(list(entries), descriptions, korean_descriptions)
+        report["success"] = True
+        return report
     
     def add_part_value(self, part_name: str, value: str, 
                        description: Optional[str] = None, 
@@ -708,7 +1099,13 @@ class NamingConfig:
             with open(save_path, 'w', encoding='utf-8') as f:
                 json.dump(save_data, f, indent=4, ensure_ascii=False)
             
+            # 같은 경로의 설정 로드 캐시 무효화
+            _configLoadCache.invalidate(save_path)
             self.config_file_path = save_path
+            
+            # 컴파일된 설정 파일이 있으면 새 내용으로 다시 컴파일
+            if os.path.isfile(self.get_artifact_path(save_path)):
+                self.compile_artifact(save_path)
             return True
         except Exception as e:
             print(f"설정 저장 중 오류 발생: {e}")
@@ -728,45 +1125,23 @@ class NamingConfig:
         
         try:
             if os.path.exists(load_path):
-                with open(load_path, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
-                
-                # 필수 키가 있는지 확인
-                if "nameParts" not in loaded_data:
-                    print("경고: 설정 파일에 필수 키 'nameParts'가 없습니다.")
+                entry = _configLoadCache.get(load_path) or self._parse_entry(load_path)
+                if entry is None:
                     return False
                 
-                # paddingNum 불러오기
-                if "paddingNum" in loaded_data:
-                    self.padding_num = loaded_data["paddingNum"]
-                
-                # 파트 순서 불러오기
-                if "partOrder" in loaded_data:
-                    self.part_order = loaded_data["partOrder"]
-                else:
-                    # 없으면 기본 순서 생성
-                    self.part_order = [part_data["name"] for part_data in loaded_data["nameParts"]]
-                
-                # NamePart 객체 리스트 생성
-                new_parts = []
-                for part_data in loaded_data["nameParts"]:
-                    part = NamePart.from_dict(part_data)
-                    new_parts.append(part)
-                
                 # 필수 NamePart가 포함되어 있는지 확인
-                part_names = [part.get_name() for part in new_parts]
+                part_names = [part.get_name() for part in entry["nameParts"]]
                 for required_name in self.required_parts:
                     if required_name not in part_names:
                         print(f"경고: 필수 NamePart '{required_name}'가 설정에 포함되어 있지 않습니다.")
                         return False
                 
-                # 모든 확인이 통과되면 데이터 업데이트
-                self.name_parts = new_parts
+                # 모든 확인이 통과되면 데이터 업데이트 (캐시 항목은 공유되므로 복사본 사용)
+                if entry["paddingNum"] is not None:
+                    self.padding_num = entry["paddingNum"]
+                self.name_parts = copy.deepcopy(entry["nameParts"])
                 self.config_file_path = load_path
-                
-                # 순서에 따라 타입 업데이트
-                self._update_part_types_based_on_order()
-                self._update_part_order()  # 순서 업데이트
+                self._update_part_order()
                 return True
             else:
                 print(f"설정 파일을 찾을 수 없습니다: {load_path}")
@@ -775,6 +1150,171 @@ class NamingConfig:
             print(f"설정 로드 중 오류 발생: {e}")
             return False
     
+    def _parse_entry(self, load_path: str) -> Optional[Dict[str, Any]]:
+        """
+        JSON 파일을 분석하고 검증하여 설정 로드 캐시에 저장
+        
+        Args:
+            load_path: 불러올 파일 경로
+            
+        Returns:
+            캐시 항목 딕셔너리, 설정 파일이 유효하지 않으면 None
+        """
+        # 읽기 전에 키를 계산 (읽는 중 파일이 바뀌면 다음 로드에서 다시 읽음)
+        key = ConfigLoadCache.make_key(load_path)
+        with open(load_path, 'rb') as f:
+            raw_data = f.read()
+        
+        # 내용 해시가 같은 컴파일된 설정 파일이 있으면 JSON 분석 없이 사용
+        artifact = self._read_artifact(load_path, hashlib.sha256(raw_data).hexdigest())
+        if artifact is not None:
+            return _configLoadCache.put(load_path, key, artifact["paddingNum"], inCompiled=artifact["compiled"])
+        
+        loaded_data = json.loads(raw_data.decode('utf-8'))
+        
+        # 필수 키가 있는지 확인
+        if "nameParts" not in loaded_data:
+            print("경고: 설정 파일에 필수 키 'nameParts'가 없습니다.")
+            return None
+        
+        # NamePart 객체 리스트 생성 후 순서에 따라 타입 업데이트
+        loaded_config = copy.copy(self)
+        loaded_config.name_parts = [NamePart.from_dict(part_data) for part_data in loaded_data["nameParts"]]
+        loaded_config._update_part_types_based_on_order()
+        
+        # paddingNum이 없으면 None으로 보관 (불러오는 인스턴스의 값 유지)
+        return _configLoadCache.put(load_path, key, loaded_data.get("paddingNum"), loaded_config.name_parts)
+    
+    @staticmethod
+    def load_compiled(file_path: str, required_parts: Optional[List[str]] = None) -> Optional[CompiledNamingConfig]:
+        """
+        설정 파일을 불러와 공유 컴파일 스냅샷으로 반환 (설정 로드 캐시 사용)
+        
+        캐시 적중 시 NamePart 복사 없이 같은 스냅샷을 돌려줍니다.
+        
+        Args:
+            file_path: 불러올 파일 경로
+            required_parts: 필수 namePart 목록 (기본값: None, ["RealName"])
+            
+        Returns:
+            CompiledNamingConfig 객체, 로드 실패 시 None
+        """
+        try:
+            entry = _configLoadCache.get(file_path)
+            if entry is None:
+                if not os.path.exists(file_path):
+                    print(f"설정 파일을 찾을 수 없습니다: {file_path}")
+                    return None
+                entry = NamingConfig()._parse_entry(file_path)
+                if entry is None:
+                    return None
+        except Exception as e:
+            print(f"설정 로드 중 오류 발생: {e}")
+            return None
+        
+        part_names = [part.get_name() for part in entry["nameParts"]]
+        for required_name in (required_parts or ["RealName"]):
+            if required_name not in part_names:
+                print(f"경고: 필수 NamePart '{required_name}'가 설정에 포함되어 있지 않습니다.")
+                return None
+        return _configLoadCache.get_compiled(entry)
+    
+    @staticmethod
+    def get_artifact_path(file_path: str) -> str:
+        """
+        설정 파일에 대응하는 컴파일된 설정 파일 경로 반환
+        
+        Args:
+            file_path: JSON 설정 파일 경로
+            
+        Returns:
+            같은 폴더, 같은 이름의 ARTIFACT_EXTENSION 파일 경로
+        """
+        return os.path.splitext(file_path)[0] + ARTIFACT_EXTENSION
+    
+    @staticmethod
+    def _read_artifact(file_path: str, source_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        컴파일된 설정 파일 읽기 (없거나, 버전이 다르거나, 원본 내용 해시가 다르면 None)
+        
+        Args:
+            file_path: JSON 설정 파일 경로
+            source_hash: 현재 JSON 파일 내용의 SHA-256 해시
+            
+        Returns:
+            {"paddingNum", "compiled"} 딕셔너리, 사용할 수 없으면 None
+        """
+        artifact_path = NamingConfig.get_artifact_path(file_path)
+        if not os.path.isfile(artifact_path):
+            return None
+        try:
+            with open(artifact_path, 'rb') as f:
+                artifact = pickle.load(f)
+            if (not isinstance(artifact, dict) or artifact.get("format") != ARTIFACT_FORMAT
+                    or artifact.get("version") != ARTIFACT_VERSION or artifact.get("sourceHash") != source_hash):
+                return None
+            return {
+                "paddingNum": artifact["paddingNum"],
+                "compiled": CompiledNamingConfig.register(artifact["compiled"]),
+            }
+        except Exception as e:
+            print(f"컴파일된 설정 파일을 사용할 수 없어 JSON을 불러옵니다: {e}")
+            return None
+    
+    def compile_artifact(self, file_path: Optional[str] = None, artifact_path: Optional[str] = None) -> Optional[str]:
+        """
+        JSON 설정 파일을 검증하여 컴파일된 설정 파일(pickle)로 저장
+        
+        NamePart의 값/설명 색인, 이름 분석기(값 집합, 미러링 테이블)와 설정 내용 키를 함께 저장하며,
+        원본 JSON의 내용 해시가 바뀌면 로드 시 자동으로 JSON을 사용합니다.
+        
+        Args:
+            file_path: 컴파일할 JSON 파일 경로 (기본값: self.config_file_path 또는 self.default_file_path)
+            artifact_path: 저장할 파일 경로 (기본값: None, get_artifact_path 결과)
+            
+        Returns:
+            저장된 파일 경로, 실패 시 None
+        """
+        load_path = file_path or self.config_file_path or self.default_file_path
+        save_path = artifact_path or self.get_artifact_path(load_path)
+        
+        try:
+            with open(load_path, 'rb') as f:
+                raw_data = f.read()
+            
+            # 로드와 같은 검증을 거친 설정으로 컴파일
+            config = NamingConfig(required_parts=self.required_parts)
+            if not config.load(load_path):
+                return None
+            
+            artifact = {
+                "format": ARTIFACT_FORMAT,
+                "version": ARTIFACT_VERSION,
+                "sourceHash": hashlib.sha256(raw_data).hexdigest(),
+                "paddingNum": json.loads(raw_data.decode('utf-8')).get("paddingNum"),
+                "compiled": config.compile(),
+            }
+            
+            temp_path = save_path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, save_path)
+            return save_path
+        except Exception as e:
+            print(f"설정 컴파일 중 오류 발생: {e}")
+            return None
+    
+    def compile(self) -> CompiledNamingConfig:
+        """
+        현재 설정의 불변 컴파일 스냅샷 가져오기
+        
+        같은 내용의 설정은 NamingConfig 인스턴스가 달라도 같은 스냅샷을 공유합니다.
+        
+        Returns:
+            CompiledNamingConfig 객체
+        """
+        return CompiledNamingConfig.get_shared(self.name_parts, self.padding_num)
+    
     def apply_to_naming(self, naming_instance) -> bool:
         """
         설정을 Naming 인스턴스에 적용
@@ -786,12 +1326,8 @@ class NamingConfig:
             적용 성공 여부 (True/False)
         """
         try:
-            # NamePart 객체 리스트 복사하여 적용
-            naming_instance._nameParts = copy.deepcopy(self.name_parts)
-            
-            # paddingNum 설정
-            naming_instance._paddingNum = self.padding_num
-            
+            # 같은 내용의 공유 스냅샷을 참조로 적용 (수정 시에만 Naming에서 복사)
+            self.compile().apply_to_naming(naming_instance)
             return True
         except Exception as e:
             print(f"설정 적용 중 오류 발생: {e}")
@@ -841,4 +1377,300 @@ class NamingConfig:
         
         # 순서에 따라 타입 업데이트
         self._update_part_types_based_on_order()
-        return True
\ No newline at end of file
+        return True
+    
+    @staticmethod
+    def get_part_hash(part: NamePart) -> str:
+        """
+        NamePart 내용 해시 계산 (이름, 타입, 방향성, 값/설명 목록, 순서 포함)
+        
+        Args:
+            part: NamePart 객체
+            
+        Returns:
+            SHA-1 16진수 문자열 (NamePart에 캐시되어 내용이 바뀔 때만 다시 계산)
+        """
+        return part.get_content_hash()
+    
+    def get_part_hashes(self) -> Dict[str, str]:
+        """
+        모든 NamePart의 내용 해시 반환
+        
+        Returns:
+            {파트 이름: 내용 해시} 딕셔너리
+        """
+        return {part.get_name(): self.get_part_hash(part) for part in self.name_parts}
+    
+    @staticmethod
+    def _get_value_table(part: NamePart) -> Dict[str, tuple]:
+        """
+        NamePart의 값 -> (설명, 한국어 설명) 테이블 생성 (중복 값은 처음 항목 사용)
+        """
+        table = {}
+        for value, description, korean_description in zip(part.get_predefined_values(), part.get_descriptions(), part.get_korean_descriptions()):
+            table.setdefault(value, (description, korean_description))
+        return table
+    
+    @staticmethod
+    def _diff_part(old_part: NamePart, new_part: NamePart) -> Dict[str, Any]:
+        """
+        두 NamePart를 값 기준(keyed)으로 비교 (위치가 아닌 값으로 짝을 지음)
+        
+        Returns:
+            {"type", "isDirection", "added", "removed", "changed", "reordered"} 딕셔너리
+        """
+        old_table = NamingConfig._get_value_table(old_part)
+        new_table = NamingConfig._get_value_table(new_part)
+        
+        changed = {}
+        for value, old_entry in old_table.items():
+            new_entry = new_table.get(value)
+            if new_entry is None or new_entry == old_entry:
+                continue
+            fields = {}
+            if old_entry[0] != new_entry[0]:
+                fields["description"] = (old_entry[0], new_entry[0])
+            if old_entry[1] != new_entry[1]:
+                fields["koreanDescription"] = (old_entry[1], new_entry[1])
+            changed[value] = fields
+        
+        # 양쪽에 모두 있는 값의 상대 순서가 다르면 순서 변경
+        old_common = [value for value in old_table if value in new_table]
+        new_common = [value for value in new_table if value in old_table]
+        
+        return {
+            "type": (old_part.get_type().name, new_part.get_type().name) if old_part.get_type() != new_part.get_type() else None,
+            "isDirection": (old_part.is_direction(), new_part.is_direction()) if old_part.is_direction() != new_part.is_direction() else None,
+            "added": [value for value in new_table if value not in old_table],
+            "removed": [value for value in old_table if value not in new_table],
+            "changed": changed,
+            "reordered": old_common != new_common,
+        }
+    
+    def diff(self, other: "NamingConfig") -> Dict[str, Any]:
+        """
+        다른 설정과 구조적으로 비교 (self가 이전, other가 이후)
+        
+        파트마다 내용 해시를 먼저 비교하여 같은 파트는 건너뛰고,
+        바뀐 파트만 값 기준으로 비교하므로 값 순서만 바뀐 경우도 추가/삭제로 보이지 않습니다.
+        
+        Args:
+            other: 비교할 NamingConfig 객체
+            
+        Returns:
+            {"paddingNum": (이전, 이후) 또는 None,
+             "partOrder": (이전 순서, 이후 순서) 또는 None,
+             "addedParts": [파트 이름], "removedParts": [파트 이름],
+             "changedParts": {파트 이름: _diff_part 결과}} 딕셔너리
+        """
+        old_hashes = self.get_part_hashes()
+        new_hashes = other.get_part_hashes()
+        
+        changed_parts = {}
+        for part_name, old_hash in old_hashes.items():
+            new_hash = new_hashes.get(part_name)
+            if new_hash is None or new_hash == old_hash:
+                continue
+            changed_parts[part_name] = self._diff_part(self.get_part(part_name), other.get_part(part_name))
+        
+        old_order = [part.get_name() for part in self.name_parts]
+        new_order = [part.get_name() for part in other.name_parts]
+        
+        return {
+            "paddingNum": (self.padding_num, other.padding_num) if self.padding_num != other.padding_num else None,
+            "partOrder": (old_order, new_order) if old_order != new_order else None,
+            "addedParts": [name for name in new_order if name not in old_hashes],
+            "removedParts": [name for name in old_order if name not in new_hashes],
+            "changedParts": changed_parts,
+        }
+    
+    @staticmethod
+    def is_diff_empty(diff_result: Dict[str, Any]) -> bool:
+        """
+        diff 결과에 변경 사항이 없는지 확인
+        
+        Args:
+            diff_result: diff 결과 딕셔너리
+            
+        Returns:
+            변경 사항이 없으면 True
+        """
+        return (diff_result["paddingNum"] is None and diff_result["partOrder"] is None
+                and not diff_result["addedParts"] and not diff_result["removedParts"]
+                and not diff_result["changedParts"])
+    
+    @staticmethod
+    def format_diff(diff_result: Dict[str, Any]) -> str:
+        """
+        diff 결과를 리뷰용 텍스트로 변환
+        
+        Args:
+            diff_result: diff 결과 딕셔너리
+            
+        Returns:
+            변경 사항을 한 줄씩 담은 문자열 (변경이 없으면 빈 문자열)
+        """
+        lines = []
+        if diff_result["paddingNum"] is not None:
+            lines.append(f"paddingNum: {diff_result['paddingNum'][0]} -> {diff_result['paddingNum'][1]}")
+        if diff_result["partOrder"] is not None:
+            lines.append(f"partOrder: {' '.join(diff_result['partOrder'][0])} -> {' '.join(diff_result['partOrder'][1])}")
+        for part_name in diff_result["addedParts"]:
+            lines.append(f"+ {part_name}")
+        for part_name in diff_result["removedParts"]:
+            lines.append(f"- {part_name}")
+        for part_name, part_diff in diff_result["changedParts"].items():
+            lines.append(f"~ {part_name}")
+            for field in ("type", "isDirection"):
+                if part_diff[field] is not None:
+                    lines.append(f"    {field}: {part_diff[field][0]} -> {part_diff[field][1]}")
+            for value in part_diff["added"]:
+                lines.append(f"    + {value}")
+            for value in part_diff["removed"]:
+                lines.append(f"    - {value}")
+            for value, fields in part_diff["changed"].items():
+                changes = ", ".join(f"{field}: {old} -> {new}" for field, (old, new) in fields.items())
+                lines.append(f"    ~ {value} ({changes})")
+            if part_diff["reordered"]:
+                lines.append("    (values reordered)")
+        return "\n".join(lines)
+    
+    @staticmethod
+    def _merge_scalar(base, ours, theirs, conflicts: List[Dict[str, Any]], conflict_info: Dict[str, Any]):
+        """
+        값 하나를 3방향 병합 (양쪽이 다르게 바꾸면 충돌로 기록하고 ours 사용)
+        """
+        if ours == theirs or theirs == base:
+            return ours
+        if ours == base:
+            return theirs
+        conflicts.append(dict(conflict_info, base=base, ours=ours, theirs=theirs))
+        return ours
+    
+    @staticmethod
+    def _merge_order(base: List[str], ours: List[str], theirs: List[str], merged_keys) -> List[str]:
+        """
+        순서 3방향 병합
+        
+        ours가 base의 상대 순서를 유지했으면 theirs의 순서를, 아니면 ours의 순서를 기준으로 하고,
+        기준에 없는 키는 다른 쪽 순서대로 뒤에 추가합니다.
+        
+        Args:
+            base, ours, theirs: 키 순서 리스트
+            merged_keys: 병합 결과에 남는 키 집합
+            
+        Returns:
+            병합된 키 순서 리스트
+        """
+        ours_kept = [key for key in ours if key in base]
+        base_kept = [key for key in base if key in ours]
+        primary, secondary = (theirs, ours) if ours_kept == base_kept else (ours, theirs)
+        
+        order = [key for key in primary if key in merged_keys]
+        seen = set(order)
+        for key in secondary + base:
+            if key in merged_keys and key not in seen:
+                order.append(key)
+                seen.add(key)
+        return order
+    
+    @staticmethod
+    def _merge_part(base_part: Optional[NamePart], ours_part: NamePart, theirs_part: NamePart,
+                    conflicts: List[Dict[str, Any]]) -> NamePart:
+        """
+        NamePart 하나를 값 기준으로 3방향 병합 (base_part가 None이면 양쪽에서 새로 추가된 파트)
+        """
+        part_name = ours_part.get_name()
+        empty = NamePart(part_name, ours_part.get_type())
+        base_part = base_part or empty
+        
+        part_type = NamingConfig._merge_scalar(base_part.get_type(), ours_part.get_type(), theirs_part.get_type(),
+                                               conflicts, {"part": part_name, "field": "type"})
+        is_direction = NamingConfig._merge_scalar(base_part.is_direction(), ours_part.is_direction(), theirs_part.is_direction(),
+                                                  conflicts, {"part": part_name, "field": "isDirection"})
+        
+        base_table = NamingConfig._get_value_table(base_part)
+        ours_table = NamingConfig._get_value_table(ours_part)
+        theirs_table = NamingConfig._get_value_table(theirs_part)
+        
+        merged_table = {}
+        for value in {**base_table, **ours_table, **theirs_table}:
+            entry = NamingConfig._merge_scalar(base_table.get(value), ours_table.get(value), theirs_table.get(value),
+                                               conflicts, {"part": part_name, "field": "value", "value": value})
+            if entry is not None:
+                merged_table[value] = entry
+        
+        values = NamingConfig._merge_order(list(base_table), list(ours_table), list(theirs_table), merged_table)
+        return NamePart(
+            part_name,
+            part_type,
+            values,
+            [merged_table[value][0] for value in values],
+            is_direction,
+            [merged_table[value][1] for value in values],
+        )
+    
+    @staticmethod
+    def merge(base: "NamingConfig", ours: "NamingConfig", theirs: "NamingConfig") -> tuple:
+        """
+        같은 설정(base)을 각각 수정한 두 설정(ours, theirs)을 3방향 병합
+        
+        파트 내용 해시가 한쪽만 바뀐 파트는 그대로 가져오고, 양쪽이 모두 바꾼 파트만 값 기준으로 병합합니다.
+        같은 항목을 양쪽이 다르게 바꾸면 충돌로 보고하고 ours의 내용을 사용합니다.
+        
+        Args:
+            base: 공통 원본 설정
+            ours: 우리 쪽 수정 설정
+            theirs: 상대 쪽 수정 설정
+            
+        Returns:
+            (병합된 NamingConfig, 충돌 리스트) 튜플
+            충돌 항목: {"part", "field", ("value"), "base", "ours", "theirs"} 딕셔너리 (part가 None이면 설정 전체 항목)
+        """
+        conflicts = []
+        padding_num = NamingConfig._merge_scalar(base.padding_num, ours.padding_num, theirs.padding_num,
+                                                 conflicts, {"part": None, "field": "paddingNum"})
+        
+        base_hashes = base.get_part_hashes()
+        ours_hashes = ours.get_part_hashes()
+        theirs_hashes = theirs.get_part_hashes()
+        
+        merged_parts = {}
+        for part_name in {**base_hashes, **ours_hashes, **theirs_hashes}:
+            base_hash = base_hashes.get(part_name)
+            ours_hash = ours_hashes.get(part_name)
+            theirs_hash = theirs_hashes.get(part_name)
+            
+            if ours_hash == theirs_hash or theirs_hash == base_hash:
+                source = ours
+            elif ours_hash == base_hash:
+                source = theirs
+            elif ours_hash is None or theirs_hash is None:
+                # 한쪽은 삭제하고 다른 쪽은 수정한 파트는 수정된 쪽을 유지
+                conflicts.append({"part": part_name, "field": "part", "base": base_hash,
+                                  "ours": ours_hash, "theirs": theirs_hash})
+                source = ours if ours_hash is not None else theirs
+            else:
+                merged_parts[part_name] = NamingConfig._merge_part(base.get_part(part_name), ours.get_part(part_name),
+                                                                   theirs.get_part(part_name), conflicts)
+                continue
+            
+            part = source.get_part(part_name)
+            if part is not None:
+                merged_parts[part_name] = copy.deepcopy(part)
+        
+        part_order = NamingConfig._merge_order(
+            [part.get_name() for part in base.name_parts],
+            [part.get_name() for part in ours.name_parts],
+            [part.get_name() for part in theirs.name_parts],
+            merged_parts,
+        )
+        
+        # 빈 파트 목록을 생성자에 넘기면 기본 파트로 채워지므로 생성 후 지정
+        merged = NamingConfig(padding_num, None, ours.config_file_path, ours.default_file_name,
+                              list(ours.required_parts))
+        merged.name_parts = [merged_parts[name] for name in part_order]
+        merged._update_part_order()
+        if merged.name_parts:
+            merged._update_part_types_based_on_order()
+        return merged, conflicts
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+namingImpact 모듈 - 설정 변경이 실제 이름 목록에 주는 영향 분석 기능 제공
+이름 목록을 저장된 설정과 편집 중인 설정으로 묶음 단위로 분석하여, 파트별 값 분포와
+분석할 수 없는 이름, 분석 결과가 바뀌는 이름을 점진적으로 보고하는 클래스 구현
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from JalLib.naming import Naming
+from JalLib.namingConfig import CompiledNamingConfig
+
+
+class NamingImpactAnalyzer:
+    """
+    이름 목록에 대한 설정 변경 영향 분석기.
+
+    저장된 설정의 분석 결과는 이름 목록이나 저장된 설정이 바뀔 때까지 캐시하므로,
+    설정을 편집하는 동안에는 편집 중인 설정으로만 다시 분석합니다.
+    iter_analyze는 inChunkSize개마다 누적 보고서를 생성하므로 작업 스레드에서 실행하며
+    중간 결과를 표시하거나 취소할 수 있습니다.
+
+    보고서는 다음 키를 가진 딕셔너리입니다.
+        total: 전체 이름 개수
+        processed: 지금까지 분석한 이름 개수
+        histograms: {파트 이름: {값: 개수}} (RealName, Index 타입 제외, 빈 값 제외)
+        unparseableCount / unparseable: RealName을 찾지 못한 이름 개수 / 목록 (inMaxListed개까지)
+        changedCount / changed: 저장된 설정과 분석 결과가 다른 이름 개수 /
+            [(이름, {파트 이름: (저장된 값, 편집 중인 값)})] 목록 (inMaxListed개까지)
+    """
+
+    def __init__(self, inChunkSize: int = 5000, inMaxListed: int = 1000):
+        """
+        NamingImpactAnalyzer 초기화
+
+        Args:
+            inChunkSize: 한 번에 분석하고 보고서를 생성할 이름 개수 (기본값: 5000)
+            inMaxListed: 보고서 목록에 담을 최대 이름 개수 (기본값: 1000, 개수는 모두 셈)
+        """
+        self._chunkSize = max(1, inChunkSize)
+        self._maxListed = max(0, inMaxListed)
+        self._names: List[str] = []
+        self._savedNaming: Optional[Naming] = None
+        # 저장된 설정의 분석 결과 ({파트 이름: 값} 딕셔너리 리스트, 분석한 만큼만)
+        self._savedRows: List[Dict[str, str]] = []
+        self._editedNaming = Naming()
+
+    def set_names(self, inNames: Iterable[str]):
+        """
+        분석할 이름 목록 설정 (앞뒤 공백 제거, 빈 줄 제외)
+
+        Args:
+            inNames: 이름 문자열 iterable
+        """
+        self._names = [name.strip() for name in inNames if name and name.strip()]
+        self._savedRows = []
+
+    def get_names(self) -> List[str]:
+        """
+        분석할 이름 목록 반환
+
+        Returns:
+            이름 문자열 리스트
+        """
+        return list(self._names)
+
+    def set_saved_config(self, inCompiled: Optional[CompiledNamingConfig]):
+        """
+        비교 기준이 되는 저장된 설정 지정
+
+        Args:
+            inCompiled: 저장된 설정의 컴파일 스냅샷 (None이면 변경 비교 안 함)
+        """
+        if inCompiled is None:
+            self._savedNaming = None
+        else:
+            self._savedNaming = Naming()
+            inCompiled.apply_to_naming(self._savedNaming)
+        self._savedRows = []
+
+    @staticmethod
+    def _parse_chunk(inNaming: Naming, inNames: List[str]) -> List[Dict[str, str]]:
+        """
+        이름 묶음을 분석하여 {파트 이름: 값} 딕셔너리 리스트로 변환
+        """
+        partNames = inNaming._get_parser().get_part_names()
+        return [dict(zip(partNames, partValues)) for partValues, _ in inNaming._iter_parsed_rows(inNames)]
+
+    @staticmethod
+    def _get_histogram_parts(inNaming: Naming) -> List[str]:
+        """
+        값 분포를 셀 파트 이름 목록 (RealName, Index 타입 제외)
+        """
+        return [part.get_name() for part in inNaming._nameParts if not part.is_realname() and not part.is_index()]
+
+    def _new_report(self, inHistogramParts: List[str]) -> Dict[str, object]:
+        """
+        빈 보고서 생성
+        """
+        return {
+            "total": len(self._names),
+            "processed": 0,
+            "histograms": {partName: {} for partName in inHistogramParts},
+            "unparseableCount": 0,
+            "unparseable": [],
+            "changedCount": 0,
+            "changed": [],
+        }
+
+    @staticmethod
+    def _copy_report(inReport: Dict[str, object]) -> Dict[str, object]:
+        """
+        중간 보고서 복사 (다른 스레드에 넘긴 뒤에도 계속 누적할 수 있도록)
+        """
+        report = dict(inReport)
+        report["histograms"] = {partName: dict(counts) for partName, counts in inReport["histograms"].items()}
+        report["unparseable"] = list(inReport["unparseable"])
+        report["changed"] = list(inReport["changed"])
+        return report
+
+    def iter_analyze(self, inEdited: CompiledNamingConfig,
+                     inCancelled: Optional[Callable[[], bool]] = None) -> Iterator[Dict[str, object]]:
+        """
+        편집 중인 설정으로 이름 목록을 묶음 단위로 분석하여 누적 보고서를 생성
+
+        Args:
+            inEdited: 편집 중인 설정의 컴파일 스냅샷
+            inCancelled: 묶음마다 호출하여 True를 반환하면 분석을 멈추는 함수 (기본값: None)
+
+        Yields:
+            묶음마다 지금까지의 누적 보고서 (복사본, 마지막 보고서는 processed == total)
+        """
+        inEdited.apply_to_naming(self._editedNaming)
+        histogramParts = self._get_histogram_parts(self._editedNaming)
+        report = self._new_report(histogramParts)
+        histograms = report["histograms"]
+
+        # 저장된 설정과 같으면 변경 비교를 생략
+        savedNaming = self._savedNaming
+        if savedNaming is not None and savedNaming.get_compiled_config() == inEdited:
+            savedNaming = None
+
+        if not self._names:
+            yield self._copy_report(report)
+            return
+
+        for start in range(0, len(self._names), self._chunkSize):
+            if inCancelled and inCancelled():
+                return
+
+            names = self._names[start:start + self._chunkSize]
+            editedRows = self._parse_chunk(self._editedNaming, names)
+
+            savedRows = None
+            if savedNaming is not None:
+                # 저장된 설정의 결과는 처음 분석할 때만 계산하고 캐시
+                if len(self._savedRows) < start + len(names):
+                    self._savedRows.extend(self._parse_chunk(savedNaming, self._names[len(self._savedRows):start + len(names)]))
+                savedRows = self._savedRows[start:start + len(names)]
+
+            for i, (name, row) in enumerate(zip(names, editedRows)):
+                for partName in histogramParts:
+                    value = row.get(partName, "")
+                    if value:
+                        counts = histograms[partName]
+                        counts[value] = counts.get(value, 0) + 1
+
+                if not row.get("RealName"):
+                    report["unparseableCount"] += 1
+                    if len(report["unparseable"]) < self._maxListed:
+                        report["unparseable"].append(name)
+
+                if savedRows is not None and savedRows[i] != row:
+                    report["changedCount"] += 1
+                    if len(report["changed"]) < self._maxListed:
+                        report["changed"].append((name, self._diff_row(savedRows[i], row)))
+
+            report["processed"] = start + len(names)
+            yield self._copy_report(report)
+
+    @staticmethod
+    def _diff_row(inSaved: Dict[str, str], inEdited: Dict[str, str]) -> Dict[str, Tuple[str, str]]:
+        """
+        두 분석 결과에서 값이 다른 파트만 추출
+
+        Returns:
+            {파트 이름: (저장된 값, 편집 중인 값)} 딕셔너리 (파트 순서는 편집 중인 설정 기준)
+        """
+        partNames = list(inEdited) + [partName for partName in inSaved if partName not in inEdited]
+        return {
+            partName: (inSaved.get(partName, ""), inEdited.get(partName, ""))
+            for partName in partNames
+            if inSaved.get(partName, "") != inEdited.get(partName, "")
+        }
+
+    def analyze(self, inEdited: CompiledNamingConfig) -> Dict[str, object]:
+        """
+        편집 중인 설정으로 이름 목록 전체를 분석
+
+        Args:
+            inEdited: 편집 중인 설정의 컴파일 스냅샷
+
+        Returns:
+            최종 보고서 딕셔너리
+        """
+        report = None
+        for report in self.iter_analyze(inEdited):
+            pass
+        return report
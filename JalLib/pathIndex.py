@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+pathIndex 모듈 - 에셋 폴더 역색인 기능 제공
+루트 폴더의 파일 이름을 이름 파트로 분석해 검색하는, NameToPath.gen_path의 역방향 색인 구현
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Iterable, List, Optional, Union
+
+from JalLib.naming import Naming
+from JalLib.nameIndex import NameIndex
+
+
+class PathIndex:
+    """
+    루트 폴더 아래 파일을 이름 파트 값으로 검색하기 위한 색인.
+
+    os.scandir로 폴더 목록을 읽고, 폴더별 수정 시간과 목록을 디스크 캐시(JSON)에 저장합니다.
+    다시 갱신할 때는 폴더마다 stat만 확인하고, 수정 시간이 바뀐 폴더만 다시 읽습니다.
+    파일 이름(확장자 제외)은 Naming으로 분석하여 NameIndex에 보관하므로 설정이 바뀌어도 캐시를 그대로 사용할 수 있습니다.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, inRootPath: str, inNaming: Naming, inCachePath: Optional[str] = None):
+        """
+        PathIndex 초기화 (폴더는 refresh를 호출할 때 읽음)
+
+        Args:
+            inRootPath: 색인할 루트 폴더 경로
+            inNaming: 파일 이름 분석에 사용할 Naming 객체
+            inCachePath: 디스크 캐시 파일 경로 (기본값: None, 임시 폴더 아래 루트 경로별 파일)
+        """
+        self.rootPath = os.path.normpath(os.path.abspath(inRootPath))
+        self._naming = inNaming
+        self._cachePath = inCachePath or self.get_default_cache_path(self.rootPath)
+
+        # 루트 기준 상대 폴더 경로 -> {"mtime", "files", "dirs"}
+        self._dirs: Dict[str, Dict[str, object]] = {}
+        # 파일 이름(확장자 제외) -> 상대 파일 경로 리스트
+        self._stemPaths: Dict[str, List[str]] = {}
+        self._nameIndex = NameIndex(inNaming)
+        self._loaded = False
+
+    @staticmethod
+    def get_default_cache_path(inRootPath: str) -> str:
+        """
+        루트 경로별 기본 디스크 캐시 파일 경로 생성
+
+        Args:
+            inRootPath: 루트 폴더 경로
+
+        Returns:
+            임시 폴더 아래 캐시 파일 경로
+        """
+        rootKey = hashlib.sha1(os.path.normcase(inRootPath).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(tempfile.gettempdir(), "JalLib", f"pathIndex_{rootKey}.json")
+
+    def get_cache_path(self) -> str:
+        """
+        디스크 캐시 파일 경로 반환
+
+        Returns:
+            캐시 파일 경로
+        """
+        return self._cachePath
+
+    def _add_files(self, inRelDir: str, inFileNames: Iterable[str]):
+        """
+        폴더의 파일들을 색인에 추가
+        """
+        stems = []
+        for fileName in inFileNames:
+            stem = os.path.splitext(fileName)[0]
+            self._stemPaths.setdefault(stem, []).append(os.path.join(inRelDir, fileName))
+            stems.append(stem)
+        self._nameIndex.add_many(stems)
+
+    def _remove_files(self, inRelDir: str, inFileNames: Iterable[str]):
+        """
+        폴더의 파일들을 색인에서 제거
+        """
+        for fileName in inFileNames:
+            stem = os.path.splitext(fileName)[0]
+            paths = self._stemPaths.get(stem)
+            if not paths:
+                continue
+            paths.remove(os.path.join(inRelDir, fileName))
+            if not paths:
+                del self._stemPaths[stem]
+            self._nameIndex.remove(stem)
+
+    def load(self) -> bool:
+        """
+        디스크 캐시에서 폴더 목록을 불러와 색인 생성 (폴더는 읽지 않음)
+
+        Returns:
+            캐시를 불러왔으면 True, 캐시가 없거나 다른 루트/버전이면 False
+        """
+        self._loaded = True
+        try:
+            with open(self._cachePath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if data.get("version") != self.CACHE_VERSION or data.get("rootPath") != self.rootPath:
+            return False
+
+        self.clear()
+        self._dirs = data.get("dirs", {})
+        for relDir, entry in self._dirs.items():
+            self._add_files(relDir, entry["files"])
+        return True
+
+    def save(self) -> bool:
+        """
+        폴더 목록을 디스크 캐시에 저장 (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            저장 성공 여부 (True/False)
+        """
+        data = {"version": self.CACHE_VERSION, "rootPath": self.rootPath, "dirs": self._dirs}
+        tempPath = self._cachePath + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self._cachePath), exist_ok=True)
+            with open(tempPath, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tempPath, self._cachePath)
+            return True
+        except OSError as e:
+            print(f"경로 색인 캐시 저장 중 오류 발생: {e}")
+            return False
+
+    def clear(self):
+        """
+        메모리의 색인 초기화 (디스크 캐시는 유지)
+        """
+        self._dirs = {}
+        self._stemPaths.clear()
+        self._nameIndex.clear()
+
+    def refresh(self, inSave: bool = True) -> Dict[str, int]:
+        """
+        루트 폴더를 확인하여 수정 시간이 바뀐 폴더만 다시 읽고 색인 갱신
+
+        처음 호출할 때는 디스크 캐시를 먼저 불러옵니다.
+
+        Args:
+            inSave: 갱신 후 디스크 캐시에 저장할지 여부 (기본값: True)
+
+        Returns:
+            {"scannedDirs", "reusedDirs", "removedDirs", "files"} 딕셔너리
+        """
+        if not self._loaded:
+            self.load()
+
+        oldDirs = self._dirs
+        newDirs = {}
+        scannedCount = 0
+        reusedCount = 0
+
+        stack = [""]
+        while stack:
+            relDir = stack.pop()
+            absDir = os.path.join(self.rootPath, relDir)
+            try:
+                mtime = os.stat(absDir).st_mtime_ns
+            except OSError:
+                continue
+
+            entry = oldDirs.get(relDir)
+            if entry is None or entry["mtime"] != mtime:
+                files = []
+                dirs = []
+                try:
+                    with os.scandir(absDir) as it:
+                        for dirEntry in it:
+                            if dirEntry.is_dir(follow_symlinks=False):
+                                dirs.append(dirEntry.name)
+                            elif dirEntry.is_file():
+                                files.append(dirEntry.name)
+                except OSError:
+                    continue
+
+                oldFiles = set(entry["files"]) if entry else set()
+                newFiles = set(files)
+                self._remove_files(relDir, sorted(oldFiles - newFiles))
+                self._add_files(relDir, sorted(newFiles - oldFiles))
+                entry = {"mtime": mtime, "files": sorted(files), "dirs": sorted(dirs)}
+                scannedCount += 1
+            else:
+                reusedCount += 1
+
+            newDirs[relDir] = entry
+            stack.extend(os.path.join(relDir, dirName) for dirName in entry["dirs"])
+
+        # 사라진 폴더의 파일 제거
+        removedDirs = [relDir for relDir in oldDirs if relDir not in newDirs]
+        for relDir in removedDirs:
+            self._remove_files(relDir, oldDirs[relDir]["files"])
+
+        self._dirs = newDirs
+        if inSave:
+            self.save()
+
+        return {
+            "scannedDirs": scannedCount,
+            "reusedDirs": reusedCount,
+            "removedDirs": len(removedDirs),
+            "files": sum(len(paths) for paths in self._stemPaths.values()),
+        }
+
+    def query(self, inConditions: Optional[Dict[str, Union[str, Iterable[str]]]] = None,
+              inMinIndex: Optional[int] = None, inMaxIndex: Optional[int] = None) -> List[str]:
+        """
+        파일 이름의 파트 값 조건과 인덱스 범위로 파일 검색
+
+        예: query({"Species": "Human", "AnimMainCategory": "Idle"})
+
+        Args:
+            inConditions: {파트 이름: 값 또는 값 목록} 딕셔너리 (기본값: None)
+            inMinIndex: 최소 인덱스 (포함, 기본값: None)
+            inMaxIndex: 최대 인덱스 (포함, 기본값: None)
+
+        Returns:
+            조건을 만족하는 파일의 절대 경로 리스트 (정렬됨)
+        """
+        paths = []
+        for stem in self._nameIndex.query(inConditions, inMinIndex, inMaxIndex):
+            paths.extend(os.path.join(self.rootPath, relPath) for relPath in self._stemPaths[stem])
+        return sorted(paths)
+
+    def get_files(self) -> List[str]:
+        """
+        색인된 모든 파일의 절대 경로 반환
+
+        Returns:
+            파일 경로 리스트 (정렬됨)
+        """
+        return sorted(os.path.join(self.rootPath, relPath) for paths in self._stemPaths.values() for relPath in paths)
+
+    def get_parts(self, inFilePath: str) -> Dict[str, str]:
+        """
+        파일 경로의 이름 파트 값 가져오기
+
+        Args:
+            inFilePath: 파일 경로
+
+        Returns:
+            {파트 이름: 값} 딕셔너리 (Naming.convert_to_dictionary 결과)
+        """
+        stem = os.path.splitext(os.path.basename(inFilePath))[0]
+        return self._naming.convert_to_dictionary(stem)
@@ -0,0 +1,396 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+profiler 모듈 - JalLib 내장 프로파일링 기능 제공
+JalLib 하위 모듈의 임포트 시간과 주요 클래스 공개 메서드의 호출 시간을 기록하는 클래스 구현
+
+환경 변수 JALLIB_PROFILE=1 또는 JalLib.enable_profiling()으로 켭니다.
+꺼져 있을 때는 메서드를 감싸지 않으므로 추가 비용이 없습니다.
+"""
+
+import functools
+import importlib.abc
+import json
+import random
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+# 환경 변수 이름
+PROFILE_ENV = "JALLIB_PROFILE"              # "1"이면 JalLib 임포트 시 프로파일링 시작
+PROFILE_FILE_ENV = "JALLIB_PROFILE_FILE"    # 지정하면 프로세스 종료 시 JSON 보고서 저장
+
+# 모듈 이름 -> 호출 시간을 기록할 클래스 이름들
+PROFILE_TARGETS = {
+    "JalLib.naming": ("Naming",),
+    "JalLib.namingConfig": ("NamingConfig",),
+    "JalLib.perforce": ("Perforce",),
+    "JalLib.max.name": ("Name",),
+    "JalLib.max.anim": ("Anim",),
+    "JalLib.max.helper": ("Helper",),
+    "JalLib.max.constraint": ("Constraint",),
+    "JalLib.max.bone": ("Bone",),
+    "JalLib.max.mirror": ("Mirror",),
+    "JalLib.max.layer": ("Layer",),
+    "JalLib.max.align": ("Align",),
+    "JalLib.max.select": ("Select",),
+    "JalLib.max.link": ("Link",),
+    "JalLib.max.bip": ("Bip",),
+    "JalLib.max.skin": ("Skin",),
+    "JalLib.max.twistBone": ("TwistBone",),
+}
+
+
+class CallStats:
+    """
+    메서드 하나의 호출 통계.
+
+    호출 횟수와 누적 시간은 정확히 보관하고, 백분위 계산용 소요 시간은
+    최대 inSampleLimit개까지 저수지 샘플링(reservoir sampling)으로 보관합니다.
+    """
+
+    __slots__ = ("count", "total", "samples", "_sampleLimit", "_random")
+
+    def __init__(self, inSampleLimit: int = 10000):
+        self.count = 0
+        self.total = 0.0
+        self.samples: List[float] = []
+        self._sampleLimit = inSampleLimit
+        self._random = random.Random(0)
+
+    def add(self, inSeconds: float):
+        """
+        호출 한 번의 소요 시간 추가
+
+        Args:
+            inSeconds: 소요 시간 (초)
+        """
+        self.count += 1
+        self.total += inSeconds
+        if len(self.samples) < self._sampleLimit:
+            self.samples.append(inSeconds)
+        else:
+            slot = self._random.randrange(self.count)
+            if slot < self._sampleLimit:
+                self.samples[slot] = inSeconds
+
+    def get_percentile(self, inPercent: float) -> float:
+        """
+        소요 시간 백분위 값 (nearest-rank 방식)
+
+        Args:
+            inPercent: 백분위 (0~100)
+
+        Returns:
+            소요 시간 (초), 기록이 없으면 0.0
+        """
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(1, -(-len(ordered) * inPercent // 100))
+        return ordered[min(int(rank), len(ordered)) - 1]
+
+
+class _ImportHook(importlib.abc.MetaPathFinder):
+    """
+    JalLib 하위 모듈의 로더를 감싸 실행 시간을 기록하고, 대상 클래스를 계측하는 메타 경로 탐색기
+    """
+
+    def __init__(self, inProfiler: "Profiler"):
+        self._profiler = inProfiler
+
+    def find_spec(self, fullname, path, target=None):
+        if not fullname.startswith("JalLib.") or fullname == __name__:
+            return None
+
+        # 나머지 탐색기에서 실제 spec을 찾은 뒤 로더만 감쌈
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            loader = spec.loader
+            if loader is not None and hasattr(loader, "exec_module") and not isinstance(loader, _TimedLoader):
+                spec.loader = _TimedLoader(loader, self._profiler)
+            return spec
+        return None
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """
+    exec_module 시간을 기록하는 로더 래퍼
+    """
+
+    def __init__(self, inLoader, inProfiler: "Profiler"):
+        self._loader = inLoader
+        self._profiler = inProfiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler.record_import(module.__name__, time.perf_counter() - start)
+        if self._profiler.is_enabled():
+            self._profiler.instrument_module(module)
+
+    def __getattr__(self, inAttrName):
+        # get_source, get_code 등은 원래 로더에 위임
+        return getattr(self._loader, inAttrName)
+
+
+class Profiler:
+    """
+    JalLib 임포트 시간과 메서드 호출 시간을 기록하는 프로파일러.
+
+    enable을 호출하면 sys.meta_path에 탐색기를 추가하여 이후 임포트되는 JalLib 하위 모듈의
+    실행 시간(하위 임포트 포함)을 기록하고, PROFILE_TARGETS 클래스의 공개 메서드를 시간 측정 래퍼로 교체합니다.
+    아직 임포트되지 않은 대상 모듈(예: JalLib.max 서비스)은 임포트되는 시점에 계측합니다.
+    disable을 호출하면 원래 메서드를 되돌리므로 꺼져 있는 동안에는 추가 비용이 없습니다.
+    """
+
+    def __init__(self, inTargets: Optional[Dict[str, tuple]] = None):
+        """
+        Profiler 초기화
+
+        Args:
+            inTargets: {모듈 이름: 클래스 이름 튜플} 딕셔너리 (기본값: None, PROFILE_TARGETS)
+        """
+        self._targets = dict(PROFILE_TARGETS if inTargets is None else inTargets)
+        self._enabled = False
+        self._lock = threading.Lock()
+        self._importHook = _ImportHook(self)
+
+        # 모듈 이름 -> 임포트 시간 (초)
+        self._imports: Dict[str, float] = {}
+        # "클래스.메서드" -> CallStats
+        self._calls: Dict[str, CallStats] = {}
+        # (클래스, 속성 이름) -> 원래 속성 (disable 시 복원)
+        self._originals: Dict[tuple, object] = {}
+
+    def is_enabled(self) -> bool:
+        """
+        프로파일링 활성화 여부 반환
+        """
+        return self._enabled
+
+    def enable(self):
+        """
+        프로파일링 시작 (이미 로드된 대상 클래스 계측 및 임포트 탐색기 설치)
+        """
+        if self._enabled:
+            return
+        self._enabled = True
+        if self._importHook not in sys.meta_path:
+            sys.meta_path.insert(0, self._importHook)
+        for moduleName in self._targets:
+            module = sys.modules.get(moduleName)
+            if module is not None:
+                self.instrument_module(module)
+
+    def disable(self):
+        """
+        프로파일링 중지 (원래 메서드 복원 및 임포트 탐색기 제거, 기록은 유지)
+        """
+        if not self._enabled:
+            return
+        self._enabled = False
+        if self._importHook in sys.meta_path:
+            sys.meta_path.remove(self._importHook)
+        for (cls, attrName), original in self._originals.items():
+            setattr(cls, attrName, original)
+        self._originals.clear()
+
+    def reset(self):
+        """
+        기록된 임포트 시간과 호출 통계 초기화
+        """
+        with self._lock:
+            self._imports.clear()
+            self._calls.clear()
+
+    def record_import(self, inModuleName: str, inSeconds: float):
+        """
+        모듈 임포트 시간 기록
+
+        Args:
+            inModuleName: 모듈 이름
+            inSeconds: 모듈 실행 시간 (초)
+        """
+        self._imports[inModuleName] = inSeconds
+
+    def record_call(self, inName: str, inSeconds: float):
+        """
+        메서드 호출 시간 기록
+
+        Args:
+            inName: "클래스.메서드" 이름
+            inSeconds: 소요 시간 (초)
+        """
+        with self._lock:
+            stats = self._calls.get(inName)
+            if stats is None:
+                stats = self._calls[inName] = CallStats()
+            stats.add(inSeconds)
+
+    def _wrap(self, inName: str, inFunc: Callable) -> Callable:
+        """
+        함수를 시간 측정 래퍼로 감싸기
+        """
+        record = self.record_call
+        perfCounter = time.perf_counter
+
+        @functools.wraps(inFunc)
+        def wrapper(*args, **kwargs):
+            start = perfCounter()
+            try:
+                return inFunc(*args, **kwargs)
+            finally:
+                record(inName, perfCounter() - start)
+
+        wrapper._jallibProfiled = True
+        return wrapper
+
+    def instrument_class(self, inClass: type):
+        """
+        클래스에 직접 정의된 공개 메서드(staticmethod, classmethod 포함)를 시간 측정 래퍼로 교체
+
+        Args:
+            inClass: 계측할 클래스
+        """
+        for attrName, attr in list(vars(inClass).items()):
+            if attrName.startswith("_") or (inClass, attrName) in self._originals:
+                continue
+            name = f"{inClass.__name__}.{attrName}"
+            if isinstance(attr, staticmethod):
+                wrapped = staticmethod(self._wrap(name, attr.__func__))
+            elif isinstance(attr, classmethod):
+                wrapped = classmethod(self._wrap(name, attr.__func__))
+            elif callable(attr) and not isinstance(attr, type):
+                if getattr(attr, "_jallibProfiled", False):
+                    continue
+                wrapped = self._wrap(name, attr)
+            else:
+                continue
+            self._originals[(inClass, attrName)] = attr
+            setattr(inClass, attrName, wrapped)
+
+    def instrument_module(self, inModule):
+        """
+        모듈에 있는 대상 클래스 계측 (PROFILE_TARGETS에 없는 모듈은 무시)
+
+        Args:
+            inModule: 모듈 객체
+        """
+        for className in self._targets.get(inModule.__name__, ()):
+            cls = getattr(inModule, className, None)
+            if isinstance(cls, type):
+                self.instrument_class(cls)
+
+    def get_report(self) -> Dict[str, List[Dict[str, object]]]:
+        """
+        기록된 결과 보고서 반환 (시간 단위: 초)
+
+        Returns:
+            {"imports": [{"module", "seconds"}], "calls": [{"name", "count", "total", "mean", "p50", "p95"}]}
+            딕셔너리 (각각 시간이 긴 순서)
+        """
+        with self._lock:
+            imports = sorted(self._imports.items(), key=lambda item: item[1], reverse=True)
+            calls = [
+                {
+                    "name": name,
+                    "count": stats.count,
+                    "total": stats.total,
+                    "mean": stats.total / stats.count,
+                    "p50": stats.get_percentile(50),
+                    "p95": stats.get_percentile(95),
+                }
+                for name, stats in self._calls.items()
+            ]
+        calls.sort(key=lambda item: item["total"], reverse=True)
+        return {
+            "imports": [{"module": name, "seconds": seconds} for name, seconds in imports],
+            "calls": calls,
+        }
+
+    def to_json(self, inFilePath: Optional[str] = None) -> str:
+        """
+        보고서를 JSON 문자열로 변환 (경로를 지정하면 파일로도 저장)
+
+        Args:
+            inFilePath: 저장할 파일 경로 (기본값: None, 저장하지 않음)
+
+        Returns:
+            JSON 문자열
+        """
+        text = json.dumps(self.get_report(), indent=2, ensure_ascii=False)
+        if inFilePath:
+            with open(inFilePath, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def format_table(self) -> str:
+        """
+        보고서를 텍스트 표로 변환 (시간 단위: 밀리초)
+
+        Returns:
+            임포트 시간 표와 호출 통계 표를 담은 문자열
+        """
+        report = self.get_report()
+        lines = [f"{'module':<40} {'import ms':>10}"]
+        for item in report["imports"]:
+            lines.append(f"{item['module']:<40} {item['seconds'] * 1000:>10.2f}")
+        lines.append("")
+        lines.append(f"{'call':<40} {'count':>8} {'total ms':>10} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10}")
+        for item in report["calls"]:
+            lines.append(
+                f"{item['name']:<40} {item['count']:>8} {item['total'] * 1000:>10.2f} "
+                f"{item['mean'] * 1000:>10.3f} {item['p50'] * 1000:>10.3f} {item['p95'] * 1000:>10.3f}"
+            )
+        return "\n".join(lines)
+
+
+# 패키지 전체에서 공유하는 프로파일러
+_profiler = Profiler()
+
+
+def get_profiler() -> Profiler:
+    """
+    공유 프로파일러 반환
+
+    Returns:
+        Profiler 객체
+    """
+    return _profiler
+
+
+def enable_profiling() -> Profiler:
+    """
+    공유 프로파일러로 프로파일링 시작
+
+    Returns:
+        Profiler 객체
+    """
+    _profiler.enable()
+    return _profiler
+
+
+def disable_profiling():
+    """
+    공유 프로파일러의 프로파일링 중지 (기록은 유지)
+    """
+    _profiler.disable()
+
+
+def is_profiling_enabled() -> bool:
+    """
+    프로파일링 활성화 여부 반환
+    """
+    return _profiler.is_enabled()
@@ -19,15 +19,18 @@ from PySide2.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QHBoxLayout, QPushButton, QLabel, QLineEdit, 
                                QListWidget, QListWidgetItem, QComboBox, 
                                QFileDialog, QGroupBox, QTabWidget, QTextEdit,
-                               QSpinBox, QTableWidget, QTableWidgetItem, 
+                               QSpinBox, QTableView,
                                QHeaderView, QAbstractItemView, QMessageBox,
-                               QRadioButton, QButtonGroup, QInputDialog, QCheckBox)
-from PySide2.QtCore import Qt, QMimeData, QSize
+                               QRadioButton, QButtonGroup, QInputDialog, QCheckBox,
+                               QDockWidget, QPlainTextEdit, QTreeWidget, QTreeWidgetItem)
+from PySide2.QtCore import (Qt, QMimeData, QSize, QAbstractTableModel, QModelIndex,
+                            QThread, QTimer, Signal)
 from PySide2.QtGui import QDrag, QColor
 
 # JalLib 모듈 임포트
 from JalLib.namingConfig import NamingConfig
 from JalLib.namePart import NamePart, NamePartType
+from JalLib.namingImpact import NamingImpactAnalyzer
 
 class DraggableListWidget(QListWidget):
     """드래그 앤 드롭을 지원하는 리스트 위젯"""
@@ -58,6 +61,133 @@ class DraggableListWidget(QListWidget):
         if main_window and hasattr(main_window, 'updatePartOrder'):
             main_window.updatePartOrder()
 
+class NamePartValuesModel(QAbstractTableModel):
+    """
+    NamePart의 사전 정의 값을 직접 표시하고 편집하는 테이블 모델
+
+    편집 내용은 NamePart에 바로 반영하고, 바뀐 셀이나 행에 대해서만 신호를 보냅니다.
+    값이 많은 경우를 위해 행은 FETCH_SIZE개씩 스크롤할 때 불러옵니다. (canFetchMore/fetchMore)
+    """
+
+    HEADERS = ["값", "설명", "한국어 설명"]
+    FETCH_SIZE = 500
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.part = None
+        self.loadedCount = 0
+
+    def setPart(self, part: Optional[NamePart]):
+        """표시할 NamePart 설정 (RealName, Index 타입은 빈 테이블)"""
+        self.beginResetModel()
+        if part and (part.is_realname() or part.is_index()):
+            part = None
+        self.part = part
+        self.loadedCount = min(self.FETCH_SIZE, self.valueCount())
+        self.endResetModel()
+
+    def getPart(self) -> Optional[NamePart]:
+        """표시 중인 NamePart 반환"""
+        return self.part
+
+    def valueCount(self) -> int:
+        """NamePart의 전체 값 개수 반환 (아직 불러오지 않은 행 포함)"""
+        return self.part.get_value_count() if self.part else 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loadedCount
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loadedCount < self.valueCount()
+
+    def fetchMore(self, parent=QModelIndex()):
+        """불러오지 않은 행을 FETCH_SIZE개까지 추가"""
+        if parent.isValid():
+            return
+        count = min(self.FETCH_SIZE, self.valueCount() - self.loadedCount)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.loadedCount, self.loadedCount + count - 1)
+        self.loadedCount += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+
+        row = index.row()
+        column = index.column()
+        if column == 0:
+            return self.part.get_value_at_index(row)
+        if column == 1:
+            return self.part.get_value_with_description(row)[1]
+        return self.part.get_value_with_korean_description(row)[1]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """셀 편집 내용을 NamePart에 반영 (빈 값이나 이미 있는 값으로는 바꿀 수 없음)"""
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+
+        text = str(value) if value is not None else ""
+        currentValue = self.part.get_value_at_index(index.row())
+        column = index.column()
+        if column == 0:
+            success = bool(text) and self.part.rename_predefined_value(currentValue, text)
+        elif column == 1:
+            success = self.part.set_description(currentValue, text)
+        else:
+            success = self.part.set_korean_description(currentValue, text)
+
+        if success:
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return success
+
+    def addValue(self, value: str, description: str = "", korean_description: str = "") -> bool:
+        """
+        값을 맨 뒤에 추가
+
+        Returns:
+            추가 성공 여부 (이미 존재하는 값이면 False)
+        """
+        if self.part is None or self.part.contains_value(value):
+            return False
+
+        row = self.valueCount()
+        if self.loadedCount < row:
+            # 아직 불러오지 않은 행이 있으면 fetchMore에서 함께 표시
+            return self.part.add_predefined_value(value, description, korean_description)
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.part.add_predefined_value(value, description, korean_description)
+        self.loadedCount += 1
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or self.part is None or row < 0 or count <= 0 or row + count > self.loadedCount:
+            return False
+
+        values = [self.part.get_value_at_index(i) for i in range(row, row + count)]
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        for value in values:
+            self.part.remove_predefined_value(value)
+        self.loadedCount -= count
+        self.endRemoveRows()
+        return True
+
 class NamePartWidget(QWidget):
     """NamePart를 표시하고 편집하는 위젯"""
     
@@ -113,18 +243,43 @@ class NamePartWidget(QWidget):
             for i, desc in enumerate(descriptions):
                 if i < len(values):
                     korean_desc = korean_descriptions[i] if i < len(korean_descriptions) else ""
-                    # 설명 (한국어 설명) (값) 형식으로 표시
-                    display_text = f"{desc}"
-                    if korean_desc:
-                        display_text += f" ({korean_desc})"
-                    display_text += f" ({values[i]})"
-                    self.valueCombo.addItem(display_text, values[i])
+                    self.valueCombo.addItem(self.formatValueText(values[i], desc, korean_desc), values[i])
         
         # 위젯 배치
         layout.addWidget(nameLabel)
         layout.addWidget(typeLabel)
         layout.addWidget(self.valueCombo)
         
+    @staticmethod
+    def formatValueText(value: str, desc: str, korean_desc: str) -> str:
+        """드롭다운 표시 문자열 생성 - 설명 (한국어 설명) (값) 형식"""
+        display_text = f"{desc}"
+        if korean_desc:
+            display_text += f" ({korean_desc})"
+        display_text += f" ({value})"
+        return display_text
+    
+    def updateValueItem(self, row: int):
+        """드롭다운의 한 항목만 NamePart 값으로 갱신"""
+        value, desc = self.part.get_value_with_description(row)
+        if value is None:
+            return
+        korean_desc = self.part.get_value_with_korean_description(row)[1]
+        self.valueCombo.setItemText(row, self.formatValueText(value, desc, korean_desc))
+        self.valueCombo.setItemData(row, value)
+    
+    def insertValueItem(self, row: int):
+        """NamePart에 추가된 값을 드롭다운에 삽입"""
+        value, desc = self.part.get_value_with_description(row)
+        if value is None:
+            return
+        korean_desc = self.part.get_value_with_korean_description(row)[1]
+        self.valueCombo.insertItem(row, self.formatValueText(value, desc, korean_desc), value)
+    
+    def removeValueItem(self, row: int):
+        """NamePart에서 제거된 값을 드롭다운에서 삭제"""
+        self.valueCombo.removeItem(row)
+    
     def getValue(self) -> str:
         """선택된 값 반환"""
         if self.part.is_realname():
@@ -143,6 +298,210 @@ class NamePartWidget(QWidget):
         """색상 반환"""
         return self.color
 
+class NamingImpactWorker(QThread):
+    """이름 목록을 작업 스레드에서 분석하고 묶음마다 누적 보고서를 보내는 스레드"""
+    
+    reportReady = Signal(object)
+    
+    def __init__(self, analyzer: NamingImpactAnalyzer, compiled, parent=None):
+        super().__init__(parent)
+        self.analyzer = analyzer
+        self.compiled = compiled
+        
+    def run(self):
+        # 중단 요청은 묶음 사이에서 확인
+        for report in self.analyzer.iter_analyze(self.compiled, self.isInterruptionRequested):
+            self.reportReady.emit(report)
+
+class BulkPreviewPanel(QWidget):
+    """
+    실제 이름 목록으로 편집 중인 설정의 영향을 미리 보는 패널
+    
+    붙여넣거나 불러온 이름들을 작업 스레드에서 분석하여 파트별 값 분포, 분석할 수 없는 이름,
+    저장된 설정과 분석 결과가 달라지는 이름을 표시합니다.
+    설정이 바뀔 때마다 DEBOUNCE_MS 동안 기다렸다가 다시 분석하며, 분석 중이면 중단하고 다시 시작합니다.
+    """
+    
+    DEBOUNCE_MS = 300
+    
+    def __init__(self, configGetter, parent=None):
+        super().__init__(parent)
+        # 편집 중인 설정의 컴파일 스냅샷을 반환하는 함수
+        self.configGetter = configGetter
+        self.analyzer = NamingImpactAnalyzer()
+        self.worker = None
+        self.restartPending = False
+        
+        # 작업 스레드가 없을 때 분석기에 반영할 변경 사항
+        self.namesDirty = False
+        self.savedDirty = False
+        self.pendingSaved = None
+        self.lastCompiled = None
+        
+        # 화면에 이미 추가한 목록 개수 (보고서는 누적되므로 새 항목만 추가)
+        self.shownUnparseable = 0
+        self.shownChanged = 0
+        
+        self.debounceTimer = QTimer(self)
+        self.debounceTimer.setSingleShot(True)
+        self.debounceTimer.setInterval(self.DEBOUNCE_MS)
+        self.debounceTimer.timeout.connect(self.startAnalysis)
+        
+        self.setupUI()
+        
+    def setupUI(self):
+        """패널 UI 구성"""
+        layout = QVBoxLayout(self)
+        
+        buttonLayout = QHBoxLayout()
+        self.loadNamesButton = QPushButton("이름 파일 불러오기")
+        self.clearNamesButton = QPushButton("지우기")
+        self.loadNamesButton.clicked.connect(self.loadNamesFile)
+        self.clearNamesButton.clicked.connect(lambda: self.namesEdit.clear())
+        buttonLayout.addWidget(self.loadNamesButton)
+        buttonLayout.addWidget(self.clearNamesButton)
+        buttonLayout.addStretch(1)
+        
+        # 이름 입력 (한 줄에 하나씩)
+        self.namesEdit = QPlainTextEdit()
+        self.namesEdit.setPlaceholderText("씬의 이름을 한 줄에 하나씩 붙여넣으세요.")
+        self.namesEdit.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.namesEdit.textChanged.connect(self.onNamesChanged)
+        
+        self.statusLabel = QLabel("이름 없음")
+        
+        # 결과 탭
+        self.resultTabs = QTabWidget()
+        
+        self.histogramTree = QTreeWidget()
+        self.histogramTree.setHeaderLabels(["파트 / 값", "개수"])
+        
+        self.unparseableList = QListWidget()
+        
+        self.changedTree = QTreeWidget()
+        self.changedTree.setHeaderLabels(["이름", "파트", "저장된 설정", "편집 중인 설정"])
+        
+        self.resultTabs.addTab(self.histogramTree, "값 분포")
+        self.resultTabs.addTab(self.unparseableList, "분석 불가")
+        self.resultTabs.addTab(self.changedTree, "변경된 이름")
+        
+        layout.addLayout(buttonLayout)
+        layout.addWidget(self.namesEdit, 1)
+        layout.addWidget(self.statusLabel)
+        layout.addWidget(self.resultTabs, 2)
+    
+    def loadNamesFile(self):
+        """텍스트 파일에서 이름 목록 불러오기"""
+        filePath, _ = QFileDialog.getOpenFileName(
+            self, "이름 목록 불러오기", "", "텍스트 파일 (*.txt *.csv);;모든 파일 (*)"
+        )
+        if not filePath:
+            return
+        try:
+            with open(filePath, "r", encoding="utf-8-sig") as f:
+                self.namesEdit.setPlainText(f.read())
+        except (OSError, UnicodeDecodeError) as e:
+            QMessageBox.warning(self, "경고", f"이름 목록을 불러올 수 없습니다: {str(e)}")
+    
+    def onNamesChanged(self):
+        """이름 입력이 바뀌면 잠시 후 다시 분석 (입력 중에는 문자열을 읽지 않음)"""
+        self.namesDirty = True
+        self.scheduleUpdate()
+    
+    def setSavedConfig(self, compiled):
+        """비교 기준이 되는 저장된 설정 지정 (불러오기/저장 시 호출)"""
+        self.pendingSaved = compiled
+        self.savedDirty = True
+        self.scheduleUpdate()
+    
+    def scheduleUpdate(self):
+        """설정이나 이름이 바뀌었음을 알림 (DEBOUNCE_MS 이내의 연속 변경은 한 번만 분석)"""
+        self.debounceTimer.start()
+    
+    def startAnalysis(self):
+        """작업 스레드에서 분석 시작 (분석 중이면 중단 후 끝나면 다시 시작)"""
+        if self.worker is not None:
+            self.worker.requestInterruption()
+            self.restartPending = True
+            return
+        
+        # 작업 스레드가 없을 때만 분석기 상태 변경
+        if self.namesDirty:
+            self.analyzer.set_names(self.namesEdit.toPlainText().splitlines())
+        if self.savedDirty:
+            self.analyzer.set_saved_config(self.pendingSaved)
+        
+        compiled = self.configGetter()
+        if not (self.namesDirty or self.savedDirty) and compiled == self.lastCompiled:
+            return
+        self.namesDirty = False
+        self.savedDirty = False
+        self.lastCompiled = compiled
+        
+        self.clearResults()
+        if not self.analyzer.get_names():
+            self.statusLabel.setText("이름 없음")
+            return
+        
+        self.worker = NamingImpactWorker(self.analyzer, compiled, self)
+        self.worker.reportReady.connect(self.showReport)
+        self.worker.finished.connect(self.onWorkerFinished)
+        self.worker.start()
+    
+    def stopAnalysis(self):
+        """분석 중단 후 작업 스레드가 끝날 때까지 대기 (창을 닫을 때 호출)"""
+        self.debounceTimer.stop()
+        self.restartPending = False
+        if self.worker is not None:
+            self.worker.requestInterruption()
+            self.worker.wait()
+    
+    def onWorkerFinished(self):
+        """작업 스레드 종료 처리"""
+        self.worker.deleteLater()
+        self.worker = None
+        if self.restartPending:
+            self.restartPending = False
+            self.lastCompiled = None
+            self.startAnalysis()
+    
+    def clearResults(self):
+        """결과 표시 초기화"""
+        self.histogramTree.clear()
+        self.unparseableList.clear()
+        self.changedTree.clear()
+        self.shownUnparseable = 0
+        self.shownChanged = 0
+    
+    def showReport(self, report):
+        """누적 보고서 표시 (중단된 작업 스레드에서 늦게 도착한 보고서는 무시)"""
+        if self.sender() is not self.worker:
+            return
+        
+        self.statusLabel.setText(
+            f"분석: {report['processed']}/{report['total']}  "
+            f"분석 불가: {report['unparseableCount']}  "
+            f"변경: {report['changedCount']}"
+        )
+        
+        # 값 분포는 파트 수와 값 종류만큼만 항목이 있으므로 다시 구성
+        self.histogramTree.clear()
+        for partName, counts in report["histograms"].items():
+            partItem = QTreeWidgetItem(self.histogramTree, [partName, str(sum(counts.values()))])
+            for value, count in sorted(counts.items(), key=lambda item: -item[1]):
+                QTreeWidgetItem(partItem, [value, str(count)])
+        
+        # 목록은 새로 추가된 항목만 표시
+        for name in report["unparseable"][self.shownUnparseable:]:
+            self.unparseableList.addItem(name)
+        self.shownUnparseable = len(report["unparseable"])
+        
+        for name, changes in report["changed"][self.shownChanged:]:
+            nameItem = QTreeWidgetItem(self.changedTree, [name])
+            for partName, (savedValue, editedValue) in changes.items():
+                QTreeWidgetItem(nameItem, ["", partName, savedValue, editedValue])
+        self.shownChanged = len(report["changed"])
+
 class NameConfigToolUI(QMainWindow):
     """네이밍 설정 도구 메인 UI 클래스"""
     
@@ -171,6 +530,9 @@ class NameConfigToolUI(QMainWindow):
         # NamePart별 고유 색상 저장
         self.partColors = {}
         
+        # 값 테이블에서 편집 중인 NamePart 위젯
+        self.currentPartWidget = None
+        
         # UI 구성
         self.setupUI()
         
@@ -205,6 +567,9 @@ class NameConfigToolUI(QMainWindow):
         # === 편집 영역 ===
         self.setupEditingArea()
         
+        # === 대량 미리보기 영역 ===
+        self.setupBulkPreviewArea()
+        
     def setupFileManagementArea(self):
         """파일 관리 영역 구성"""
         fileGroup = QGroupBox("설정 파일 관리")
@@ -365,9 +730,12 @@ class NameConfigToolUI(QMainWindow):
         valuesGroup = QGroupBox("사전 정의 값")
         valuesLayout = QVBoxLayout(valuesGroup)
         
-        # 테이블로 값, 설명, 한국어 설명 편집
-        self.valuesTable = QTableWidget(0, 3) # 열 개수 3으로 변경
-        self.valuesTable.setHorizontalHeaderLabels(["값", "설명", "한국어 설명"]) # 헤더 추가
+        # 테이블로 값, 설명, 한국어 설명 편집 (모델이 NamePart를 직접 편집)
+        self.valuesModel = NamePartValuesModel(self)
+        self.valuesModel.dataChanged.connect(self.onValuesDataChanged)
+        self.valuesTable = QTableView()
+        self.valuesTable.setModel(self.valuesModel)
+        self.valuesTable.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.valuesTable.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         
         # 버튼 그룹
@@ -402,6 +770,19 @@ class NameConfigToolUI(QMainWindow):
         
         self.mainLayout.addWidget(editGroup)
     
+    def setupBulkPreviewArea(self):
+        """대량 미리보기 패널 구성 (오른쪽 도킹)"""
+        self.bulkPreviewPanel = BulkPreviewPanel(lambda: self.configObj.compile(), self)
+        
+        bulkPreviewDock = QDockWidget("대량 미리보기", self)
+        bulkPreviewDock.setWidget(self.bulkPreviewPanel)
+        self.addDockWidget(Qt.RightDockWidgetArea, bulkPreviewDock)
+    
+    def closeEvent(self, event):
+        """창을 닫을 때 대량 미리보기 분석 중단"""
+        self.bulkPreviewPanel.stopAnalysis()
+        super().closeEvent(event)
+    
     def loadDefaultConfig(self):
         """기본 설정 로드"""
         try:
@@ -412,6 +793,7 @@ class NameConfigToolUI(QMainWindow):
             if success:
                 self.updateUI()
                 self.filePathLabel.setText("파일: 기본 설정")
+                self.bulkPreviewPanel.setSavedConfig(self.configObj.compile())
             else:
                 QMessageBox.warning(self, "경고", "기본 설정을 로드할 수 없습니다.")
         except Exception as e:
@@ -433,6 +815,7 @@ class NameConfigToolUI(QMainWindow):
                     self.currentFilePath = filePath
                     self.filePathLabel.setText(f"파일: {os.path.basename(filePath)}")
                     self.updateUI()
+                    self.bulkPreviewPanel.setSavedConfig(self.configObj.compile())
                 else:
                     QMessageBox.warning(self, "경고", "설정 파일을 로드할 수 없습니다.")
         except Exception as e:
@@ -446,6 +829,7 @@ class NameConfigToolUI(QMainWindow):
                 success = self.configObj.save(self.currentFilePath)
                 
                 if success:
+                    self.bulkPreviewPanel.setSavedConfig(self.configObj.compile())
                     QMessageBox.information(self, "알림", "설정이 저장되었습니다.")
                 else:
                     QMessageBox.warning(self, "경고", "설정을 저장할 수 없습니다.")
@@ -473,6 +857,7 @@ class NameConfigToolUI(QMainWindow):
                 if success:
                     self.currentFilePath = filePath
                     self.filePathLabel.setText(f"파일: {os.path.basename(filePath)}")
+                    self.bulkPreviewPanel.setSavedConfig(self.configObj.compile())
                     QMessageBox.information(self, "알림", "설정이 저장되었습니다.")
                 else:
                     QMessageBox.warning(self, "경고", "설정을 저장할 수 없습니다.")
@@ -571,7 +956,10 @@ class NameConfigToolUI(QMainWindow):
                 QMessageBox.warning(self, "경고", "NamePart 제거에 실패했습니다.")
     
     def updatePartsList(self):
-        """NameParts 리스트 업데이트"""
+        """NameParts 리스트 업데이트 (NamePart 추가/제거/불러오기처럼 구조가 바뀔 때만 호출)"""
+        # 위젯이 모두 새로 만들어지므로 편집 중인 값 테이블도 비움
+        self.currentPartWidget = None
+        self.valuesModel.setPart(None)
         self.partsList.clear()
         
         for name in self.configObj.get_part_order():
@@ -704,14 +1092,28 @@ class NameConfigToolUI(QMainWindow):
         
         # Rich Text 형식 사용 설정
         self.previewLabel.setTextFormat(Qt.RichText)
+        
+        # 설정이 바뀌었을 수 있으므로 대량 미리보기 갱신 예약 (같은 설정이면 다시 분석하지 않음)
+        self.bulkPreviewPanel.scheduleUpdate()
     
     def onPartItemSelected(self, item):
         """NamePart 아이템 선택 시 처리"""
         widget = self.partsList.itemWidget(item)
         if widget:
+            self.currentPartWidget = widget
             part = widget.getNamePart()
             self.loadPartDetails(part)
     
+    def selectPart(self, part_name: str):
+        """이름으로 NamePart 아이템을 선택하고 세부 정보 로드"""
+        for i in range(self.partsList.count()):
+            item = self.partsList.item(i)
+            widget = self.partsList.itemWidget(item)
+            if widget and widget.getNamePart().get_name() == part_name:
+                self.partsList.setCurrentItem(item)
+                self.onPartItemSelected(item)
+                return
+    
     def loadPartDetails(self, part: NamePart):
         """선택한 NamePart의 세부 정보 로드"""
         # 이름 설정
@@ -742,29 +1144,16 @@ class NameConfigToolUI(QMainWindow):
         self.updatePartTypeUI()
     
     def updateValuesTable(self, part: NamePart):
-        """값 테이블 업데이트"""
-        self.valuesTable.setRowCount(0)
-        
-        # RealName과 Index는 사전 정의 값이 없음
-        if part.is_realname() or part.is_index():
+        """값 테이블 업데이트 (RealName과 Index는 사전 정의 값이 없으므로 빈 테이블)"""
+        self.valuesModel.setPart(part)
+    
+    def onValuesDataChanged(self, topLeft, bottomRight, roles=None):
+        """값 테이블에서 편집된 행만 NamePart 위젯 드롭다운과 미리보기에 반영"""
+        if not self.currentPartWidget:
             return
-        
-        values = part.get_predefined_values()
-        descriptions = part.get_descriptions()
-        korean_descriptions = part.get_korean_descriptions() # 한국어 설명 가져오기
-        
-        # 테이블에 값, 설명, 한국어 설명 추가
-        for i, value in enumerate(values):
-            self.valuesTable.insertRow(i)
-            self.valuesTable.setItem(i, 0, QTableWidgetItem(value))
-            
-            # 설명 설정
-            description = descriptions[i] if i < len(descriptions) else ""
-            self.valuesTable.setItem(i, 1, QTableWidgetItem(description))
-            
-            # 한국어 설명 설정
-            korean_description = korean_descriptions[i] if i < len(korean_descriptions) else ""
-            self.valuesTable.setItem(i, 2, QTableWidgetItem(korean_description)) # 3번째 열에 추가
+        for row in range(topLeft.row(), bottomRight.row() + 1):
+            self.currentPartWidget.updateValueItem(row)
+        self.updatePreview()
     
     def updatePartTypeUI(self):
         """NamePart 타입에 따라 UI 상태 업데이트"""
@@ -785,26 +1174,30 @@ class NameConfigToolUI(QMainWindow):
             QMessageBox.warning(self, "경고", "먼저 NamePart를 선택하세요.")
             return
         
-        selected_item = selected_items[0]
-        widget = self.partsList.itemWidget(selected_item)
-        part = widget.getNamePart()
-        
-        # 새 행 추가
-        row_count = self.valuesTable.rowCount()
-        self.valuesTable.insertRow(row_count)
-        
-        # 기본값 설정
-        new_value = f"Value{row_count + 1}"
-        new_desc = f"Description{row_count + 1}"
-        new_korean_desc = f"값{row_count + 1}" # 기본 한국어 설명 추가
+        part = self.valuesModel.getPart()
+        if part is None:
+            return
         
-        self.valuesTable.setItem(row_count, 0, QTableWidgetItem(new_value))
-        self.valuesTable.setItem(row_count, 1, QTableWidgetItem(new_desc))
-        self.valuesTable.setItem(row_count, 2, QTableWidgetItem(new_korean_desc)) # 한국어 설명 추가
+        # 기본값 설정 (이미 있는 값이면 번호 증가)
+        row_count = part.get_value_count()
+        number = row_count + 1
+        while part.contains_value(f"Value{number}"):
+            number += 1
+        new_value = f"Value{number}"
+        new_desc = f"Description{number}"
+        new_korean_desc = f"값{number}" # 기본 한국어 설명 추가
+        
+        # 맨 뒤에 추가하고 해당 행과 드롭다운 항목만 갱신
+        if self.valuesModel.addValue(new_value, new_desc, new_korean_desc):
+            if self.currentPartWidget:
+                self.currentPartWidget.insertValueItem(row_count)
+            self.bulkPreviewPanel.scheduleUpdate()
+            if row_count < self.valuesModel.rowCount():
+                self.valuesTable.scrollTo(self.valuesModel.index(row_count, 0))
     
     def removeValue(self):
         """값 삭제"""
-        selected_rows = self.valuesTable.selectedItems()
+        selected_rows = self.valuesTable.selectionModel().selectedIndexes()
         if not selected_rows:
             QMessageBox.warning(self, "경고", "삭제할 값을 선택하세요.")
             return
@@ -813,12 +1206,15 @@ class NameConfigToolUI(QMainWindow):
         row = selected_rows[0].row()
         
         # 값이 하나 이상 남아있는지 확인
-        if self.valuesTable.rowCount() <= 1:
+        if self.valuesModel.valueCount() <= 1:
             QMessageBox.warning(self, "경고", "최소 하나의 값이 필요합니다.")
             return
         
-        # 행 삭제
-        self.valuesTable.removeRow(row)
+        # 행 삭제 (NamePart에서 바로 제거)
+        if self.valuesModel.removeRows(row, 1):
+            if self.currentPartWidget:
+                self.currentPartWidget.removeValueItem(row)
+            self.bulkPreviewPanel.scheduleUpdate()
     
     def updatePaddingNum(self, value):
         """패딩 자릿수 업데이트"""
@@ -843,7 +1239,8 @@ class NameConfigToolUI(QMainWindow):
             new_type_str = self.partTypeCombo.currentText()
             new_type = NamePartType[new_type_str]
             
-            if new_type != part.get_type():
+            type_changed = new_type != part.get_type()
+            if type_changed:
                 self.configObj.set_part_type(old_name, new_type)
             
             # Direction 설정 변경
@@ -852,12 +1249,12 @@ class NameConfigToolUI(QMainWindow):
                 # is_direction 값이 변경되었는지 확인
                 is_direction = self.directionCheckBox.isChecked()
                 if is_direction != part_obj.is_direction():
-                    # NamePart 객체의 _isDirection 속성 직접 설정
-                    part_obj._isDirection = is_direction
+                    part_obj.set_direction(is_direction)
             
             # 이름 변경 - 필수 부분이 아닌 경우만
             new_name = self.partNameEdit.text()
-            if new_name and new_name != old_name and old_name not in self.configObj.required_parts:
+            name_changed = bool(new_name) and new_name != old_name and old_name not in self.configObj.required_parts
+            if name_changed:
                 # 이름이 변경되었는지 확인
                 if self.configObj.get_part(new_name):
                     QMessageBox.warning(self, "경고", f"'{new_name}' NamePart가 이미 존재합니다.")
@@ -876,31 +1273,13 @@ class NameConfigToolUI(QMainWindow):
                         part_order[idx] = new_name
                         self.configObj._update_part_order()
             
-            # 값, 설명, 한국어 설명 변경 (RealName, Index 타입이 아닌 경우)
-            current_name = new_name if new_name and new_name != old_name and old_name not in self.configObj.required_parts else old_name
-            current_part = self.configObj.get_part(current_name)
-            
-            if not current_part.is_realname() and not current_part.is_index():
-                values = []
-                descriptions = []
-                korean_descriptions = [] # 한국어 설명 리스트 추가
-                
-                for row in range(self.valuesTable.rowCount()):
-                    value_item = self.valuesTable.item(row, 0)
-                    desc_item = self.valuesTable.item(row, 1)
-                    korean_desc_item = self.valuesTable.item(row, 2) # 한국어 설명 아이템 가져오기
-                    
-                    if value_item and value_item.text():
-                        values.append(value_item.text())
-                        descriptions.append(desc_item.text() if desc_item else "")
-                        korean_descriptions.append(korean_desc_item.text() if korean_desc_item else "") # 한국어 설명 추가
-                
-                # 값 설정 (한국어 설명 포함)
-                if values:
-                    current_part.set_predefined_values(values, descriptions, korean_descriptions)
-            
-            # UI 업데이트
-            self.updateUI()
+            # 값, 설명, 한국어 설명은 값 테이블에서 편집할 때 이미 반영됨
+            # 이름이나 타입이 바뀐 경우에만 NamePart 위젯을 다시 만듦
+            if name_changed or type_changed:
+                current_name = new_name if name_changed else old_name
+                self.updatePartsList()
+                self.selectPart(current_name)
+            self.updatePreview()
             
             QMessageBox.information(self, "알림", "변경 사항이 적용되었습니다.")
         except Exception as e:
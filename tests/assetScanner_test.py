@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+AssetScanner 클래스를 위한 테스트 모듈
+병렬 검색 결과가 os.walk 결과와 같고 파일 이름이 분석되는지 확인
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.naming import Naming
+from JalLib.assetScanner import AssetScanner
+
+
+class AssetScannerTest(unittest.TestCase):
+    """AssetScanner 테스트를 위한 테스트 케이스 클래스"""
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화 (임시 폴더 트리 생성)"""
+        config_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "max", "ConfigFiles"))
+        self.naming = Naming(configPath=os.path.join(config_dir, "3DSMaxNamingConfig.json"))
+        self.rootPath = tempfile.mkdtemp()
+        for i in range(3):
+            dirPath = os.path.join(self.rootPath, f"Dir{i}", "Sub")
+            os.makedirs(dirPath)
+            for j in range(4):
+                open(os.path.join(dirPath, f"b_Dum_L_Arm_{j:02d}.max"), "w").close()
+        open(os.path.join(self.rootPath, "Box.txt"), "w").close()
+
+    def tearDown(self):
+        shutil.rmtree(self.rootPath)
+
+    def test_scan(self):
+        records = list(AssetScanner(self.naming, inWorkers=4, inBatchSize=5).scan(self.rootPath))
+        expected = sorted(os.path.join(dirPath, fileName) for dirPath, _, fileNames in os.walk(self.rootPath) for fileName in fileNames)
+        self.assertEqual(sorted(record[0] for record in records), expected)
+
+        partsByPath = {filePath: partsDict for filePath, partsDict, _ in records}
+        partsDict = partsByPath[os.path.join(self.rootPath, "Dir1", "Sub", "b_Dum_L_Arm_03.max")]
+        self.assertEqual((partsDict["Side"], partsDict["RealName"], partsDict["Index"]), ("L", "Arm", "03"))
+        self.assertEqual(partsByPath[os.path.join(self.rootPath, "Box.txt")]["RealName"], "Box")
+        self.assertTrue(all(stat.st_size == 0 for _, _, stat in records))
+
+
+if __name__ == "__main__":
+    unittest.main()
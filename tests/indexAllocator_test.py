@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+IndexAllocator 클래스를 위한 테스트 모듈
+장면 이름으로 초기화한 뒤 빈 인덱스를 충돌 없이 할당하는지 확인
+"""
+
+import sys
+import os
+import unittest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.naming import Naming
+from JalLib.indexAllocator import IndexAllocator
+
+
+class IndexAllocatorTest(unittest.TestCase):
+    """IndexAllocator 테스트를 위한 테스트 케이스 클래스"""
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화"""
+        config_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "max", "ConfigFiles"))
+        self.naming = Naming(configPath=os.path.join(config_dir, "3DSMaxNamingConfig.json"))
+        self.sceneNames = ["b_Dum_L_Arm_00", "b_Dum_L_Arm_01", "b_Dum_L_Arm_03", "b_Dum_R_Arm_00", "Box01"]
+        self.allocator = IndexAllocator(self.naming, self.sceneNames)
+
+    def test_fills_gaps(self):
+        self.assertEqual(self.allocator.allocate_name("b_Dum_L_Arm_00"), "b_Dum_L_Arm_02")
+        self.assertEqual(self.allocator.allocate_name("b_Dum_L_Arm_00"), "b_Dum_L_Arm_04")
+        self.assertEqual(self.allocator.allocate_name("b_Dum_R_Arm_05"), "b_Dum_R_Arm_05")
+
+    def test_batch_reserves(self):
+        names = self.allocator.allocate_names("b_Dum_L_Arm", 3)
+        self.assertEqual(names, ["b_Dum_L_Arm_02", "b_Dum_L_Arm_04", "b_Dum_L_Arm_05"])
+        self.assertTrue(all(self.allocator.is_used(name) for name in names))
+        self.assertEqual(self.allocator.allocate_name("Box01", 1), "Box02")
+
+    def test_release(self):
+        self.assertTrue(self.allocator.release("b_Dum_L_Arm_00"))
+        self.assertEqual(self.allocator.allocate_name("b_Dum_L_Arm_03", 0), "b_Dum_L_Arm_00")
+        self.assertFalse(self.allocator.release("b_Dum_L_Arm_09"))
+
+    def test_pointer_moves_for_start_index(self):
+        key = self.allocator.get_key("b_Dum_L_Arm_00")
+        self.assertEqual(self.allocator.allocate_name("b_Dum_L_Arm_00", 1), "b_Dum_L_Arm_02")
+        self.assertEqual(self.allocator._nextFree[key][1], 3)
+        self.assertEqual(self.allocator.allocate_name("b_Dum_L_Arm_00", 1), "b_Dum_L_Arm_04")
+        self.assertEqual(self.allocator._nextFree[key][1], 5)
+
+        # 시작 인덱스가 다르면 포인터도 따로 관리 (0은 여전히 사용 중)
+        self.assertTrue(self.allocator.release("b_Dum_L_Arm_00"))
+        self.assertEqual(self.allocator.allocate_name("b_Dum_L_Arm_00", 1), "b_Dum_L_Arm_05")
+        self.assertEqual(self.allocator.allocate_name("b_Dum_L_Arm_00", 0), "b_Dum_L_Arm_00")
+
+        # 해제하면 해당 구간의 포인터를 되돌림
+        self.assertTrue(self.allocator.release("b_Dum_L_Arm_02"))
+        self.assertEqual(self.allocator.allocate_name("b_Dum_L_Arm_00", 1), "b_Dum_L_Arm_02")
+
+
+if __name__ == "__main__":
+    unittest.main()
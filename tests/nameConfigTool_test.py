@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+nameConfigTool 모듈을 위한 테스트 모듈
+화면 없이(QT_QPA_PLATFORM=offscreen) 값 테이블 모델과 메인 UI의 부분 갱신을 확인
+"""
+
+import sys
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+tool_dir = os.path.join(root_dir, "Tools", "nameConfigTool")
+if tool_dir not in sys.path:
+    sys.path.append(tool_dir)
+
+try:
+    from PySide2.QtWidgets import QApplication
+    from nameConfigTool import NameConfigToolUI, NamePartValuesModel
+    QT_AVAILABLE = True
+except ImportError:
+    QT_AVAILABLE = False
+
+from JalLib.namePart import NamePart, NamePartType
+
+
+@unittest.skipUnless(QT_AVAILABLE, "PySide2가 설치되어 있지 않음")
+class NamePartValuesModelTest(unittest.TestCase):
+    """NamePartValuesModel 테스트를 위한 테스트 케이스 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화"""
+        count = NamePartValuesModel.FETCH_SIZE * 2 + 100
+        self.part = NamePart("Type", NamePartType.PREFIX,
+                             [f"V{i}" for i in range(count)],
+                             [f"Desc{i}" for i in range(count)],
+                             False,
+                             [f"값{i}" for i in range(count)])
+        self.model = NamePartValuesModel()
+        self.model.setPart(self.part)
+
+    def test_fetch_more(self):
+        fetchSize = NamePartValuesModel.FETCH_SIZE
+        self.assertEqual(self.model.rowCount(), fetchSize)
+        self.assertTrue(self.model.canFetchMore())
+
+        inserted = []
+        self.model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+        self.model.fetchMore()
+        self.model.fetchMore()
+        self.assertEqual(inserted, [(fetchSize, fetchSize * 2 - 1), (fetchSize * 2, fetchSize * 2 + 99)])
+        self.assertFalse(self.model.canFetchMore())
+        self.assertEqual(self.model.data(self.model.index(fetchSize * 2 + 99, 2)), f"값{fetchSize * 2 + 99}")
+
+    def test_set_data(self):
+        changed = []
+        self.model.dataChanged.connect(lambda topLeft, bottomRight, roles=None: changed.append((topLeft.row(), topLeft.column(), bottomRight.row(), bottomRight.column())))
+
+        self.assertTrue(self.model.setData(self.model.index(3, 0), "Renamed"))
+        self.assertTrue(self.model.setData(self.model.index(3, 1), "NewDesc"))
+        self.assertEqual(changed, [(3, 0, 3, 0), (3, 1, 3, 1)])
+        self.assertEqual(self.part.get_value_at_index(3), "Renamed")
+        self.assertEqual(self.part.get_description_by_value("Renamed"), "NewDesc")
+
+        # 빈 값이나 이미 있는 값으로는 바꿀 수 없음
+        self.assertFalse(self.model.setData(self.model.index(4, 0), ""))
+        self.assertFalse(self.model.setData(self.model.index(4, 0), "V0"))
+        self.assertEqual(len(changed), 2)
+
+    def test_add_and_remove(self):
+        # 모든 행을 불러오기 전에는 fetchMore에서 새 값을 표시
+        self.assertTrue(self.model.addValue("New", "NewDesc", "새 값"))
+        self.assertFalse(self.model.addValue("New"))
+        self.assertEqual(self.model.rowCount(), NamePartValuesModel.FETCH_SIZE)
+        while self.model.canFetchMore():
+            self.model.fetchMore()
+        self.assertEqual(self.model.data(self.model.index(self.model.rowCount() - 1, 0)), "New")
+
+        self.assertTrue(self.model.addValue("Last"))
+        self.assertEqual(self.model.rowCount(), self.part.get_value_count())
+
+        self.assertTrue(self.model.removeRows(0, 2))
+        self.assertEqual(self.part.get_value_at_index(0), "V2")
+        self.assertEqual(self.model.rowCount(), self.part.get_value_count())
+
+    def test_no_values_type(self):
+        self.model.setPart(NamePart("RealName", NamePartType.REALNAME))
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertFalse(self.model.canFetchMore())
+
+
+@unittest.skipUnless(QT_AVAILABLE, "PySide2가 설치되어 있지 않음")
+class NameConfigToolUITest(unittest.TestCase):
+    """NameConfigToolUI 테스트를 위한 테스트 케이스 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화"""
+        self.window = NameConfigToolUI()
+        self.window.selectPart("Prefix")
+        self.widget = self.window.currentPartWidget
+
+    def tearDown(self):
+        self.window.deleteLater()
+
+    def test_edit_updates_combo_only(self):
+        self.assertEqual(self.widget.getNamePart().get_name(), "Prefix")
+        model = self.window.valuesModel
+        value = model.data(model.index(0, 0))
+        self.assertEqual(self.widget.valueCombo.itemData(0), value)
+
+        self.assertTrue(model.setData(model.index(0, 0), value + "X"))
+        self.assertEqual(self.widget.valueCombo.itemData(0), value + "X")
+        self.assertIs(self.window.currentPartWidget, self.widget)
+        self.assertIn(value + "X", self.window.previewName)
+
+    def test_add_and_remove_value(self):
+        count = self.widget.valueCombo.count()
+        self.window.addValue()
+        self.assertEqual(self.widget.valueCombo.count(), count + 1)
+        self.assertEqual(self.widget.valueCombo.itemData(count), self.widget.getNamePart().get_value_at_index(count))
+
+        self.window.valuesTable.selectRow(count)
+        self.window.removeValue()
+        self.assertEqual(self.widget.valueCombo.count(), count)
+        self.assertEqual(self.widget.getNamePart().get_value_count(), count)
+
+    def runBulkPreview(self):
+        """디바운스 없이 대량 미리보기를 실행하고 작업 스레드의 보고서를 모두 전달"""
+        panel = self.window.bulkPreviewPanel
+        panel.startAnalysis()
+        while panel.worker is not None:
+            panel.worker.wait()
+            self.app.processEvents()
+        return panel
+
+    def test_bulk_preview(self):
+        panel = self.window.bulkPreviewPanel
+        panel.namesEdit.setPlainText("Pr_Arm_01_Su\nXx_Leg_02\n\nPr_01")
+        panel = self.runBulkPreview()
+        self.assertEqual(panel.unparseableList.count(), 1)
+        self.assertEqual(panel.unparseableList.item(0).text(), "Pr_01")
+        self.assertEqual(panel.changedTree.topLevelItemCount(), 0)
+        self.assertEqual(panel.histogramTree.topLevelItem(0).text(0), "Prefix")
+
+        # 편집 중인 설정에서 분석 결과가 달라지는 이름만 표시
+        self.window.valuesModel.addValue("Xx", "Extra", "추가")
+        panel = self.runBulkPreview()
+        self.assertEqual(panel.changedTree.topLevelItemCount(), 1)
+        self.assertEqual(panel.changedTree.topLevelItem(0).text(0), "Xx_Leg_02")
+
+
+if __name__ == "__main__":
+    unittest.main()
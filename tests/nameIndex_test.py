@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+NameIndex 클래스를 위한 테스트 모듈
+파트 값 조건/인덱스 범위 검색과 증분 추가, 제거, 이름 변경을 확인
+"""
+
+import sys
+import os
+import unittest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.naming import Naming
+from JalLib.nameIndex import NameIndex
+
+
+class NameIndexTest(unittest.TestCase):
+    """NameIndex 테스트를 위한 테스트 케이스 클래스"""
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화"""
+        config_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "max", "ConfigFiles"))
+        self.naming = Naming(configPath=os.path.join(config_dir, "3DSMaxNamingConfig.json"))
+        self.sceneNames = ["b_Dum_L_Arm_02", "b_Dum_L_Arm_05", "b_Dum_R_Arm_05", "b_L_Thigh_07", "Box", "b_Dum_L_Leg"]
+        self.index = NameIndex(self.naming, self.sceneNames)
+
+    def test_query(self):
+        self.assertEqual(self.index.query({"Side": "L", "Type": "Dum"}), ["b_Dum_L_Arm_02", "b_Dum_L_Arm_05", "b_Dum_L_Leg"])
+        self.assertEqual(self.index.query({"Side": "L", "Type": "Dum"}, inMinIndex=4), ["b_Dum_L_Arm_05"])
+        self.assertEqual(self.index.query({"Side": ["L", "R"]}, inMinIndex=5, inMaxIndex=6), ["b_Dum_L_Arm_05", "b_Dum_R_Arm_05"])
+        self.assertEqual(self.index.query(inMaxIndex=2), ["b_Dum_L_Arm_02"])
+        self.assertEqual(self.index.query({"Side": "X"}), [])
+        self.assertEqual(len(self.index.query()), len(self.sceneNames))
+        self.assertEqual(self.index.get_values("Side"), ["L", "R"])
+
+    def test_incremental_update(self):
+        self.index.add("b_Dum_L_Arm_02")
+        self.assertTrue(self.index.remove("b_Dum_L_Arm_02"))
+        self.assertIn("b_Dum_L_Arm_02", self.index)
+
+        self.assertTrue(self.index.remove("b_Dum_L_Arm_02"))
+        self.assertNotIn("b_Dum_L_Arm_02", self.index)
+        self.assertFalse(self.index.remove("b_Dum_L_Arm_02"))
+        self.assertEqual(self.index.query(inMaxIndex=2), [])
+
+        self.assertTrue(self.index.rename("b_Dum_R_Arm_05", "b_Dum_R_Arm_09"))
+        self.assertEqual(self.index.query({"Side": "R"}, inMinIndex=6), ["b_Dum_R_Arm_09"])
+        self.assertEqual(self.index.get_values("Side"), ["L", "R"])
+
+
+if __name__ == "__main__":
+    unittest.main()
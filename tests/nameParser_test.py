@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+NameParser 클래스를 위한 테스트 모듈
+컴파일된 분석기의 결과가 기존 Naming 분석 규칙과 일치하는지 확인
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.naming import Naming
+from JalLib.nameParser import NameParser
+from JalLib.namingConfig import NamingConfig, get_config_load_cache
+
+
+class NameParserTest(unittest.TestCase):
+    """NameParser 테스트를 위한 테스트 케이스 클래스"""
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화"""
+        config_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "max", "ConfigFiles"))
+        self.naming = Naming(configPath=os.path.join(config_dir, "3DSMaxNamingConfig.json"))
+
+    def test_parser_compiled_on_apply(self):
+        self.assertIsInstance(self.naming._parser, NameParser)
+        self.assertEqual(self.naming._parser.get_part_names(), ["Base", "Type", "Side", "FrontBack", "RealName", "Index", "Nub"])
+
+    def test_split_to_array(self):
+        self.assertEqual(self.naming._split_to_array("BipL001UpperArm02"), ["Bip", "L", "001", "Upper", "Arm", "02"])
+        self.assertEqual(self.naming._split_to_array("01Arm"), ["01", "Arm"])
+        self.assertEqual(self.naming._split_to_array("b__L_Thigh_00_"), ["b", "L", "Thigh", "00"])
+        self.assertEqual(self.naming._split_to_array(" Bip001  L Forearm"), ["Bip001", "L", "Forearm"])
+        self.assertEqual(self.naming._split_to_array(""), [])
+
+    def test_convert_name_to_array(self):
+        self.assertEqual(self.naming.convert_name_to_array("b_Dum_R_F_R_Skirt_Nub"), ["b", "Dum", "R", "F", "R_Skirt", "", "Nub"])
+        self.assertEqual(self.naming.convert_name_to_array("Bip001 L Forearm"), ["Bip001", "", "L", "", "Forearm", "", ""])
+        self.assertEqual(self.naming.convert_name_to_array("b_P_F_L_Sleeve_00"), ["b", "P", "", "F", "L_Sleeve", "00", ""])
+        self.assertEqual(self.naming.convert_name_to_array("Sphere01"), ["", "", "", "", "Sphere", "01", ""])
+
+    def test_convert_to_dictionary(self):
+        nameDict = self.naming.convert_to_dictionary("b_Dum_R_F_R_Skirt_Nub")
+        self.assertEqual(list(nameDict.keys())[-1], "RealName")
+        self.assertEqual(nameDict["RealName"], "R_Skirt")
+        self.assertEqual(nameDict["Side"], "R")
+        self.assertEqual(self.naming.get_name("RealName", "b_Dum_R_F_R_Skirt_Nub"), "")
+
+    def test_parse_cache(self):
+        self.naming.clear_parse_cache()
+        self.naming.replace_name_part("Side", "b_Dum_L_Arm_01", "R")
+        missCount = self.naming.get_parse_cache_info()["misses"]
+        self.assertEqual(self.naming.replace_name_part("Side", "b_Dum_L_Arm_01", "R"), "b_Dum_R_Arm_01")
+        self.assertEqual(self.naming.get_parse_cache_info()["misses"], missCount)
+        self.assertGreater(self.naming.get_parse_cache_info()["hits"], 0)
+
+    def test_parse_cache_invalidated_on_config_load(self):
+        self.naming.convert_name_to_array("Pr_Arm_01_Su")
+        config_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "ConfigFiles", "namingConfig.json"))
+        self.naming.load_from_config_file(config_path)
+        self.assertEqual(self.naming.get_parse_cache_info()["size"], 0)
+        self.assertEqual(self.naming.convert_name_to_array("Pr_Arm_01_Su"), ["Pr", "Arm", "01", "Su"])
+
+    def test_parse_many(self):
+        names = ["b_Dum_R_F_R_Skirt_Nub", "Bip001 L Forearm", "Sphere01", "b_Dum_R_F_R_Skirt_Nub"]
+        columns = self.naming.parse_many(names)
+        self.assertEqual(columns["FilteringChar"], ["_", " ", "", "_"])
+        for i, name in enumerate(names):
+            row = [columns[partName][i] for partName in self.naming._parser.get_part_names()]
+            self.assertEqual(row, self.naming.convert_name_to_array(name))
+
+    def test_iter_parse_many(self):
+        names = ["b_L_Thigh_00", "Box 01", "b_P_F_L_Sleeve_00"]
+        chunks = list(self.naming.iter_parse_many(iter(names), inChunkSize=2))
+        self.assertEqual([len(chunk["RealName"]) for chunk in chunks], [2, 1])
+        self.assertEqual(chunks[0]["RealName"] + chunks[1]["RealName"], self.naming.parse_many(names)["RealName"])
+
+    def test_parse_many_workers(self):
+        names = ["b_Dum_R_F_R_Skirt_Nub", "Bip001 L Forearm", "Sphere01", "b_L_Thigh_00", "Box 01"] * 3
+        columns = self.naming.parse_many(iter(names), inWorkers=2, inChunkSize=4)
+        self.assertEqual(columns, self.naming.parse_many(names))
+
+    def test_parsed_name(self):
+        parsedName = self.naming.parse_name("b_Dum_L_Arm_1")
+        self.assertEqual(str(parsedName), "b_Dum_L_Arm_01")
+        self.assertEqual(parsedName.get("Side"), "L")
+
+        renamed = parsedName.with_part("Type", "P").bump_index(2).mirrored().with_filtering_char(" ")
+        self.assertEqual(str(renamed), "b P R Arm 03")
+        self.assertEqual(str(parsedName.without_part("Base")), self.naming.remove_name_part("Base", "b_Dum_L_Arm_1"))
+        self.assertEqual(str(parsedName.with_index_padding(3)), "b_Dum_L_Arm_001")
+        self.assertEqual(str(parsedName), "b_Dum_L_Arm_01")
+        self.assertRaises(KeyError, parsedName.with_part, "Unknown", "X")
+
+    def test_mirror_tables(self):
+        self.assertEqual(self.naming._get_parser().get_mirror_table("Side")["L"], "R")
+        self.assertEqual(self.naming._get_parser().get_mirror_table("RealName"), {})
+
+        names = ["b_Dum_L_Arm_00", "Bip001 R Forearm", "b_Dum_F_L_Skirt_Nub", "Sphere01", "b_Dum_L_Arm_00"]
+        mirroredNames = self.naming.gen_mirroring_names(names)
+        self.assertEqual(mirroredNames, [self.naming.gen_mirroring_name(name) for name in names])
+        self.assertEqual(mirroredNames[0], "b_Dum_R_Arm_00")
+
+
+    def test_shared_compiled_config(self):
+        other = Naming(configPath=self.naming.get_config_path())
+        compiled = self.naming.get_compiled_config()
+        self.assertIs(compiled, other.get_compiled_config())
+        self.assertIs(self.naming._find_name_part("Side"), other._find_name_part("Side"))
+        self.assertIs(self.naming._parser, other._parser)
+        self.assertEqual(hash(compiled), hash(other.get_compiled_config()))
+
+        # 수정 시에만 복사 (다른 Naming에는 영향 없음)
+        other.get_mutable_name_part("Side").add_predefined_value("C", "Center")
+        self.assertIsNone(other.get_compiled_config())
+        self.assertTrue(other.is_in_name_part_predefined_values("Side", "C"))
+        self.assertFalse(self.naming.is_in_name_part_predefined_values("Side", "C"))
+        self.assertEqual(other.get_name("Side", "b_C_Arm_00"), "C")
+        self.assertEqual(self.naming.get_name("Side", "b_C_Arm_00"), "")
+
+    def test_get_name_part_read_only(self):
+        compiled = self.naming.get_compiled_config()
+        parser = self.naming._get_parser()
+        self.naming.clear_parse_cache()
+
+        # create_helper처럼 객체마다 Type 파트를 읽어도 공유 스냅샷과 파싱 캐시는 그대로
+        for i in range(3):
+            typePart = self.naming.get_name_part("Type")
+            typePart.get_predefined_values()
+            typePart.get_value_by_min_weight()
+            self.assertEqual(self.naming.get_name("Side", "b_Dum_L_Arm_00"), "L")
+        self.assertIs(self.naming.get_compiled_config(), compiled)
+        self.assertIs(self.naming._get_parser(), parser)
+        self.assertEqual(self.naming.get_parse_cache_info()["hits"], 2)
+
+    def test_get_mutable_name_part_copy_on_write(self):
+        config_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "ConfigFiles", "CharAnimNamingConfig.json"))
+        first = Naming(configPath=config_path)
+        second = Naming(configPath=config_path)
+        compiled = second.get_compiled_config()
+        key = compiled.get_key()
+        parser = first._get_parser()
+
+        # 분리만 하고 수정하지 않으면 이름 분석기와 파싱 캐시를 그대로 사용
+        first.get_mutable_name_part("AssetType")
+        first.get_mutable_name_part("AssetType")
+        self.assertIsNone(first.get_compiled_config())
+        self.assertIs(first._get_parser(), parser)
+
+        # 수정한 NamePart는 공유 스냅샷과 다른 Naming에 영향 없음
+        first.get_mutable_name_part("AssetType").add_predefined_value("ZZZ")
+        self.assertIsNot(first._get_parser(), parser)
+        self.assertIsNone(first.get_compiled_config())
+        self.assertTrue(first.is_in_name_part_predefined_values("AssetType", "ZZZ"))
+        self.assertFalse(second.is_in_name_part_predefined_values("AssetType", "ZZZ"))
+        self.assertEqual(compiled.get_key(), key)
+        self.assertEqual(hash(compiled), hash(key))
+        self.assertEqual(compiled.make_key(compiled.get_name_parts(), compiled.get_padding_num()), key)
+        self.assertFalse(Naming(configPath=config_path).is_in_name_part_predefined_values("AssetType", "ZZZ"))
+
+
+    def test_config_load_cache(self):
+        tempDir = tempfile.mkdtemp()
+        try:
+            configPath = os.path.join(tempDir, "naming.json")
+            shutil.copy(self.naming.get_config_path(), configPath)
+            cache = get_config_load_cache()
+            cache.invalidate()
+            cache.reset_stats()
+
+            first = Naming(configPath=configPath)
+            second = Naming(configPath=configPath)
+            self.assertEqual(cache.get_stats(), {"hits": 1, "misses": 1, "size": 1})
+            self.assertIs(first.get_compiled_config(), second.get_compiled_config())
+
+            # 저장하면 캐시가 무효화되어 바뀐 내용을 다시 읽음
+            config = NamingConfig()
+            self.assertTrue(config.load(configPath))
+            config.padding_num = 3
+            self.assertTrue(config.save(configPath))
+            self.assertEqual(Naming(configPath=configPath).get_padding_num(), 3)
+
+            cache.invalidate(configPath)
+            self.assertEqual(cache.get_stats()["size"], 0)
+        finally:
+            shutil.rmtree(tempDir)
+
+
+    def test_sort_by_index_key(self):
+        names = ["b_L_Arm_02", "b_R_Arm_01", "b_L_Arm_00", "b_L_Arm_02", "Box", "b_L_Arm_01"]
+        self.assertEqual(self.naming.sort_by_index(names), ["b_L_Arm_00", "Box", "b_R_Arm_01", "b_L_Arm_01", "b_L_Arm_02", "b_L_Arm_02"])
+
+        # 이름이 중복되어도 객체를 그대로 돌려주며 같은 키는 원래 순서 유지
+        items = [(name, i) for i, name in enumerate(names)]
+        sortedItems = self.naming.sort_by_index_key(items, lambda item: item[0])
+        self.assertEqual([item[1] for item in sortedItems], [4, 2, 5, 0, 3, 1])
+        self.assertEqual(self.naming.sort_by_index_key(iter(names)), [item[0] for item in sortedItems])
+        self.assertEqual(self.naming.sort_by_index_key([]), [])
+
+    def test_sort_by_index_key_without_index_part(self):
+        config_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "ConfigFiles", "CharModelerPathConfig.json"))
+        naming = Naming(configPath=config_path)
+        self.assertEqual(naming.get_name_part_index("Index"), -1)
+
+        # Index 파트가 없으면 마지막 파트(Slot)를 비우지 않고 get_string과 같은 키 사용
+        names = ["KimDokja_Body_Upper", "KimDokja_Body_Hair", "KimDokja_Body_Upper"]
+        self.assertEqual([key for key, _ in naming._iter_index_sort_keys(names)], [naming.get_string(name) for name in names])
+        self.assertEqual(naming.sort_by_index_key(names), ["KimDokja_Body_Hair", "KimDokja_Body_Upper", "KimDokja_Body_Upper"])
+
+
+    def test_config_artifact(self):
+        tempDir = tempfile.mkdtemp()
+        try:
+            configPath = os.path.join(tempDir, "naming.json")
+            shutil.copy(self.naming.get_config_path(), configPath)
+            artifactPath = NamingConfig().compile_artifact(configPath)
+            self.assertEqual(artifactPath, NamingConfig.get_artifact_path(configPath))
+            self.assertTrue(os.path.isfile(artifactPath))
+
+            get_config_load_cache().invalidate()
+            naming = Naming(configPath=configPath)
+            self.assertEqual(naming._parser.get_fingerprint(), self.naming._parser.get_fingerprint())
+            self.assertEqual(naming.gen_mirroring_name("b_Dum_L_Arm_1"), "b_Dum_R_Arm_1")
+
+            # 원본 JSON이 바뀌면 컴파일된 파일 대신 JSON을 사용
+            config = NamingConfig()
+            self.assertTrue(config.load(configPath))
+            config.get_part("Side").add_predefined_value("C", "Center")
+            with open(configPath, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"paddingNum": 3, "nameParts": [part.to_dict() for part in config.name_parts]}))
+            get_config_load_cache().invalidate()
+            naming = Naming(configPath=configPath)
+            self.assertEqual(naming.get_padding_num(), 3)
+            self.assertEqual(naming.get_name("Side", "b_C_Arm_00"), "C")
+        finally:
+            shutil.rmtree(tempDir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+NamePart 클래스를 위한 테스트 모듈
+사전 정의 값 조회 인덱스가 값 추가/제거/설정 후에도 동기화되는지 확인
+"""
+
+import sys
+import os
+import unittest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.namePart import NamePart, NamePartType
+
+
+class NamePartTest(unittest.TestCase):
+    """NamePart 테스트를 위한 테스트 케이스 클래스"""
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화"""
+        self.part = NamePart("Type", NamePartType.PREFIX,
+                             ["P", "Dum", "Exp", "IK", "T"],
+                             ["Parent", "Dummy", "ExposeTM", "IK", "Target"],
+                             False,
+                             ["부모", "더미", "익스포즈", "IK", "타겟"])
+
+    def test_lookup(self):
+        self.assertTrue(self.part.contains_value("Dum"))
+        self.assertFalse(self.part.contains_value("Dummy"))
+        self.assertEqual(self.part.get_description_by_value("Exp"), "ExposeTM")
+        self.assertEqual(self.part.get_value_by_description("Target"), "T")
+        self.assertEqual(self.part.get_value_by_korean_description("더미"), "Dum")
+        self.assertEqual(self.part.get_most_different_weight_value("P"), "T")
+
+    def test_index_sync_after_edit(self):
+        self.part.remove_predefined_value("Dum")
+        self.assertFalse(self.part.contains_value("Dum"))
+        self.assertEqual(self.part.get_value_by_description("ExposeTM"), "Exp")
+        self.assertEqual(self.part.get_description_by_value("T"), "Target")
+
+        self.part.add_predefined_value("Ctrl", "Control", "컨트롤")
+        self.assertEqual(self.part.get_value_by_korean_description("컨트롤"), "Ctrl")
+        self.assertEqual(self.part.get_most_different_weight_value("P"), "Ctrl")
+
+        self.part.set_description("Ctrl", "Controller")
+        self.assertEqual(self.part.get_value_by_description("Controller"), "Ctrl")
+        self.assertEqual(self.part.get_value_by_description("Control"), "")
+
+        self.part.set_predefined_values(["L", "R"], ["Left", "Right"])
+        self.assertFalse(self.part.contains_value("P"))
+        self.assertEqual(self.part.get_value_by_description("Right"), "R")
+
+    def test_weights_follow_position(self):
+        self.part.remove_predefined_value("P")
+        self.part.remove_predefined_value("IK")
+        self.assertEqual(self.part.get_predefined_values(), ["Dum", "Exp", "T"])
+        self.assertEqual(self.part.get_korean_descriptions(), ["더미", "익스포즈", "타겟"])
+        self.assertEqual(self.part.to_dict()["weights"], [5, 10, 15])
+        self.assertEqual(self.part.get_value_by_weight(10), "Exp")
+        self.assertEqual(self.part.get_most_different_weight_value("T"), "Dum")
+        self.assertEqual(self.part.get_value_at_index(2), "T")
+
+    def test_duplicate_values(self):
+        part = NamePart("Side", NamePartType.PREFIX, ["L", "R", "L"], ["Left", "Right", "Left2"])
+        self.assertEqual(part.get_description_by_value("L"), "Left")
+        self.assertTrue(part.remove_predefined_value("L"))
+        self.assertEqual(part.get_predefined_values(), ["R", "L"])
+        self.assertEqual(part.get_description_by_value("L"), "Left2")
+        self.assertEqual(part.get_most_different_weight_value("R"), "L")
+
+    def test_rename_value(self):
+        self.assertTrue(self.part.rename_predefined_value("Exp", "Ex"))
+        self.assertEqual(self.part.get_value_at_index(2), "Ex")
+        self.assertEqual(self.part.get_description_by_value("Ex"), self.part.get_descriptions()[2])
+        self.assertFalse(self.part.contains_value("Exp"))
+        self.assertFalse(self.part.rename_predefined_value("Ex", "P"))
+        self.assertFalse(self.part.rename_predefined_value("Missing", "X"))
+
+        part = NamePart("Side", NamePartType.PREFIX, ["L", "R", "L"], ["Left", "Right", "Left2"])
+        self.assertTrue(part.rename_predefined_value("L", "C"))
+        self.assertEqual(part.get_predefined_values(), ["C", "R", "L"])
+        self.assertEqual(part.get_description_by_value("L"), "Left2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+NameToPath.gen_paths를 위한 테스트 모듈
+일괄 경로 생성 결과가 gen_path와 같은지, ensure_dirs가 폴더를 만드는지 확인
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.naming import Naming
+from JalLib.nameToPath import NameToPath
+
+
+class NameToPathBatchTest(unittest.TestCase):
+    """NameToPath.gen_paths 테스트를 위한 테스트 케이스 클래스"""
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화"""
+        config_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "ConfigFiles"))
+        self.rootPath = tempfile.mkdtemp()
+        self.sourceNaming = Naming(configPath=os.path.join(config_dir, "CharModelerNamingConfig.json"))
+        self.nameToPath = NameToPath(os.path.join(config_dir, "CharModelerPathConfig.json"), self.rootPath, self.sourceNaming)
+
+    def tearDown(self):
+        shutil.rmtree(self.rootPath)
+
+    def test_gen_paths(self):
+        names = ["T_Mn_KimDokja_M_LongCoat_B_Upper_01_SC", "T_Mn_KimDokja_M_LongCoat_B_Upper_02_SC", "Box"]
+        paths = self.nameToPath.gen_paths(names)
+        self.assertEqual(paths, [self.nameToPath.gen_path(name) for name in names])
+        self.assertEqual(paths[0], paths[1])
+        self.assertTrue(paths[0].startswith(self.rootPath))
+
+    def test_ensure_dirs(self):
+        paths = self.nameToPath.gen_paths(["T_Mn_KimDokja_M_LongCoat_B_Upper_01_SC"], ensure_dirs=True)
+        self.assertTrue(os.path.isdir(paths[0]))
+
+    def test_root_path_required(self):
+        self.nameToPath.set_root_path(None)
+        self.assertRaises(ValueError, self.nameToPath.gen_paths, ["Box"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+NameValidator 클래스를 위한 테스트 모듈
+문제 유형별 검사 결과와 누적 보고서의 개수/예시 제한을 확인
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.naming import Naming
+from JalLib.nameValidator import NameValidator
+
+
+class NameValidatorTest(unittest.TestCase):
+    """NameValidator 테스트를 위한 테스트 케이스 클래스"""
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화"""
+        config_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "max", "ConfigFiles"))
+        self.naming = Naming(configPath=os.path.join(config_dir, "3DSMaxNamingConfig.json"))
+        self.validator = NameValidator(self.naming, inSampleLimit=2)
+
+    def test_check_name(self):
+        self.assertEqual(self.validator.check_name("b_Dum_L_Arm_00"), {})
+        self.assertEqual(self.validator.check_name("b_L_Arm_100"), {})
+        self.assertIn(NameValidator.ISSUE_PART_ORDER, self.validator.check_name("L_b_Arm_00"))
+        self.assertIn(NameValidator.ISSUE_PART_ORDER, self.validator.check_name("Nub_b_Arm"))
+        self.assertEqual(self.validator.check_name("x_Dum_L_Arm_00"), {NameValidator.ISSUE_UNKNOWN_PREFIX: "x"})
+        self.assertEqual(self.validator.check_name("b_Arm_Nub_zz"), {NameValidator.ISSUE_UNKNOWN_SUFFIX: "zz"})
+        self.assertIn(NameValidator.ISSUE_PADDING, self.validator.check_name("b_L_Arm_1"))
+        self.assertIn(NameValidator.ISSUE_PADDING, self.validator.check_name("b_L_Arm_001"))
+
+    def test_validate_report(self):
+        names = (name for name in ["Box", "Box", "Box", "b_L_Arm_00", "b_L_Arm_00", "b_L_Arm_1", "b_R_Arm_1"])
+        report = self.validator.validate(names)
+        self.assertEqual(report["total"], 7)
+        self.assertEqual(report["valid"], 2)
+        self.assertEqual(report["issues"][NameValidator.ISSUE_DUPLICATE]["count"], 3)
+        self.assertEqual(report["issues"][NameValidator.ISSUE_PADDING]["count"], 2)
+        self.assertEqual(len(report["issues"][NameValidator.ISSUE_DUPLICATE]["samples"]), 2)
+        self.assertIn("duplicateName: 3", self.validator.format_report())
+
+        self.validator.reset()
+        self.assertEqual(self.validator.get_report()["total"], 0)
+
+    def test_duplicate_indexed_name(self):
+        self.assertEqual(self.validator.feed("b_Dum_L_Arm_00"), {})
+        self.assertEqual(self.validator.feed("b_Dum_L_Arm_01"), {})
+        self.assertEqual(self.validator.feed("b_Dum_L_Arm_00"), {NameValidator.ISSUE_DUPLICATE: "b_Dum_L_Arm_00 x2"})
+        self.assertEqual(self.validator.get_report()["issues"][NameValidator.ISSUE_DUPLICATE]["count"], 1)
+
+        # 다시 초기화하면 이전에 검사한 이름은 잊음
+        self.validator.reset()
+        self.assertEqual(self.validator.feed("b_Dum_L_Arm_00"), {})
+
+    def test_iter_names_from_file(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+            f.write("b_L_Arm_00\n\n  Box  \n")
+        try:
+            self.assertEqual(list(NameValidator.iter_names_from_file(f.name)), ["b_L_Arm_00", "Box"])
+        finally:
+            os.remove(f.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+NamingConfig diff/merge를 위한 테스트 모듈
+파트 내용 해시 비교, 값 기준 비교(순서 변경 구분), 3방향 병합과 충돌 보고를 확인
+"""
+
+import sys
+import os
+import copy
+import unittest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.namingConfig import NamingConfig
+
+
+class NamingConfigDiffTest(unittest.TestCase):
+    """NamingConfig.diff/merge 테스트를 위한 테스트 케이스 클래스"""
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화"""
+        config_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "ConfigFiles"))
+        self.base = NamingConfig()
+        self.base.load(os.path.join(config_dir, "CharAnimNamingConfig.json"))
+
+    def test_diff(self):
+        other = copy.deepcopy(self.base)
+        self.assertTrue(NamingConfig.is_diff_empty(self.base.diff(other)))
+
+        other.set_part_values("Gender", ["N", "F", "M"], ["NonBinary", "Female", "Male"], ["없음", "녀", "남"])
+        other.add_part_value("Species", "Orc", "Orc", "오크")
+        other.remove_part_value("Species", "CheonInho")
+        other.get_part("CharacterRole").set_description("Nc", "Npc")
+        other.remove_part("EndFoot")
+        other.set_padding_num(3)
+
+        result = self.base.diff(other)
+        self.assertEqual(result["paddingNum"], (2, 3))
+        self.assertEqual(result["removedParts"], ["EndFoot"])
+        self.assertEqual(set(result["changedParts"]), {"Gender", "Species", "CharacterRole"})
+
+        # 순서만 바뀐 값은 추가/삭제로 보이지 않음
+        gender = result["changedParts"]["Gender"]
+        self.assertEqual((gender["added"], gender["removed"], gender["changed"], gender["reordered"]), ([], [], {}, True))
+        species = result["changedParts"]["Species"]
+        self.assertEqual((species["added"], species["removed"], species["reordered"]), (["Orc"], ["CheonInho"], False))
+        self.assertEqual(result["changedParts"]["CharacterRole"]["changed"], {"Nc": {"description": ("NPC", "Npc")}})
+        self.assertIn("    + Orc", NamingConfig.format_diff(result))
+
+    def test_part_hash_cache(self):
+        part = self.base.get_part("Species")
+        partHash = NamingConfig.get_part_hash(part)
+        self.assertEqual(part._contentHash, partHash)
+        self.assertEqual(NamingConfig.get_part_hash(copy.deepcopy(part)), partHash)
+
+        # 내용을 바꾸는 메서드는 캐시를 비워 해시가 달라짐
+        mutations = [
+            lambda: part.add_predefined_value("Orc", "Orc", "오크"),
+            lambda: part.rename_predefined_value("Orc", "Goblin"),
+            lambda: part.set_description("Goblin", "Gob"),
+            lambda: part.set_korean_description("Goblin", "고블린"),
+            lambda: part.remove_predefined_value("CheonInho"),
+            lambda: part.set_direction(True),
+            lambda: part.set_name("Race"),
+            lambda: part.set_predefined_values(["Human"]),
+        ]
+        hashes = {partHash}
+        for mutate in mutations:
+            mutate()
+            self.assertIsNone(part._contentHash)
+            hashes.add(NamingConfig.get_part_hash(part))
+        self.assertEqual(len(hashes), len(mutations) + 1)
+
+        # 값 제거 후 원래 내용으로 돌아가면 같은 해시
+        other = copy.deepcopy(self.base)
+        other.add_part_value("Gender", "X", "Unknown", "모름")
+        self.assertFalse(NamingConfig.is_diff_empty(self.base.diff(other)))
+        other.remove_part_value("Gender", "X")
+        self.assertTrue(NamingConfig.is_diff_empty(self.base.diff(other)))
+
+    def test_merge(self):
+        ours = copy.deepcopy(self.base)
+        theirs = copy.deepcopy(self.base)
+
+        ours.add_part_value("Species", "Orc", "Orc", "오크")
+        ours.set_part_values("Gender", ["F", "M", "N"], ["Female", "Male", "NonBinary"], ["녀", "남", "없음"])
+        theirs.add_part_value("Species", "Elf", "Elf", "엘프")
+        theirs.remove_part_value("Species", "KimDokja")
+        theirs.add_part_value("EndFoot", "BFoot", "Both Feet")
+        theirs.set_padding_num(3)
+
+        merged, conflicts = NamingConfig.merge(self.base, ours, theirs)
+        self.assertEqual(conflicts, [])
+        self.assertEqual(merged.padding_num, 3)
+        species = merged.get_part("Species").get_predefined_values()
+        self.assertNotIn("KimDokja", species)
+        self.assertEqual(species[-2:], ["Elf", "Orc"])
+        self.assertEqual(merged.get_part("Gender").get_predefined_values(), ["F", "M", "N"])
+        self.assertEqual(merged.get_part("EndFoot").get_predefined_values(), ["LFoot", "RFoot", "BFoot"])
+        self.assertEqual(merged.get_part_names(), self.base.get_part_names())
+
+        # 병합 결과와 원본의 차이는 양쪽 변경의 합
+        result = self.base.diff(merged)
+        self.assertEqual(result["changedParts"]["Species"]["added"], ["Elf", "Orc"])
+
+    def test_merge_conflicts(self):
+        ours = copy.deepcopy(self.base)
+        theirs = copy.deepcopy(self.base)
+
+        ours.get_part("Gender").set_description("M", "Man")
+        theirs.get_part("Gender").set_description("M", "Masculine")
+        theirs.get_part("Gender").set_description("F", "Feminine")
+        ours.remove_part("EndFoot")
+        theirs.add_part_value("EndFoot", "BFoot")
+
+        merged, conflicts = NamingConfig.merge(self.base, ours, theirs)
+        self.assertEqual([(c["part"], c["field"]) for c in conflicts], [("Gender", "value"), ("EndFoot", "part")])
+        self.assertEqual(conflicts[0]["value"], "M")
+        self.assertEqual(merged.get_part("Gender").get_descriptions()[:2], ["Man", "Feminine"])
+        self.assertIsNotNone(merged.get_part("EndFoot"))
+
+    def test_merge_all_parts_removed(self):
+        ours = copy.deepcopy(self.base)
+        theirs = copy.deepcopy(self.base)
+        for config in (ours, theirs):
+            config.name_parts = []
+            config._update_part_order()
+
+        # 양쪽 모두 모든 파트를 지웠으면 기본 파트가 아닌 빈 설정
+        merged, conflicts = NamingConfig.merge(self.base, ours, theirs)
+        self.assertEqual(conflicts, [])
+        self.assertEqual(merged.name_parts, [])
+        self.assertEqual(merged.get_part_names(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
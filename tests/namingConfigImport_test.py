@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+NamingConfig CSV 가져오기를 위한 테스트 모듈
+여러 CSV/여러 파트 가져오기, 중복 제거, 충돌 보고와 원자적 적용을 확인
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.namingConfig import NamingConfig
+
+
+class NamingConfigImportTest(unittest.TestCase):
+    """NamingConfig.import_part_values_from_csv 테스트를 위한 테스트 케이스 클래스"""
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화"""
+        config_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "ConfigFiles"))
+        self.config = NamingConfig()
+        self.config.load(os.path.join(config_dir, "CharAnimNamingConfig.json"))
+        self.tempDir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """각 테스트 케이스 실행 후 임시 폴더 삭제"""
+        shutil.rmtree(self.tempDir, ignore_errors=True)
+
+    def write_csv(self, inFileName, inText):
+        filePath = os.path.join(self.tempDir, inFileName)
+        with open(filePath, "w", encoding="utf-8-sig", newline="") as f:
+            f.write(inText)
+        return filePath
+
+    def test_import_many(self):
+        speciesA = self.write_csv("speciesA.csv", "Hu,Human,인간\nEl,Elf,엘프\n\nHu,Human,인간\n")
+        speciesB = self.write_csv("speciesB.csv", "Dw,Dwarf\nEl,Elf,엘프\n")
+        genders = self.write_csv("gender.csv", "M\nF,Female,여성\n")
+
+        report = self.config.import_part_values_from_csv({"Species": [speciesA, speciesB], "Gender": genders})
+        self.assertTrue(report["success"])
+        self.assertEqual(self.config.get_part("Species").get_predefined_values(), ["Hu", "El", "Dw"])
+        self.assertEqual(self.config.get_part_korean_descriptions("Species"), ["인간", "엘프", "Dw"])
+        self.assertEqual(report["parts"]["Species"], {"rows": 5, "values": 3, "added": 3, "duplicates": 2})
+        self.assertEqual(self.config.get_part_descriptions("Gender"), ["M", "Female"])
+
+    def test_conflicts_are_atomic(self):
+        genderValues = self.config.get_part("Gender").get_predefined_values()
+        speciesValues = self.config.get_part("Species").get_predefined_values()
+        genders = self.write_csv("gender.csv", "Xx,Other\n")
+        species = self.write_csv("species.csv", "Hu,Human\nOrc,Orc\nHu,Humanoid\nHu,Human\n")
+
+        report = self.config.import_part_values_from_csv({"Gender": genders, "Species": species})
+        self.assertFalse(report["success"])
+        self.assertEqual(len(report["conflicts"]), 1)
+        conflict = report["conflicts"][0]
+        self.assertEqual((conflict["part"], conflict["value"]), ("Species", "Hu"))
+        self.assertEqual([variant["description"] for variant in conflict["variants"]], ["Human", "Humanoid"])
+        self.assertTrue(conflict["variants"][1]["source"].endswith("species.csv:3"))
+
+        # 충돌이 있으면 다른 파트도 바뀌지 않음
+        self.assertEqual(self.config.get_part("Gender").get_predefined_values(), genderValues)
+        self.assertEqual(self.config.get_part("Species").get_predefined_values(), speciesValues)
+
+        report = self.config.import_part_values_from_csv({"Species": species}, keep_first=True)
+        self.assertTrue(report["success"])
+        self.assertEqual(self.config.get_part_descriptions("Species"), ["Human", "Orc"])
+
+    def test_merge_and_errors(self):
+        existingValues = self.config.get_part("Species").get_predefined_values()
+        species = self.write_csv("species.csv", f"{existingValues[0]}\nNewSpecies,New\n")
+        report = self.config.import_part_values_from_csv({"Species": species}, replace=False, keep_first=True)
+        self.assertTrue(report["success"])
+        self.assertEqual(self.config.get_part("Species").get_predefined_values(), existingValues + ["NewSpecies"])
+
+        report = self.config.import_part_values_from_csv({"RealName": species, "Species": os.path.join(self.tempDir, "missing.csv")})
+        self.assertFalse(report["success"])
+        self.assertEqual(len(report["errors"]), 2)
+
+        self.assertTrue(self.config.set_part_value_by_csv("Species", species))
+        self.assertEqual(self.config.get_part("Species").get_predefined_values(), [existingValues[0], "NewSpecies"])
+
+
+if __name__ == "__main__":
+    unittest.main()
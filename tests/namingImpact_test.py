@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+NamingImpactAnalyzer 클래스를 위한 테스트 모듈
+저장된 설정과 편집 중인 설정으로 이름 목록을 분석한 보고서를 확인
+"""
+
+import sys
+import os
+import unittest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.namingConfig import NamingConfig
+from JalLib.namingImpact import NamingImpactAnalyzer
+
+
+class NamingImpactAnalyzerTest(unittest.TestCase):
+    """NamingImpactAnalyzer 테스트를 위한 테스트 케이스 클래스"""
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화"""
+        config_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "max", "ConfigFiles", "3DSMaxNamingConfig.json"))
+        self.config = NamingConfig()
+        self.assertTrue(self.config.load(config_path))
+        self.names = ["b_Dum_L_Arm_00", "b_Dum_C_Arm_01", "", "b_L_00", "Bip001 R Forearm", "  b_Dum_L_Leg_02  "]
+
+        self.analyzer = NamingImpactAnalyzer(inChunkSize=2, inMaxListed=10)
+        self.analyzer.set_names(self.names)
+        self.analyzer.set_saved_config(self.config.compile())
+
+    def test_unchanged_config(self):
+        report = self.analyzer.analyze(self.config.compile())
+        self.assertEqual(report["total"], 5)
+        self.assertEqual(report["processed"], 5)
+        self.assertEqual(report["histograms"]["Side"], {"L": 3, "R": 1})
+        self.assertEqual(report["histograms"]["Type"], {"Dum": 3})
+        self.assertNotIn("RealName", report["histograms"])
+        self.assertEqual(report["unparseable"], ["b_L_00"])
+        self.assertEqual(report["changedCount"], 0)
+
+    def test_changed_parse(self):
+        self.config.get_part("Side").add_predefined_value("C", "Center", "가운데")
+        report = self.analyzer.analyze(self.config.compile())
+        self.assertEqual(report["changedCount"], 1)
+        self.assertEqual(report["changed"], [("b_Dum_C_Arm_01", {"Side": ("", "C"), "RealName": ("C_Arm", "Arm")})])
+        self.assertEqual(report["histograms"]["Side"]["C"], 1)
+
+    def test_incremental_reports(self):
+        reports = list(self.analyzer.iter_analyze(self.config.compile()))
+        self.assertEqual([report["processed"] for report in reports], [2, 4, 5])
+        self.assertEqual(reports[0]["histograms"]["Side"], {"L": 1})
+
+        # 취소하면 더 이상 보고서를 생성하지 않음
+        reports = list(self.analyzer.iter_analyze(self.config.compile(), lambda: True))
+        self.assertEqual(reports, [])
+
+    def test_max_listed(self):
+        analyzer = NamingImpactAnalyzer(inMaxListed=1)
+        analyzer.set_names(["b_L_00", "b_R_01", "b_Dum_L_Arm"])
+        report = analyzer.analyze(self.config.compile())
+        self.assertEqual(report["unparseableCount"], 2)
+        self.assertEqual(report["unparseable"], ["b_L_00"])
+
+
+if __name__ == "__main__":
+    unittest.main()
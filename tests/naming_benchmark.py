@@ -0,0 +1,500 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Naming 성능 측정 스크립트
+이름 분석 관련 API의 처리량을 기존 이름 단위 경로와 비교하여 출력
+
+사용법: python tests/naming_benchmark.py [이름 개수]
+"""
+
+import sys
+import os
+import copy
+import csv
+import difflib
+import json
+import fnmatch
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.naming import Naming
+from JalLib.indexAllocator import IndexAllocator
+from JalLib.namePart import NamePart, NamePartType
+from JalLib.nameParser import NameParser
+from JalLib.nameValidator import NameValidator
+from JalLib.nameIndex import NameIndex
+from JalLib.nameToPath import NameToPath
+from JalLib.assetScanner import AssetScanner
+from JalLib.namingConfig import NamingConfig, get_config_load_cache
+from JalLib.namingImpact import NamingImpactAnalyzer
+
+config_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "max", "ConfigFiles"))
+MaxNamingConfigFileName = os.path.join(config_dir, "3DSMaxNamingConfig.json")
+char_config_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "ConfigFiles"))
+
+REAL_NAMES = ["Arm", "Forearm", "Thigh", "Calf", "Skirt", "Sleeve", "Hand", "UpperArm", "Spine", "Neck"]
+
+
+def gen_names(inNaming, inCount, inSeed=0):
+    """
+    설정의 사전 정의 값으로 테스트용 이름 목록 생성
+    
+    Args:
+        inNaming: 이름을 생성할 Naming 객체
+        inCount: 생성할 이름 개수
+        inSeed: 난수 시드
+        
+    Returns:
+        이름 문자열 리스트
+    """
+    rng = random.Random(inSeed)
+    names = []
+    for i in range(inCount):
+        partsDict = {}
+        for part in inNaming._nameParts:
+            values = part.get_predefined_values()
+            if values and rng.random() < 0.6:
+                partsDict[part.get_name()] = rng.choice(values)
+        partsDict["RealName"] = rng.choice(REAL_NAMES)
+        partsDict["Index"] = str(i % 100)
+        names.append(inNaming.combine(partsDict, rng.choice(["_", " "])))
+    return names
+
+
+def measure(inLabel, inFunc, inCount, inUnit="names"):
+    """
+    함수 실행 시간을 측정하고 처리량 출력
+    
+    Args:
+        inLabel: 출력할 이름
+        inFunc: 측정할 함수 (인자 없음)
+        inCount: 처리한 개수
+        inUnit: 처리량 단위 (기본값: "names")
+        
+    Returns:
+        경과 시간 (초)
+    """
+    start = time.perf_counter()
+    inFunc()
+    elapsed = time.perf_counter() - start
+    print(f"{inLabel:<40} {elapsed:8.3f}s  {inCount / elapsed:12,.0f} {inUnit}/s")
+    return elapsed
+
+
+def bench_parse_many(inCount):
+    """
+    parse_many와 이름 단위 convert_to_dictionary 처리량 비교
+    """
+    naming = Naming(configPath=MaxNamingConfigFileName)
+    names = gen_names(naming, inCount)
+    naming.set_parse_cache_size(0)
+
+    print(f"[parse_many] {inCount:,} names")
+    perName = measure("convert_to_dictionary (per name)", lambda: [naming.convert_to_dictionary(name) for name in names], inCount)
+    bulk = measure("parse_many", lambda: naming.parse_many(names), inCount)
+    measure("iter_parse_many", lambda: [chunk for chunk in naming.iter_parse_many(iter(names))], inCount)
+    print(f"speedup: {perName / bulk:.2f}x")
+
+
+def bench_parse_many_workers(inCount):
+    """
+    parse_many 작업 프로세스 개수별 처리량 비교 (프로세스 시작 비용 포함)
+    """
+    naming = Naming(configPath=MaxNamingConfigFileName)
+    names = gen_names(naming, inCount)
+
+    print(f"[parse_many workers] {inCount:,} names, {os.cpu_count()} cores")
+    single = measure("inWorkers=1", lambda: naming.parse_many(names), inCount)
+    workers = 2
+    while workers <= max(2, os.cpu_count() or 1):
+        elapsed = measure(f"inWorkers={workers}", lambda: naming.parse_many(names, inWorkers=workers), inCount)
+        print(f"speedup: {single / elapsed:.2f}x")
+        workers *= 2
+
+
+def bench_name_part_edits(inValueCount):
+    """
+    NamePart 값 추가/제거와 방향 파트 미러 테이블 생성 시간 측정
+    """
+    values = [f"V{i:05d}" for i in range(inValueCount)]
+    part = NamePart("Side", NamePartType.PREFIX, [], [], True)
+
+    def add_values():
+        for value in values:
+            part.add_predefined_value(value, value, value)
+
+    def remove_values():
+        for value in values[::2]:
+            part.remove_predefined_value(value)
+        part.get_predefined_values()
+
+    print(f"[name part edits] {inValueCount:,} values")
+    measure("add_predefined_value", add_values, inValueCount, "values")
+    measure("remove_predefined_value (half)", remove_values, inValueCount // 2, "values")
+    measure("NameParser mirror tables", lambda: NameParser([part]), part.get_value_count(), "values")
+
+
+def bench_tokenizer(inCount):
+    """
+    정규식 토큰화(_split_to_array)와 문자 단위 토큰화 처리량 비교
+    """
+    naming = Naming(configPath=MaxNamingConfigFileName)
+    names = ["BipL001UpperArm02", "bDumRFSkirtNub", "Sphere01", "BipR002Forearm"] * (inCount // 4)
+    count = len(names)
+
+    print(f"[tokenizer] {count:,} camel-case names")
+    charWalk = measure("character walk (legacy)", lambda: [naming._split_by_upper_case_and_digit(name) for name in names], count)
+    compiled = measure("_split_to_array (compiled regex)", lambda: [naming._split_to_array(name) for name in names], count)
+    print(f"speedup: {charWalk / compiled:.2f}x")
+
+
+def bench_index_allocator(inSceneSize, inCreateCount=1000):
+    """
+    IndexAllocator와 장면 전체 패턴 검색(기존 gen_unique_name 방식) 비교
+    rt.matchPattern 대신 fnmatch로 장면 이름 목록을 검색
+    """
+    naming = Naming(configPath=MaxNamingConfigFileName)
+    sceneNames = gen_names(naming, inSceneSize)
+    baseName = "b_Dum_L_Helper_00"
+
+    def pattern_scan():
+        scene = list(sceneNames)
+        for _ in range(inCreateCount):
+            pattern = naming.replace_name_part("Index", baseName, "*")
+            matchedCount = sum(1 for name in scene if fnmatch.fnmatchcase(name, pattern))
+            scene.append(naming.replace_name_part("Index", baseName, str(matchedCount + 1)))
+
+    def allocate():
+        allocator = IndexAllocator(naming, sceneNames)
+        for _ in range(inCreateCount):
+            allocator.allocate_name(baseName, 1)
+
+    print(f"[index allocator] {inCreateCount:,} helpers in a {inSceneSize:,}-node scene")
+    scan = measure("pattern scan per name (legacy)", pattern_scan, inCreateCount)
+    allocated = measure("IndexAllocator (seed + allocate)", allocate, inCreateCount)
+    print(f"speedup: {scan / allocated:.2f}x")
+
+
+def bench_mirroring(inCount):
+    """
+    gen_mirroring_names와 파트별 가중치 검색(기존 gen_mirroring_name 방식) 비교
+    """
+    naming = Naming(configPath=MaxNamingConfigFileName)
+    names = gen_names(naming, inCount)
+    naming.set_parse_cache_size(0)
+
+    def weight_scan():
+        for name in names:
+            mirroredName = name
+            for part in naming._nameParts:
+                if part.is_direction():
+                    foundName = naming.get_name(part.get_name(), mirroredName)
+                    opositeName = part.get_most_different_weight_value(foundName)
+                    if opositeName and foundName != opositeName:
+                        mirroredName = naming.replace_name_part(part.get_name(), mirroredName, opositeName)
+
+    print(f"[mirroring] {inCount:,} names")
+    scan = measure("weight scan per part (legacy)", weight_scan, inCount)
+    bulk = measure("gen_mirroring_names", lambda: naming.gen_mirroring_names(names), inCount)
+    print(f"speedup: {scan / bulk:.2f}x")
+
+
+def bench_config_sharing(inInstanceCount=200):
+    """
+    공유 설정 스냅샷 적용과 인스턴스별 deepcopy 적용(기존 apply_to_naming 방식) 비교
+    """
+    config = NamingConfig()
+    config.load(MaxNamingConfigFileName)
+    namings = [Naming() for _ in range(inInstanceCount)]
+
+    def deep_copy_apply():
+        for naming in namings:
+            naming._nameParts = copy.deepcopy(config.name_parts)
+            naming._parser = NameParser(naming._nameParts)
+
+    def shared_apply():
+        for naming in namings:
+            config.apply_to_naming(naming)
+
+    print(f"[config sharing] {inInstanceCount:,} Naming instances")
+    deepCopied = measure("deepcopy per instance (legacy)", deep_copy_apply, inInstanceCount, "instances")
+    shared = measure("apply_to_naming (shared snapshot)", shared_apply, inInstanceCount, "instances")
+    print(f"speedup: {deepCopied / shared:.2f}x")
+
+
+def bench_config_load(inInstanceCount=200):
+    """
+    설정 로드 캐시 적중과 매번 JSON을 다시 읽는 경우(기존 방식)의 Naming 생성 시간 비교
+    """
+    cache = get_config_load_cache()
+
+    def cold_load():
+        for _ in range(inInstanceCount):
+            cache.invalidate()
+            Naming(configPath=MaxNamingConfigFileName)
+
+    def cached_load():
+        for _ in range(inInstanceCount):
+            Naming(configPath=MaxNamingConfigFileName)
+
+    print(f"[config load] {inInstanceCount:,} Naming instances")
+    cold = measure("JSON parse per instance (legacy)", cold_load, inInstanceCount, "instances")
+    cached = measure("config load cache", cached_load, inInstanceCount, "instances")
+    print(f"speedup: {cold / cached:.2f}x  {cache.get_stats()}")
+
+
+def bench_csv_import(inRowCount):
+    """
+    스트리밍 CSV 가져오기와 전체 목록을 만든 뒤 set_part_values로 설정하는 경우(기존 방식) 비교
+    """
+    tempDir = tempfile.mkdtemp()
+    try:
+        rng = random.Random(0)
+        csvPath = os.path.join(tempDir, "species.csv")
+        with open(csvPath, "w", encoding="utf-8", newline="") as f:
+            for _ in range(inRowCount):
+                # 행의 절반 정도는 중복 값
+                value = f"Species{rng.randrange(inRowCount // 2):06d}"
+                f.write(f"{value},{value},{value}\n")
+
+        config = NamingConfig()
+        config.load(os.path.join(char_config_dir, "CharAnimNamingConfig.json"))
+
+        def read_lists():
+            values, descriptions, koreanDescriptions = [], [], []
+            with open(csvPath, "r", encoding="utf-8", newline="") as f:
+                for row in csv.reader(f):
+                    values.append(row[0].strip())
+                    descriptions.append(row[1].strip())
+                    koreanDescriptions.append(row[2].strip())
+            config.set_part_values("Species", values, descriptions, koreanDescriptions)
+
+        def peak_memory(inFunc):
+            tracemalloc.start()
+            inFunc()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak / (1024 * 1024)
+
+        print(f"[csv import] {inRowCount:,} rows")
+        listed = measure("read lists + set_part_values (legacy)", read_lists, inRowCount, "rows")
+        legacyCount = config.get_part("Species").get_value_count()
+        streamed = measure("import_part_values_from_csv", lambda: config.import_part_values_from_csv({"Species": csvPath}), inRowCount, "rows")
+        print(f"speedup: {listed / streamed:.2f}x  (values: {legacyCount:,} -> {config.get_part('Species').get_value_count():,})")
+        print(f"peak memory: {peak_memory(read_lists):.1f}MB -> "
+              f"{peak_memory(lambda: config.import_part_values_from_csv({'Species': csvPath})):.1f}MB")
+    finally:
+        shutil.rmtree(tempDir, ignore_errors=True)
+
+
+def bench_config_diff(inValueCount):
+    """
+    NamingConfig.diff와 JSON 덤프 텍스트 비교(기존 리뷰 방식) 비교
+    """
+    base = NamingConfig()
+    base.load(os.path.join(char_config_dir, "CharAnimNamingConfig.json"))
+    values = [f"Species{i:06d}" for i in range(inValueCount)]
+    base.set_part_values("Species", values, values, values)
+
+    other = copy.deepcopy(base)
+    rng = random.Random(0)
+    shuffled = list(values)
+    rng.shuffle(shuffled)
+    changedValues = shuffled[:-10] + ["Orc", "Elf"]
+    other.set_part_values("Species", changedValues, changedValues, changedValues)
+
+    def text_diff():
+        baseLines = json.dumps([part.to_dict() for part in base.name_parts], indent=4).splitlines()
+        otherLines = json.dumps([part.to_dict() for part in other.name_parts], indent=4).splitlines()
+        return sum(1 for _ in difflib.unified_diff(baseLines, otherLines, lineterm=""))
+
+    print(f"[config diff] {inValueCount:,} reordered values")
+    text = measure("json dump + difflib (legacy)", text_diff, inValueCount, "values")
+    keyed = measure("NamingConfig.diff", lambda: base.diff(other), inValueCount, "values")
+    print(f"speedup: {text / keyed:.2f}x  (text diff lines: {text_diff():,}, keyed changes: "
+          f"{sum(len(part['added']) + len(part['removed']) + len(part['changed']) for part in base.diff(other)['changedParts'].values()):,})")
+
+
+def bench_sort_by_index(inCount):
+    """
+    sort_by_index_key와 이름 정렬 후 nameArray.index로 객체를 찾는 방식(기존 Select.sort_by_index) 비교
+    """
+    naming = Naming(configPath=MaxNamingConfigFileName)
+    items = [(name, i) for i, name in enumerate(gen_names(naming, inCount))]
+    naming.set_parse_cache_size(0)
+
+    def index_lookup():
+        nameArray = [item[0] for item in items]
+        sortedNameArray = naming.sort_by_index(nameArray)
+        return [items[nameArray.index(sortedName)] for sortedName in sortedNameArray]
+
+    print(f"[sort by index] {inCount:,} objects")
+    lookup = measure("sort names + list.index (legacy)", index_lookup, inCount)
+    keyed = measure("sort_by_index_key", lambda: naming.sort_by_index_key(items, lambda item: item[0]), inCount)
+    print(f"speedup: {lookup / keyed:.2f}x")
+
+
+def bench_validator(inCount):
+    """
+    NameValidator 스트리밍 검사 처리량 측정 (입력은 제너레이터로 전달)
+    """
+    naming = Naming(configPath=MaxNamingConfigFileName)
+    names = gen_names(naming, inCount)
+    validator = NameValidator(naming)
+
+    print(f"[validator] {inCount:,} names")
+    measure("NameValidator.validate (streaming)", lambda: validator.validate(name for name in names), inCount)
+    report = validator.get_report()
+    print({issue: result["count"] for issue, result in report["issues"].items()})
+
+
+def bench_name_index(inSceneSize, inQueryCount=100):
+    """
+    NameIndex 검색과 이름마다 파트 값을 다시 분석하는 검색(기존 방식) 비교
+    "왼쪽 더미 노드 중 인덱스가 3보다 큰 것"을 inQueryCount번 검색
+    """
+    naming = Naming(configPath=MaxNamingConfigFileName)
+    sceneNames = gen_names(naming, inSceneSize)
+    naming.set_parse_cache_size(0)
+
+    def scan():
+        for _ in range(inQueryCount):
+            [name for name in sceneNames
+             if naming.get_name("Side", name) == "L" and naming.get_name("Type", name) == "Dum"
+             and naming.get_index_as_digit(name) is not False and naming.get_index_as_digit(name) > 3]
+
+    def indexed():
+        nameIndex = NameIndex(naming, sceneNames)
+        for _ in range(inQueryCount):
+            nameIndex.query({"Side": "L", "Type": "Dum"}, inMinIndex=4)
+
+    print(f"[name index] {inQueryCount:,} queries on a {inSceneSize:,}-node scene")
+    scanned = measure("parse per name per query (legacy)", scan, inQueryCount, "queries")
+    queried = measure("NameIndex (build + query)", indexed, inQueryCount, "queries")
+    print(f"speedup: {scanned / queried:.2f}x")
+
+
+def bench_gen_paths(inCount):
+    """
+    gen_paths와 이름마다 파트/설명을 선형 검색하는 방식(기존 gen_path) 비교
+    """
+    sourceNaming = Naming(configPath=os.path.join(char_config_dir, "CharAnimNamingConfig.json"))
+    nameToPath = NameToPath(os.path.join(char_config_dir, "CharAnimPathConfig.json"), os.path.dirname(__file__), sourceNaming)
+    names = gen_names(sourceNaming, inCount)
+    sourceNaming.set_parse_cache_size(0)
+
+    def linear_lookup():
+        for name in names:
+            pathDict = {}
+            for key, value in sourceNaming.convert_to_dictionary(name).items():
+                namePart = sourceNaming._find_name_part(key)
+                if nameToPath._find_name_part(namePart.get_name()):
+                    pathDict[key] = value if namePart.is_realname() else namePart.get_description_by_value(value)
+            os.path.normpath(os.path.join(os.path.normpath(os.path.abspath(nameToPath.rootPath)), nameToPath.combine(pathDict)))
+
+    print(f"[gen_paths] {inCount:,} names")
+    linear = measure("per-name lookup (legacy gen_path)", linear_lookup, inCount)
+    bulk = measure("gen_paths", lambda: nameToPath.gen_paths(names), inCount)
+    print(f"speedup: {linear / bulk:.2f}x")
+
+
+def bench_asset_scanner(inDirCount=200, inFilesPerDir=100):
+    """
+    AssetScanner 병렬 검색과 os.walk + 이름 단위 분석(단일 스레드) 비교
+    임시 폴더에 inDirCount개의 폴더와 폴더당 inFilesPerDir개의 파일로 된 트리를 만들어 측정
+    """
+    naming = Naming(configPath=MaxNamingConfigFileName)
+    fileNames = [name + ".max" for name in gen_names(naming, inFilesPerDir)]
+    rootPath = tempfile.mkdtemp()
+    try:
+        for i in range(inDirCount):
+            dirPath = os.path.join(rootPath, f"Group{i % 10:02d}", f"Asset{i:04d}")
+            os.makedirs(dirPath)
+            for fileName in fileNames:
+                open(os.path.join(dirPath, fileName), "w").close()
+        fileCount = inDirCount * inFilesPerDir
+
+        def walk():
+            for dirPath, _, dirFileNames in os.walk(rootPath):
+                for fileName in dirFileNames:
+                    filePath = os.path.join(dirPath, fileName)
+                    naming.convert_to_dictionary(os.path.splitext(fileName)[0])
+                    os.stat(filePath)
+
+        print(f"[asset scanner] {fileCount:,} files in {inDirCount:,} folders")
+        naming.set_parse_cache_size(0)
+        walked = measure("os.walk + per-name parse (legacy)", walk, fileCount, "files")
+        for workers in (1, 4, 8):
+            scanned = measure(f"AssetScanner ({workers} workers)", lambda: sum(1 for _ in AssetScanner(naming, workers).scan(rootPath)), fileCount, "files")
+            print(f"speedup: {walked / scanned:.2f}x")
+    finally:
+        shutil.rmtree(rootPath)
+
+
+def bench_naming_impact(inCount):
+    """
+    NamingImpactAnalyzer와 이름마다 두 설정으로 convert_to_dictionary를 호출하는 방식 비교
+    """
+    saved = NamingConfig()
+    saved.load(MaxNamingConfigFileName)
+    edited = copy.deepcopy(saved)
+    edited.get_part("Side").add_predefined_value("C", "Center", "가운데")
+    names = gen_names(Naming(configPath=MaxNamingConfigFileName), inCount)
+
+    savedNaming = Naming()
+    editedNaming = Naming()
+    saved.compile().apply_to_naming(savedNaming)
+    edited.compile().apply_to_naming(editedNaming)
+    savedNaming.set_parse_cache_size(0)
+    editedNaming.set_parse_cache_size(0)
+
+    def per_name():
+        return sum(1 for name in names if savedNaming.convert_to_dictionary(name) != editedNaming.convert_to_dictionary(name))
+
+    analyzer = NamingImpactAnalyzer()
+    analyzer.set_names(names)
+    analyzer.set_saved_config(saved.compile())
+
+    chunkTimes = []
+
+    def timed_chunks():
+        start = time.perf_counter()
+        for _ in analyzer.iter_analyze(edited.compile()):
+            chunkTimes.append(time.perf_counter() - start)
+            start = time.perf_counter()
+
+    print(f"[naming impact] {inCount:,} names")
+    legacy = measure("convert_to_dictionary x2 (legacy)", per_name, inCount)
+    first = measure("NamingImpactAnalyzer (first run)", timed_chunks, inCount)
+    chunkTimes.clear()
+    again = measure("NamingImpactAnalyzer (after edit)", timed_chunks, inCount)
+    print(f"speedup: {legacy / first:.2f}x first, {legacy / again:.2f}x after edit  "
+          f"(longest chunk: {max(chunkTimes) * 1000:.1f}ms)")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    bench_parse_many(count)
+    bench_parse_many_workers(count * 5)
+    bench_tokenizer(count)
+    bench_name_part_edits(min(count, 20000))
+    bench_index_allocator(min(count, 20000))
+    bench_mirroring(count)
+    bench_config_sharing()
+    bench_config_load()
+    bench_csv_import(count)
+    bench_config_diff(min(count, 20000))
+    bench_sort_by_index(min(count, 10000))
+    bench_validator(count)
+    bench_name_index(min(count, 20000))
+    bench_gen_paths(count)
+    bench_asset_scanner()
+    bench_naming_impact(min(count, 50000))
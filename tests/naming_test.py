@@ -17,6 +17,8 @@ print(f"JalLib root_dir: {root_dir}")
 if root_dir not in sys.path:
     sys.path.append(root_dir)
 
+from pymxs import runtime as rt
+
 import JalLib
 import JalLib.max.header
 import JalLib.max.name
@@ -66,6 +68,18 @@ class NamingTest(unittest.TestCase):
         self.assertEqual(namePart.get_value_by_description("Dummy"), "Dum")
         self.assertEqual(namePart.get_description_by_value("Dum"), "Dummy")
         self.assertEqual(namePart.get_value_by_max_weight(), "T")
+
+    def test_find_objects_after_rename(self):
+        point = rt.Point(name="b_Dum_L_FindTest_01")
+        try:
+            self.assertEqual(self.name.find_objects({"Side": "L", "RealName": "FindTest"}), [point])
+            
+            # 이름을 바꾼 뒤 검색하면 현재 장면 이름으로 찾음
+            point.name = "b_Dum_R_FindTest_01"
+            self.assertEqual(self.name.find_objects({"Side": "L", "RealName": "FindTest"}), [])
+            self.assertEqual(self.name.find_objects({"Side": "R", "RealName": "FindTest"}), [point])
+        finally:
+            rt.delete(point)
         
 
 
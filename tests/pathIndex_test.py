@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+PathIndex 클래스를 위한 테스트 모듈
+파일 이름 검색, 디스크 캐시 재사용, 바뀐 폴더만 다시 읽는 증분 갱신을 확인
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.naming import Naming
+from JalLib.nameToPath import NameToPath
+from JalLib.pathIndex import PathIndex
+
+
+class PathIndexTest(unittest.TestCase):
+    """PathIndex 테스트를 위한 테스트 케이스 클래스"""
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화 (gen_paths로 만든 폴더에 파일 생성)"""
+        config_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "ConfigFiles"))
+        self.tempDir = tempfile.mkdtemp()
+        self.rootPath = os.path.join(self.tempDir, "root")
+        self.cachePath = os.path.join(self.tempDir, "cache", "pathIndex.json")
+        os.makedirs(self.rootPath)
+
+        self.sourceNaming = Naming(configPath=os.path.join(config_dir, "CharModelerNamingConfig.json"))
+        self.nameToPath = NameToPath(os.path.join(config_dir, "CharModelerPathConfig.json"), self.rootPath, self.sourceNaming)
+        self.names = ["T_Mn_KimDokja_M_LongCoat_B_Upper_01_SC", "T_Mn_KimDokja_M_LongCoat_B_Upper_02_SC", "T_Mn_KimDokja_F_LongCoat_B_Upper_01_SC"]
+        self.filePaths = []
+        for name, path in zip(self.names, self.nameToPath.gen_paths(self.names, ensure_dirs=True)):
+            filePath = os.path.join(path, name + ".fbx")
+            open(filePath, "w").close()
+            self.filePaths.append(filePath)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempDir)
+
+    def test_query(self):
+        pathIndex = self.nameToPath.get_path_index(self.cachePath)
+        self.assertEqual(pathIndex.get_files(), sorted(self.filePaths))
+        self.assertEqual(pathIndex.query({"Gender": "M"}), sorted(self.filePaths[:2]))
+        self.assertEqual(pathIndex.query({"Gender": "M"}, inMinIndex=2), [self.filePaths[1]])
+        self.assertEqual(pathIndex.get_parts(self.filePaths[2])["Gender"], "F")
+
+    def test_incremental_refresh(self):
+        self.nameToPath.get_path_index(self.cachePath)
+        self.assertTrue(os.path.isfile(self.cachePath))
+
+        # 디스크 캐시에서 불러오면 바뀌지 않은 폴더는 다시 읽지 않음
+        pathIndex = PathIndex(self.rootPath, self.sourceNaming, self.cachePath)
+        stats = pathIndex.refresh()
+        self.assertEqual(stats["scannedDirs"], 0)
+        self.assertEqual(stats["files"], 3)
+
+        os.remove(self.filePaths[0])
+        os.utime(os.path.dirname(self.filePaths[0]), ns=(0, 10 ** 18))
+        stats = pathIndex.refresh()
+        self.assertEqual(stats["scannedDirs"], 1)
+        self.assertEqual(pathIndex.query({"Gender": "M"}), [self.filePaths[1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
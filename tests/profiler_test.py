@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Profiler 클래스를 위한 테스트 모듈
+메서드 계측과 복원, 임포트 시간 기록, 보고서 출력을 확인
+"""
+
+import sys
+import os
+import json
+import unittest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", ".."))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from JalLib.naming import Naming
+from JalLib.profiler import CallStats, Profiler
+
+
+class ProfilerTest(unittest.TestCase):
+    """Profiler 테스트를 위한 테스트 케이스 클래스"""
+
+    def setUp(self):
+        """각 테스트 케이스 실행 전 초기화"""
+        config_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "JalLib", "max", "ConfigFiles"))
+        self.naming = Naming(configPath=os.path.join(config_dir, "3DSMaxNamingConfig.json"))
+        self.profiler = Profiler({"JalLib.naming": ("Naming",), "JalLib.configPaths": ()})
+
+    def tearDown(self):
+        """각 테스트 케이스 실행 후 정리"""
+        self.profiler.disable()
+
+    def test_call_stats(self):
+        originalParse = Naming.__dict__["parse_name"]
+        self.profiler.enable()
+        self.assertIsNot(Naming.__dict__["parse_name"], originalParse)
+
+        for _ in range(10):
+            self.naming.parse_name("b_Dum_L_Arm_02")
+        self.naming.convert_to_dictionary("b_Dum_L_Arm_02")
+
+        calls = {item["name"]: item for item in self.profiler.get_report()["calls"]}
+        self.assertEqual(calls["Naming.parse_name"]["count"], 10)
+        self.assertIn("Naming.convert_to_dictionary", calls)
+        self.assertLessEqual(calls["Naming.parse_name"]["p50"], calls["Naming.parse_name"]["p95"])
+
+        # 꺼지면 원래 메서드로 복원되고 기록은 유지됨
+        self.profiler.disable()
+        self.assertIs(Naming.__dict__["parse_name"], originalParse)
+        self.naming.parse_name("b_Dum_L_Arm_02")
+        calls = {item["name"]: item for item in self.profiler.get_report()["calls"]}
+        self.assertEqual(calls["Naming.parse_name"]["count"], 10)
+
+    def test_import_time(self):
+        sys.modules.pop("JalLib.configPaths", None)
+        self.profiler.enable()
+        import JalLib.configPaths  # noqa: F401
+        modules = [item["module"] for item in self.profiler.get_report()["imports"]]
+        self.assertIn("JalLib.configPaths", modules)
+
+    def test_export(self):
+        self.profiler.enable()
+        self.naming.parse_name("b_Dum_L_Arm_02")
+        report = json.loads(self.profiler.to_json())
+        self.assertEqual(report["calls"][0]["name"], "Naming.parse_name")
+        self.assertIn("Naming.parse_name", self.profiler.format_table())
+
+        self.profiler.reset()
+        self.assertEqual(self.profiler.get_report()["calls"], [])
+
+    def test_percentile(self):
+        stats = CallStats(inSampleLimit=100)
+        for i in range(1, 101):
+            stats.add(float(i))
+        self.assertEqual(stats.get_percentile(50), 50.0)
+        self.assertEqual(stats.get_percentile(95), 95.0)
+        self.assertEqual(stats.count, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()